@@ -5,6 +5,8 @@ import os
 import time
 import google.generativeai as genai
 
+from gemini_client import GeminiClient
+
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 
 def check_api_key():
@@ -57,20 +59,18 @@ def check_api_key():
     
     # 5. 실제 요청 테스트
     print("\n[5/5] 실제 요청 테스트")
-    model = genai.GenerativeModel("gemini-2.5-flash")
+    client = GeminiClient(GEMINI_API_KEY, model_name="gemini-2.5-flash", max_retries=2)
     
     try:
         start = time.time()
-        resp = model.generate_content("Say 'OK' in one word")
+        resp = client.generate_sync("Say 'OK' in one word")
         elapsed = time.time() - start
         
         print(f"✅ 요청 성공 ({elapsed:.2f}초)")
         print(f"   응답: {resp.text[:50]}")
         
-        # 토큰 사용량
-        if hasattr(resp, 'usage_metadata'):
-            meta = resp.usage_metadata
-            print(f"   토큰: input={meta.prompt_token_count}, output={meta.candidates_token_count}")
+        # 토큰 사용량 (재시도 포함)
+        print(f"   {client.usage_summary()}")
         
     except Exception as e:
         error_msg = str(e)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+가격 비교 리포트 벤치마크
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+create_excel_report 엔진별 소요 시간 / 최대 메모리(RSS) 비교
+  - openpyxl: 기존 경로 (ExcelWriter → load_workbook → 셀별 서식)
+  - xlsxwriter: 스트리밍 경로 (서식 포함 1회 기록)
+
+엔진마다 별도 프로세스에서 실행 → 최대 RSS가 서로 섞이지 않음
+DB 없이 합성 데이터 사용
+
+사용법:
+    python analysis/benchmark_price_comparison.py --rows 20000 --dates 3
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+ENGINES = ['openpyxl', 'xlsxwriter']
+
+
+def make_sample_df(rows, seed=0):
+    """get_integrated_df + extract_price_comparison_data 결과 형태의 합성 데이터"""
+    rng = np.random.default_rng(seed)
+    ids = np.arange(rows)
+
+    status = np.where(rng.random(rows) < 0.8, '로켓매칭', '미매칭')
+    matched = status == '로켓매칭'
+    revenue = rng.integers(0, 5_000_000, rows)
+    quantity = rng.integers(0, 500, rows)
+    price_diff = rng.integers(-20_000, 20_000, rows)
+
+    return pd.DataFrame({
+        'matching_status': status,
+        'matching_confidence': np.where(matched, rng.choice(['High', 'Medium', 'Low'], rows), ''),
+        'rocket_category': rng.choice(['비타민', '미네랄', '유산균', '오메가3'], rows),
+        'iherb_category': rng.choice(['비타민', '미네랄', '유산균', '오메가3'], rows),
+        'rocket_url': [f"https://www.coupang.com/vp/products/{i}" for i in ids],
+        'iherb_url': [f"https://kr.iherb.com/pr/{i}" for i in ids],
+        'iherb_part_number': [f"NOW-{i:05d}" for i in ids],
+        'iherb_upc': (733739000000 + ids).astype(str),
+        'rocket_rank': np.where(matched, rng.integers(1, 1000, rows), np.nan),
+        'iherb_sales_quantity': quantity,
+        'iherb_revenue': revenue,
+        'iherb_item_winner_ratio': rng.integers(0, 100, rows),
+        'price_diff': price_diff,
+        'breakeven_discount_rate': rng.normal(0, 5, rows).round(1),
+        'recommended_discount_rate': rng.normal(0, 5, rows).round(1),
+        'requested_discount_rate': rng.normal(0, 5, rows).round(1),
+        'cheaper_source': np.where(price_diff > 0, '아이허브', np.where(price_diff < 0, '로켓직구', '동일')),
+        'rocket_product_name': [f"나우푸드 비타민 D3 {i} 5000IU 240 소프트젤" for i in ids],
+        'iherb_product_name': [f"NOW Foods Vitamin D-3 {i} 5000 IU 240 Softgels" for i in ids],
+        'rocket_product_id': ids + 1_000_000,
+        'rocket_vendor_id': ids + 2_000_000,
+        'rocket_item_id': ids + 3_000_000,
+        'iherb_vendor_id': ids + 4_000_000,
+        'iherb_item_id': ids + 5_000_000,
+        'rocket_original_price': rng.integers(10_000, 80_000, rows),
+        'rocket_discount_rate': rng.integers(0, 50, rows),
+        'rocket_price': rng.integers(10_000, 80_000, rows),
+        'iherb_price': rng.integers(10_000, 80_000, rows),
+        'iherb_original_price': rng.integers(10_000, 80_000, rows),
+        'iherb_recommended_price': rng.integers(10_000, 80_000, rows),
+        'iherb_stock': rng.integers(0, 1000, rows),
+        'iherb_stock_status': rng.choice(['판매중', '품절'], rows),
+        'rocket_rating': rng.uniform(3, 5, rows).round(1),
+        'rocket_reviews': rng.integers(0, 20_000, rows),
+        '매출비중': (revenue / revenue.sum() * 100).round(0),
+        '판매량비중': (quantity / quantity.sum() * 100).round(0),
+    })
+
+
+def peak_rss_mb():
+    """현재 프로세스 최대 RSS (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB / macOS: bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_engine(engine, rows, dates, output_path):
+    """단일 엔진 실행 (자식 프로세스) → 결과 dict"""
+    from analysis.price_comparison import create_excel_report
+
+    date_data_dict = {
+        f"2025-01-{day + 1:02d}": make_sample_df(rows, seed=day)
+        for day in range(dates)
+    }
+    rss_before = peak_rss_mb()
+
+    start = time.perf_counter()
+    create_excel_report(date_data_dict, output_path, engine=engine)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'engine': engine,
+        'seconds': round(elapsed, 2),
+        'rss_before_mb': round(rss_before, 1),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'file_mb': round(os.path.getsize(output_path) / (1024 * 1024), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가격 비교 리포트 엔진 벤치마크")
+    parser.add_argument('--rows', type=int, default=20000, help="시트당 행 수")
+    parser.add_argument('--dates', type=int, default=3, help="날짜 시트 수")
+    parser.add_argument('--engines', nargs='+', default=ENGINES, choices=ENGINES)
+    parser.add_argument('--worker', choices=ENGINES, help=argparse.SUPPRESS)
+    parser.add_argument('--output', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # 자식 프로세스: 엔진 1개 실행 후 마지막 줄에 JSON 출력
+    if args.worker:
+        result = run_engine(args.worker, args.rows, args.dates, args.output)
+        print(json.dumps(result))
+        return
+
+    print(f"\n{'='*80}")
+    print(f"⏱️  가격 비교 리포트 벤치마크 ({args.dates}개 시트 × {args.rows:,}행)")
+    print(f"{'='*80}")
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for engine in args.engines:
+            output_path = Path(tmp_dir) / f"report_{engine}.xlsx"
+            proc = subprocess.run(
+                [sys.executable, __file__, '--worker', engine,
+                 '--rows', str(args.rows), '--dates', str(args.dates),
+                 '--output', str(output_path)],
+                capture_output=True, text=True
+            )
+            if proc.returncode != 0:
+                print(f"❌ {engine} 실패\n{proc.stderr}")
+                continue
+            results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    if not results:
+        return
+
+    print(f"\n{'엔진':<12}{'시간(s)':>10}{'RSS 시작(MB)':>15}{'최대 RSS(MB)':>15}{'파일(MB)':>10}")
+    for r in results:
+        print(f"{r['engine']:<12}{r['seconds']:>10}{r['rss_before_mb']:>15}{r['peak_rss_mb']:>15}{r['file_mb']:>10}")
+
+    by_engine = {r['engine']: r for r in results}
+    if len(by_engine) == 2:
+        legacy, streaming = by_engine['openpyxl'], by_engine['xlsxwriter']
+        print(f"\n✅ 시간 {legacy['seconds'] / max(streaming['seconds'], 0.01):.1f}배 단축, "
+              f"최대 RSS {legacy['peak_rss_mb'] - streaming['peak_rss_mb']:,.0f}MB 감소")
+
+
+if __name__ == "__main__":
+    main()
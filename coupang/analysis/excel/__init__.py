@@ -27,8 +27,11 @@ from .rules import (
     make_delta_rule,
     make_winner_rule,
     make_cheaper_source_rule,
+    make_inverse_delta_rule,
     make_confidence_rule,
-    make_positive_red_rule
+    make_positive_red_rule,
+    numeric_formula,
+    text_formula
 )
 
 # Renderer
@@ -56,8 +59,11 @@ __all__ = [
     'make_delta_rule',
     'make_winner_rule',
     'make_cheaper_source_rule',
+    'make_inverse_delta_rule',
     'make_confidence_rule',
     'make_positive_red_rule',
+    'numeric_formula',
+    'text_formula',
     
     # Renderer
     'ExcelRenderer',
@@ -16,6 +16,14 @@ from typing import Dict, List, Tuple, Optional
 
 from .types import ColumnSpec, GroupSpec, SubGroup, ConditionalRule, ExcelConfig
 from .constants import FORMATS, COLORS, COLOR_SCHEMES
+from .rules import (
+    make_delta_rule,
+    make_winner_rule,
+    make_cheaper_source_rule,
+    make_inverse_delta_rule,
+    make_confidence_rule,
+    make_positive_red_rule,
+)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -312,85 +320,28 @@ class ExcelConfigBuilder:
     
     @staticmethod
     def _auto_rules(column_names: List[str]) -> List[ConditionalRule]:
-        """컬럼명으로 조건부 서식 자동 생성"""
+        """컬럼명으로 조건부 서식 자동 생성 (rules.py 팩토리 → 네이티브 수식 포함)"""
         
         rules = []
         
         for col_name in column_names:
             if col_name.endswith('Δ'):
-                rules.extend([
-                    ConditionalRule(
-                        column=col_name,
-                        condition=lambda v, c=col_name: v is not None and float(v) > 0,
-                        fill_color=COLORS['GREEN']
-                    ),
-                    ConditionalRule(
-                        column=col_name,
-                        condition=lambda v, c=col_name: v is not None and float(v) < 0,
-                        fill_color=COLORS['RED']
-                    ),
-                ])
+                rules.extend(make_delta_rule(col_name))
             
             elif '위너' in col_name:
-                rules.append(ConditionalRule(
-                    column=col_name,
-                    condition=lambda v, c=col_name: v is not None and float(v) >= 30,
-                    fill_color=COLORS['GREEN']
-                ))
+                rules.extend(make_winner_rule(col_name, threshold=30))
             
             elif '유리' in col_name:
-                rules.extend([
-                    ConditionalRule(
-                        column=col_name,
-                        condition=lambda v, c=col_name: v == '아이허브',
-                        fill_color=COLORS['GREEN']
-                    ),
-                    ConditionalRule(
-                        column=col_name,
-                        condition=lambda v, c=col_name: v == '로켓직구',
-                        fill_color=COLORS['RED']
-                    ),
-                ])
+                rules.extend(make_cheaper_source_rule(col_name))
             
             elif '격차' in col_name:
-                rules.extend([
-                    ConditionalRule(
-                        column=col_name,
-                        condition=lambda v, c=col_name: v is not None and float(v) < 0,
-                        fill_color=COLORS['GREEN']
-                    ),
-                    ConditionalRule(
-                        column=col_name,
-                        condition=lambda v, c=col_name: v is not None and float(v) > 0,
-                        fill_color=COLORS['RED']
-                    ),
-                ])
+                rules.extend(make_inverse_delta_rule(col_name))
             
             elif any(k in col_name for k in ['손익', '추천', '요청']) and '할인' in col_name:
-                rules.append(ConditionalRule(
-                    column=col_name,
-                    condition=lambda v, c=col_name: v is not None and float(v) > 0,
-                    fill_color=COLORS['RED']
-                ))
+                rules.extend(make_positive_red_rule(col_name))
             
             elif '신뢰' in col_name:
-                rules.extend([
-                    ConditionalRule(
-                        column=col_name,
-                        condition=lambda v, c=col_name: v == 'High',
-                        fill_color=COLORS['GREEN']
-                    ),
-                    ConditionalRule(
-                        column=col_name,
-                        condition=lambda v, c=col_name: v == 'Medium',
-                        fill_color=COLORS['YELLOW']
-                    ),
-                    ConditionalRule(
-                        column=col_name,
-                        condition=lambda v, c=col_name: v == 'Low',
-                        fill_color=COLORS['RED']
-                    ),
-                ])
+                rules.extend(make_confidence_rule(col_name))
         
         return rules
 
@@ -11,25 +11,118 @@ Excel 렌더링 엔진 (컬럼-값 매핑 책임)
   - 1단: 그룹명
   - 2단: 컬럼명 (서브그룹 제거)
   - 모든 row 번호 -1 조정
+
+🆕 스트리밍 렌더링 (xlsxwriter):
+  - 헤더/서식/링크/데이터바를 한 번의 순차 쓰기로 처리
+  - 셀 서식은 (컬럼, 강조색, 링크) 조합별 1개만 생성해 공유
+  - 저장 → 재로드 → insert_rows → 셀별 재서식 과정 없음
+  - xlsxwriter 없으면 기존 openpyxl 경로 사용
+
+🆕 조건부 서식:
+  - formula가 있는 규칙 → 컬럼 범위당 Excel 네이티브 규칙 1개 (행 수와 무관)
+  - formula 없는 규칙만 셀마다 condition 평가 후 고정 서식
 """
 
+import math
+import numbers
 import pandas as pd
 from pathlib import Path
 from openpyxl import load_workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from openpyxl.utils import get_column_letter
-from openpyxl.formatting.rule import DataBarRule
+from openpyxl.formatting.rule import DataBarRule, FormulaRule
+
+try:
+    import xlsxwriter
+except ImportError:  # 없으면 openpyxl 경로만 사용
+    xlsxwriter = None
 
 from .types import ExcelConfig
 from .constants import COLOR_SCHEMES
 
 
+# 데이터 시작 행 (0-based, 2단 헤더 아래)
+DATA_START_ROW = 2
+
+# xlsxwriter 워크시트당 하이퍼링크 한도
+MAX_URLS_PER_SHEET = 65530
+
+LINK_FONT_COLOR = "0563C1"
+DATA_BAR_COLOR = "63C384"
+
+
+def is_link_column(col_name) -> bool:
+    """링크 컬럼 여부 (링크/url 포함)"""
+    return bool(col_name) and ('링크' in str(col_name) or 'url' in str(col_name).lower())
+
+
+def split_rules(rules):
+    """(네이티브 수식 규칙, 셀별 평가 규칙) 분리 - 순서 유지"""
+    native = [r for r in rules if r.formula]
+    evaluated = [r for r in rules if not r.formula]
+    return native, evaluated
+
+
+def rule_formula(rule, col_idx: int) -> str:
+    """규칙 수식의 {cell}을 컬럼 첫 데이터 셀(상대 참조)로 치환 (col_idx: 1-based)"""
+    return '=' + rule.formula.format(cell=f"{get_column_letter(col_idx)}{DATA_START_ROW + 1}")
+
+
+def to_cell_value(value):
+    """DataFrame 값 → Excel 셀 값 (결측/무한대는 None)"""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        value = float(value)
+        return None if math.isnan(value) or math.isinf(value) else value
+    if isinstance(value, str):
+        return value
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    return str(value)
+
+
+class FormatCache:
+    """xlsxwriter 서식 공유 (같은 속성 조합은 Format 1개)"""
+    
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self._formats = {}
+    
+    def get(self, **props):
+        key = tuple(sorted(props.items()))
+        fmt = self._formats.get(key)
+        if fmt is None:
+            fmt = self.workbook.add_format(props)
+            self._formats[key] = fmt
+        return fmt
+    
+    def __len__(self):
+        return len(self._formats)
+
+
 class ExcelRenderer:
     """Excel 렌더러"""
     
-    def __init__(self, output_path: str, sheet_name: str = 'Sheet1'):
+    def __init__(self, output_path: str, sheet_name: str = 'Sheet1', engine: str = 'auto'):
+        """
+        Args:
+            output_path: 출력 파일 경로
+            sheet_name: 시트명
+            engine: 'xlsxwriter' (스트리밍) / 'openpyxl' (기존) / 'auto'
+        """
         self.output_path = Path(output_path)
         self.sheet_name = sheet_name
+        if engine == 'auto':
+            engine = 'xlsxwriter' if xlsxwriter is not None else 'openpyxl'
+        self.engine = engine
         self.wb = None
         self.ws = None
     
@@ -57,64 +150,10 @@ class ExcelRenderer:
             
             print(f"[RENDERER] 0/9 컬럼 정렬 완료 (config 순서 보장)")
             
-            print(f"[RENDERER] 1/9 데이터 쓰기... ({len(df):,}행)")
-            # 1. 데이터 쓰기
-            with pd.ExcelWriter(self.output_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name=self.sheet_name, index=False, header=False)
-            print(f"[RENDERER] 1/9 완료")
-            
-            print(f"[RENDERER] 2/9 파일 로드...")
-            # 2. 파일 로드 - 🔥 2행 삽입 (2단 헤더)
-            self.wb = load_workbook(self.output_path)
-            self.ws = self.wb[self.sheet_name]
-            self.ws.insert_rows(1, 2)  # 🔥 수정: 3 → 2
-            print(f"[RENDERER] 2/9 완료")
-            
-            print(f"[RENDERER] 3/9 헤더 렌더링...")
-            # 3. 헤더 - 🔥 2단 헤더
-            self._render_headers(config.groups)
-            print(f"[RENDERER] 3/9 완료")
-            
-            print(f"[RENDERER] 4/9 컬럼 너비...")
-            # 4. 컬럼 너비
-            self._set_column_widths(config.columns)
-            print(f"[RENDERER] 4/9 완료")
-            
-            print(f"[RENDERER] 5/9 데이터 영역 스타일...")
-            # 5. 데이터 영역
-            self._style_data_area(config.columns)
-            print(f"[RENDERER] 5/9 완료")
-            
-            print(f"[RENDERER] 6/9 조건부 서식... ({len(config.conditional_rules)}개 규칙)")
-            # 6. 조건부 서식
-            if config.conditional_rules:
-                self._apply_conditional_rules(config.conditional_rules)
-            print(f"[RENDERER] 6/9 완료")
-            
-            print(f"[RENDERER] 7/9 데이터바...")
-            # 7. 🆕 데이터바
-            self._apply_data_bars()
-            print(f"[RENDERER] 7/9 완료")
-            
-            print(f"[RENDERER] 8/9 링크 처리...")
-            # 8. 링크
-            self._apply_links()
-            print(f"[RENDERER] 8/9 완료")
-            
-            print(f"[RENDERER] 9/9 UI 설정...")
-            # 9. UI
-            if config.freeze_panes:
-                row, col = config.freeze_panes
-                self.ws.freeze_panes = self.ws.cell(row, col)  # 🔥 그대로 사용 (price_comparison_2에서 조정됨)
-            
-            if config.auto_filter:
-                self.ws.auto_filter.ref = (
-                    f"A2:{get_column_letter(self.ws.max_column)}{self.ws.max_row}"  # 🔥 A3 → A2
-                )
-            
-            # 저장
-            self.wb.save(self.output_path)
-            print(f"[RENDERER] 9/9 완료")
+            if self.engine == 'xlsxwriter':
+                self._render_streaming(df, config)
+            else:
+                self._render_openpyxl(df, config)
             
             return {
                 'success': True,
@@ -135,6 +174,258 @@ class ExcelRenderer:
                 'error': str(e)
             }
     
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 스트리밍 렌더링 (xlsxwriter, 1회 순차 쓰기)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    
+    def _render_streaming(self, df: pd.DataFrame, config: ExcelConfig):
+        """헤더 → 데이터(서식/조건부/링크) → 데이터바/UI 를 한 번에 기록"""
+        workbook = xlsxwriter.Workbook(str(self.output_path), {
+            'constant_memory': True,
+            'strings_to_numbers': False,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+        })
+        try:
+            ws = workbook.add_worksheet(self.sheet_name)
+            formats = FormatCache(workbook)
+            columns = config.columns
+            last_row = DATA_START_ROW + len(df) - 1
+            
+            print(f"[RENDERER] 1/4 헤더/컬럼 너비...")
+            self._write_headers_streaming(ws, formats, config.groups)
+            for col_idx, col_spec in enumerate(columns):
+                ws.set_column(col_idx, col_idx, col_spec.width)
+            
+            print(f"[RENDERER] 2/4 데이터 쓰기... ({len(df):,}행)")
+            self._write_rows_streaming(ws, formats, df, config)
+            
+            print(f"[RENDERER] 3/4 조건부 서식/데이터바...")
+            if len(df):
+                self._apply_native_rules_streaming(ws, formats, config, last_row)
+                
+                for col_idx, col_spec in enumerate(columns):
+                    if '비중' in col_spec.name:
+                        ws.conditional_format(DATA_START_ROW, col_idx, last_row, col_idx, {
+                            'type': 'data_bar',
+                            'min_type': 'num', 'min_value': 0,
+                            'max_type': 'num', 'max_value': 100,
+                            'bar_color': f"#{DATA_BAR_COLOR}",
+                            'data_bar_2010': False,
+                        })
+            
+            print(f"[RENDERER] 4/4 UI 설정...")
+            if config.freeze_panes:
+                row, col = config.freeze_panes
+                ws.freeze_panes(row - 1, col - 1)
+            
+            if config.auto_filter and columns:
+                ws.autofilter(1, 0, max(last_row, 1), len(columns) - 1)
+        finally:
+            workbook.close()
+        
+        print(f"[RENDERER] 완료 (공유 서식 {len(formats)}개)")
+    
+    def _write_headers_streaming(self, ws, formats: FormatCache, groups):
+        """2단 헤더 (1단: 그룹명 병합, 2단: 컬럼명)
+        
+        constant_memory 모드는 행 순서대로만 쓸 수 있으므로 1단 → 2단 순으로 기록
+        """
+        spans = []
+        col_pos = 0
+        for group in groups:
+            all_columns = []
+            for sg in group.sub_groups:
+                all_columns.extend(sg.columns)
+            if all_columns:
+                spans.append((group, col_pos, all_columns))
+                col_pos += len(all_columns)
+        
+        # 1단: 그룹 헤더 (병합 그룹은 왼쪽, 단일 컬럼은 오른쪽 medium 테두리 - 기존 출력과 동일)
+        for group, start, all_columns in spans:
+            colors = COLOR_SCHEMES[group.color_scheme]
+            top = dict(
+                bg_color=f"#{colors['top']}", pattern=1,
+                font_color="#FFFFFF", bold=True, font_size=11,
+                align='center', valign='vcenter', border=1,
+            )
+            if len(all_columns) > 1:
+                ws.merge_range(0, start, 0, start + len(all_columns) - 1, group.name,
+                               formats.get(**top, left=2))
+            else:
+                ws.write_string(0, start, group.name, formats.get(**top, right=2))
+        
+        # 2단: 컬럼명
+        for group, start, all_columns in spans:
+            colors = COLOR_SCHEMES[group.color_scheme]
+            bottom = formats.get(
+                bg_color=f"#{colors['bottom']}", pattern=1,
+                font_color="#000000", bold=True, font_size=10,
+                align='center', valign='vcenter', text_wrap=True, border=1,
+            )
+            for i, col_name in enumerate(all_columns):
+                ws.write_string(1, start + i, col_name, bottom)
+    
+    def _apply_native_rules_streaming(self, ws, formats: FormatCache, config: ExcelConfig, last_row: int):
+        """네이티브 조건부 서식 (컬럼 범위당 규칙 1개, 첫 매칭에서 중단)"""
+        col_index = {col.name: i for i, col in enumerate(config.columns)}
+        native, _ = split_rules(config.conditional_rules)
+        
+        for rule in native:
+            col_idx = col_index.get(rule.column)
+            if col_idx is None:
+                continue
+            
+            props = {}
+            if rule.fill_color:
+                props.update(bg_color=f"#{rule.fill_color}", pattern=1)
+            if rule.font_color:
+                props['font_color'] = f"#{rule.font_color}"
+            
+            ws.conditional_format(DATA_START_ROW, col_idx, last_row, col_idx, {
+                'type': 'formula',
+                'criteria': rule_formula(rule, col_idx + 1),
+                'format': formats.get(**props),
+                'stop_if_true': True,
+            })
+    
+    def _write_rows_streaming(self, ws, formats: FormatCache, df: pd.DataFrame, config: ExcelConfig):
+        """데이터 행 순차 기록 (컬럼 서식/조건부 강조/링크를 쓰는 시점에 결정)"""
+        columns = config.columns
+        
+        # 컬럼별 기본 서식 속성
+        base_props = [
+            dict(border=1, num_format=col.number_format, align=col.alignment, valign='vcenter')
+            for col in columns
+        ]
+        link_cols = [is_link_column(col.name) for col in columns]
+        
+        # 컬럼별 셀 평가 규칙 (네이티브 수식 규칙은 _apply_native_rules_streaming)
+        rules_by_col = [[] for _ in columns]
+        col_index = {col.name: i for i, col in enumerate(columns)}
+        _, evaluated = split_rules(config.conditional_rules)
+        for rule in evaluated:
+            if rule.column in col_index:
+                rules_by_col[col_index[rule.column]].append(rule)
+        
+        # (컬럼, 강조색, 글자색, 링크) → Format
+        cell_formats = {}
+        
+        def cell_format(col_idx, fill, font, link):
+            key = (col_idx, fill, font, link)
+            fmt = cell_formats.get(key)
+            if fmt is None:
+                props = dict(base_props[col_idx])
+                if fill:
+                    props.update(bg_color=f"#{fill}", pattern=1)
+                if font:
+                    props['font_color'] = f"#{font}"
+                if link:
+                    props.update(font_color=f"#{LINK_FONT_COLOR}", underline=1, align='center')
+                fmt = formats.get(**props)
+                cell_formats[key] = fmt
+            return fmt
+        
+        url_count = 0
+        for offset, values in enumerate(df.itertuples(index=False, name=None)):
+            row = DATA_START_ROW + offset
+            
+            for col_idx, raw in enumerate(values):
+                value = to_cell_value(raw)
+                
+                # 조건부 강조 (첫 매칭 규칙)
+                fill = font = None
+                for rule in rules_by_col[col_idx]:
+                    try:
+                        if rule.condition(value):
+                            fill, font = rule.fill_color, rule.font_color
+                            break
+                    except Exception:
+                        pass
+                
+                if link_cols[col_idx] and value and str(value).startswith('http'):
+                    fmt = cell_format(col_idx, fill, font, True)
+                    if url_count < MAX_URLS_PER_SHEET and ws.write_url(row, col_idx, str(value), fmt, 'Link') == 0:
+                        url_count += 1
+                    else:
+                        ws.write_string(row, col_idx, str(value), fmt)
+                    continue
+                
+                fmt = cell_format(col_idx, fill, font, False)
+                if value is None:
+                    ws.write_blank(row, col_idx, None, fmt)
+                elif isinstance(value, bool):
+                    ws.write_boolean(row, col_idx, value, fmt)
+                elif isinstance(value, (int, float)):
+                    ws.write_number(row, col_idx, value, fmt)
+                else:
+                    ws.write_string(row, col_idx, value, fmt)
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 기존 렌더링 (openpyxl: 쓰기 → 재로드 → 셀별 서식)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    
+    def _render_openpyxl(self, df: pd.DataFrame, config: ExcelConfig):
+        """기존 openpyxl 경로 (xlsxwriter 미설치 시)"""
+        print(f"[RENDERER] 1/9 데이터 쓰기... ({len(df):,}행)")
+        # 1. 데이터 쓰기
+        with pd.ExcelWriter(self.output_path, engine='openpyxl') as writer:
+            df.to_excel(writer, sheet_name=self.sheet_name, index=False, header=False)
+        print(f"[RENDERER] 1/9 완료")
+        
+        print(f"[RENDERER] 2/9 파일 로드...")
+        # 2. 파일 로드 - 🔥 2행 삽입 (2단 헤더)
+        self.wb = load_workbook(self.output_path)
+        self.ws = self.wb[self.sheet_name]
+        self.ws.insert_rows(1, 2)  # 🔥 수정: 3 → 2
+        print(f"[RENDERER] 2/9 완료")
+        
+        print(f"[RENDERER] 3/9 헤더 렌더링...")
+        # 3. 헤더 - 🔥 2단 헤더
+        self._render_headers(config.groups)
+        print(f"[RENDERER] 3/9 완료")
+        
+        print(f"[RENDERER] 4/9 컬럼 너비...")
+        # 4. 컬럼 너비
+        self._set_column_widths(config.columns)
+        print(f"[RENDERER] 4/9 완료")
+        
+        print(f"[RENDERER] 5/9 데이터 영역 스타일...")
+        # 5. 데이터 영역
+        self._style_data_area(config.columns)
+        print(f"[RENDERER] 5/9 완료")
+        
+        print(f"[RENDERER] 6/9 조건부 서식... ({len(config.conditional_rules)}개 규칙)")
+        # 6. 조건부 서식
+        if config.conditional_rules:
+            self._apply_conditional_rules(config.conditional_rules)
+        print(f"[RENDERER] 6/9 완료")
+        
+        print(f"[RENDERER] 7/9 데이터바...")
+        # 7. 🆕 데이터바
+        self._apply_data_bars()
+        print(f"[RENDERER] 7/9 완료")
+        
+        print(f"[RENDERER] 8/9 링크 처리...")
+        # 8. 링크
+        self._apply_links()
+        print(f"[RENDERER] 8/9 완료")
+        
+        print(f"[RENDERER] 9/9 UI 설정...")
+        # 9. UI
+        if config.freeze_panes:
+            row, col = config.freeze_panes
+            self.ws.freeze_panes = self.ws.cell(row, col)  # 🔥 그대로 사용 (price_comparison_2에서 조정됨)
+        
+        if config.auto_filter:
+            self.ws.auto_filter.ref = (
+                f"A2:{get_column_letter(self.ws.max_column)}{self.ws.max_row}"  # 🔥 A3 → A2
+            )
+        
+        # 저장
+        self.wb.save(self.output_path)
+        print(f"[RENDERER] 9/9 완료")
+    
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Private Methods
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -224,7 +515,22 @@ class ExcelRenderer:
                 )
     
     def _apply_conditional_rules(self, rules):
-        """조건부 서식 적용 (최적화: 컬럼별 한 번만 순회)"""
+        """조건부 서식 적용 (네이티브 수식 규칙 → 범위 1개, 나머지 → 컬럼별 한 번 순회)"""
+        native, rules = split_rules(rules)
+        
+        for rule in native:
+            col_idx = self._find_column(rule.column)
+            if not col_idx or self.ws.max_row <= DATA_START_ROW:
+                continue
+            col_letter = get_column_letter(col_idx)
+            fill = PatternFill(start_color=rule.fill_color, end_color=rule.fill_color,
+                               fill_type="solid") if rule.fill_color else None
+            font = Font(color=rule.font_color) if rule.font_color else None
+            self.ws.conditional_formatting.add(
+                f'{col_letter}{DATA_START_ROW + 1}:{col_letter}{self.ws.max_row}',
+                FormulaRule(formula=[rule_formula(rule, col_idx)[1:]], fill=fill, font=font, stopIfTrue=True)
+            )
+        
         # 컬럼별로 규칙 그룹핑
         rules_by_column = {}
         for rule in rules:
@@ -287,7 +593,7 @@ class ExcelRenderer:
         link_columns = []
         for col_idx in range(1, self.ws.max_column + 1):
             col_name = self.ws.cell(2, col_idx).value
-            if col_name and ('링크' in str(col_name) or 'url' in str(col_name).lower()):
+            if is_link_column(col_name):
                 link_columns.append(col_idx)
         
         # 🔥 수정: 4 → 3
@@ -5,6 +5,10 @@
 Conditional Format Rules
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 조건부 서식 규칙 팩토리
+
+🆕 각 규칙은 Excel 네이티브 수식(formula)도 함께 가짐
+  → 렌더러가 컬럼 범위당 규칙 1개로 적용 (행 수와 무관)
+  → condition 람다는 수식이 없는 규칙의 셀별 평가용
 """
 
 from typing import List
@@ -12,6 +16,21 @@ from .types import ConditionalRule
 from .constants import COLORS
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Excel 수식 헬퍼 ({cell}은 렌더러가 첫 데이터 셀로 치환)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def numeric_formula(operator: str, threshold: float) -> str:
+    """숫자 비교 (빈 셀/문자는 불일치 - `v is not None and float(v) > 0`과 동일)"""
+    return f"AND(ISNUMBER({{cell}}),{{cell}}{operator}{threshold:g})"
+
+
+def text_formula(text: str) -> str:
+    """문자열 일치 (대소문자 구분 - `v == text`와 동일)"""
+    escaped = text.replace('"', '""')
+    return f'EXACT({{cell}},"{escaped}")'
+
+
 def make_delta_rule(col_name: str) -> List[ConditionalRule]:
     """Δ 컬럼 규칙: 양수=초록, 음수=빨강
     
@@ -25,12 +44,14 @@ def make_delta_rule(col_name: str) -> List[ConditionalRule]:
         ConditionalRule(
             column=col_name,
             condition=lambda v: v is not None and float(v) > 0,
-            fill_color=COLORS["GREEN"]
+            fill_color=COLORS["GREEN"],
+            formula=numeric_formula(">", 0)
         ),
         ConditionalRule(
             column=col_name,
             condition=lambda v: v is not None and float(v) < 0,
-            fill_color=COLORS["RED"]
+            fill_color=COLORS["RED"],
+            formula=numeric_formula("<", 0)
         ),
     ]
 
@@ -49,7 +70,8 @@ def make_winner_rule(col_name: str, threshold: float = 30.0) -> List[Conditional
         ConditionalRule(
             column=col_name,
             condition=lambda v: v is not None and float(v) >= threshold,
-            fill_color=COLORS["GREEN"]
+            fill_color=COLORS["GREEN"],
+            formula=numeric_formula(">=", threshold)
         ),
     ]
 
@@ -67,12 +89,14 @@ def make_cheaper_source_rule(col_name: str) -> List[ConditionalRule]:
         ConditionalRule(
             column=col_name,
             condition=lambda v: v == "아이허브",
-            fill_color=COLORS["GREEN"]
+            fill_color=COLORS["GREEN"],
+            formula=text_formula("아이허브")
         ),
         ConditionalRule(
             column=col_name,
             condition=lambda v: v == "로켓직구",
-            fill_color=COLORS["RED"]
+            fill_color=COLORS["RED"],
+            formula=text_formula("로켓직구")
         ),
     ]
 
@@ -90,17 +114,45 @@ def make_confidence_rule(col_name: str) -> List[ConditionalRule]:
         ConditionalRule(
             column=col_name,
             condition=lambda v: v == "High",
-            fill_color=COLORS["GREEN"]
+            fill_color=COLORS["GREEN"],
+            formula=text_formula("High")
         ),
         ConditionalRule(
             column=col_name,
             condition=lambda v: v == "Medium",
-            fill_color=COLORS["YELLOW"]
+            fill_color=COLORS["YELLOW"],
+            formula=text_formula("Medium")
         ),
         ConditionalRule(
             column=col_name,
             condition=lambda v: v == "Low",
-            fill_color=COLORS["RED"]
+            fill_color=COLORS["RED"],
+            formula=text_formula("Low")
+        ),
+    ]
+
+
+def make_inverse_delta_rule(col_name: str) -> List[ConditionalRule]:
+    """격차 규칙: 음수=초록, 양수=빨강 (make_delta_rule 반대)
+    
+    Args:
+        col_name: 컬럼명
+    
+    Returns:
+        List[ConditionalRule]
+    """
+    return [
+        ConditionalRule(
+            column=col_name,
+            condition=lambda v: v is not None and float(v) < 0,
+            fill_color=COLORS["GREEN"],
+            formula=numeric_formula("<", 0)
+        ),
+        ConditionalRule(
+            column=col_name,
+            condition=lambda v: v is not None and float(v) > 0,
+            fill_color=COLORS["RED"],
+            formula=numeric_formula(">", 0)
         ),
     ]
 
@@ -118,6 +170,7 @@ def make_positive_red_rule(col_name: str) -> List[ConditionalRule]:
         ConditionalRule(
             column=col_name,
             condition=lambda v: v is not None and float(v) > 0,
-            fill_color=COLORS["RED"]
+            fill_color=COLORS["RED"],
+            formula=numeric_formula(">", 0)
         ),
     ]
\ No newline at end of file
@@ -38,11 +38,16 @@ class GroupSpec:
 
 @dataclass
 class ConditionalRule:
-    """조건부 서식 규칙"""
+    """조건부 서식 규칙
+    
+    formula: Excel 조건부 서식 수식 ({cell} = 컬럼 첫 데이터 셀, 예: 'AND(ISNUMBER({cell}),{cell}>0)')
+             지정 시 컬럼 범위에 네이티브 규칙 1개로 적용, 없으면 condition을 셀마다 평가
+    """
     column: str
     condition: Callable[[Any], bool]
     fill_color: Optional[str] = None
     font_color: Optional[str] = None
+    formula: Optional[str] = None
 
 
 @dataclass
@@ -5,6 +5,11 @@
 가격 비교 리포트 생성 (통합 DB 버전)
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 통합 DB에서 데이터를 읽어 Excel 리포트 생성
+
+🆕 스트리밍 기록 (xlsxwriter):
+  - 여러 날짜 시트를 헤더/서식/강조/링크/데이터바까지 한 번에 기록
+  - 컬럼 레이아웃/너비/서식은 미리 계산해 모든 시트가 공유
+  - xlsxwriter 없으면 기존 경로 (ExcelWriter → apply_excel_styles) 사용
 """
 
 import pandas as pd
@@ -24,6 +29,9 @@ sys.path.insert(0, str(project_root))
 
 # 통합 모듈 import
 from src.data_manager import DataManager
+from analysis.excel.renderer import (
+    FormatCache, MAX_URLS_PER_SHEET, LINK_FONT_COLOR, DATA_BAR_COLOR, to_cell_value, xlsxwriter
+)
 
 
 def get_available_dates(db_path):
@@ -39,6 +47,40 @@ def get_available_dates(db_path):
     return df['date'].tolist()
 
 
+def add_share_columns(df):
+    """비중(%) 컬럼 추가 + 아이템위너비율 정수 변환 (df 직접 수정)
+
+    Args:
+        df: get_integrated_df / get_snapshot_view 결과
+
+    Returns:
+        df (같은 객체)
+    """
+
+    def calculate_share(colname, outname):
+        """전체 합계 대비 비중 계산 (정수)"""
+        total = pd.to_numeric(df[colname], errors='coerce').fillna(0).sum()
+        if total <= 0:
+            df[outname] = np.nan
+        else:
+            df[outname] = (pd.to_numeric(df[colname], errors='coerce').fillna(0) / total * 100).round(0).astype('Int64')
+
+    share_columns = [
+        ('iherb_revenue', '매출비중'),
+        ('iherb_sales_quantity', '판매량비중'),
+    ]
+    
+    for src_col, out_col in share_columns:
+        if src_col in df.columns:
+            calculate_share(src_col, out_col)
+    
+    # 정수 변환
+    if 'iherb_item_winner_ratio' in df.columns:
+        df['iherb_item_winner_ratio'] = pd.to_numeric(df['iherb_item_winner_ratio'], errors='coerce').fillna(0).round(0).astype('Int64')
+
+    return df
+
+
 def extract_price_comparison_data(db_path, target_date=None):
     """가격 비교 데이터 추출 (통합 DB 버전)
     
@@ -65,27 +107,7 @@ def extract_price_comparison_data(db_path, target_date=None):
         print("⚠️ 데이터가 없습니다.")
         return df
 
-    # 비중(%) 계산
-    def calculate_share(colname, outname):
-        """전체 합계 대비 비중 계산 (정수)"""
-        total = pd.to_numeric(df[colname], errors='coerce').fillna(0).sum()
-        if total <= 0:
-            df[outname] = np.nan
-        else:
-            df[outname] = (pd.to_numeric(df[colname], errors='coerce').fillna(0) / total * 100).round(0).astype('Int64')
-
-    share_columns = [
-        ('iherb_revenue', '매출비중'),
-        ('iherb_sales_quantity', '판매량비중'),
-    ]
-    
-    for src_col, out_col in share_columns:
-        if src_col in df.columns:
-            calculate_share(src_col, out_col)
-    
-    # 정수 변환
-    if 'iherb_item_winner_ratio' in df.columns:
-        df['iherb_item_winner_ratio'] = pd.to_numeric(df['iherb_item_winner_ratio'], errors='coerce').fillna(0).round(0).astype('Int64')
+    add_share_columns(df)
 
     print(f"\n✅ 총 {len(df):,}개 상품")
     print(f"   - 로켓 매칭: {(df['matching_status'] == '로켓매칭').sum():,}개")
@@ -103,132 +125,451 @@ def extract_price_comparison_data(db_path, target_date=None):
     return df
 
 
-def create_excel_report(date_data_dict, output_path):
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 리포트 레이아웃 (openpyxl / xlsxwriter 경로 공용)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# 색상 팔레트
+INFO_DARK  = "0F172A"
+INFO_MID   = "475569"
+INFO_LIGHT = "E2E8F0"
+PRIMARY_DARK = "5E2A8A"
+PRIMARY_MID  = "7A3EB1"
+PRIMARY_LIGHT= "D2B7E5"
+SECONDARY_DARK = "305496"
+SECONDARY_MID = "4472C4"
+SECONDARY_LIGHT = "B4C7E7"
+TERTIARY_DARK = "C55A11"
+TERTIARY_MID = "F4B084"
+TERTIARY_LIGHT = "FBE5D6"
+SUCCESS_DARK = "375623"
+SUCCESS_MID = "548235"
+SUCCESS_LIGHT = "A8D08D"
+
+HIGHLIGHT_GREEN = "C6EFCE"
+HIGHLIGHT_RED = "FFC7CE"
+HIGHLIGHT_YELLOW = "FFEB9C"
+
+# 컬럼 그룹 정의 (39개)
+COLUMN_GROUPS = [
+    # 1️⃣ 기본 정보 (8개)
+    {
+        'name': '기본 정보',
+        'color_top': INFO_DARK,
+        'color_mid': INFO_MID,
+        'color_bottom': INFO_LIGHT,
+        'sub_groups': [
+            {'name': '매칭', 'cols': ['상태', '신뢰도']},
+            {'name': '카테고리', 'cols': ['로켓', '아이허브']},
+            {'name': '링크', 'cols': ['로켓', '아이허브']},
+            {'name': '상품번호', 'cols': ['품번', 'UPC']}
+        ]
+    },
+    # 2️⃣ 핵심 지표 (9개)
+    {
+        'name': '핵심 지표',
+        'color_top': PRIMARY_DARK,
+        'color_mid': PRIMARY_MID,
+        'color_bottom': PRIMARY_LIGHT,
+        'sub_groups': [
+            {'name': '로켓', 'cols': ['순위']},
+            {'name': '아이허브', 'cols': ['판매량', '매출(원)', '아이템위너비율']},
+            {'name': '종합', 'cols': ['가격격차(원)', '손익분기할인율', '추천할인율', '요청할인율', '유리한곳']}
+        ]
+    },
+    # 3️⃣ 제품 정보 (7개)
+    {
+        'name': '제품 정보',
+        'color_top': SECONDARY_DARK,
+        'color_mid': SECONDARY_MID,
+        'color_bottom': SECONDARY_LIGHT,
+        'sub_groups': [
+            {'name': '제품명', 'cols': ['로켓', '아이허브']},
+            {
+                'name': '상품 ID',
+                'cols': ['Product_ID', '로켓_Vendor', '로켓_Item', '아이허브_Vendor', '아이허브_Item']
+            }
+        ]
+    },
+    # 4️⃣ 가격 정보 (8개)
+    {
+        'name': '가격 정보',
+        'color_top': TERTIARY_DARK,
+        'color_mid': TERTIARY_MID,
+        'color_bottom': TERTIARY_LIGHT,
+        'sub_groups': [
+            {'name': '로켓직구', 'cols': ['정가', '할인율', '로켓가격']},
+            {'name': '아이허브', 'cols': ['판매가', '정가', '쿠팡추천가', '재고', '판매상태']}
+        ]
+    },
+    # 5️⃣ 판매 성과 (7개)
+    {
+        'name': '판매 성과',
+        'color_top': SUCCESS_DARK,
+        'color_mid': SUCCESS_MID,
+        'color_bottom': SUCCESS_LIGHT,
+        'sub_groups': [
+            {'name': '로켓', 'cols': ['평점', '리뷰수']},
+            {'name': '아이허브', 'cols': ['매출비중', '주문', '판매량비중', '구매전환율', '취소율']}
+        ]
+    }
+]
+
+COLUMN_WIDTHS = {
+    '상태': 7.9,
+    '신뢰도': 9.71,
+    '로켓': 12.86,
+    '아이허브': 11.00,
+    '품번': 12.71,
+    'UPC': 15.00,
+    '순위': 7.86,
+    '판매량': 9.00,
+    '매출(원)': 10.14,
+    '아이템위너비율': 15.57,
+    '가격격차(원)': 13.43,
+    '손익분기할인율': 15.57,
+    '추천할인율': 12.29,
+    '요청할인율': 12.29,
+    '유리한곳': 10.57,
+    'Product_ID': 14.14,
+    '로켓_Vendor': 17.29,
+    '로켓_Item': 15.14,
+    '아이허브_Vendor': 17.29,
+    '아이허브_Item': 15.14,
+    '정가': 8.86,
+    '할인율': 9.00,
+    '로켓가격': 10.57,
+    '판매가': 10.57,
+    '쿠팡추천가': 12.29,
+    '재고': 7.29,
+    '판매상태': 10.57,
+    '평점': 8.86,
+    '리뷰수': 9.00,
+    '매출비중': 10.57,
+    '주문': 7.29,
+    '판매량비중': 12.29,
+    '구매전환율': 13.00,
+    '취소율': 9.00,
+}
+
+DEFAULT_WIDTH = 12
+PRODUCT_NAME_WIDTH = 60.0
+
+# 3단 헤더 아래 데이터 시작 행 (0-based) / 틀 고정 컬럼 (1-based)
+HEADER_ROWS = 3
+FREEZE_COL = 17
+
+
+def column_width(sub_name, col_name):
+    """(중간 헤더, 하위 헤더) → 컬럼 너비"""
+    if sub_name == '제품명':
+        return PRODUCT_NAME_WIDTH
+    if sub_name == '링크' and col_name == '로켓':
+        return 7.29
+    if sub_name == '링크' and col_name == '아이허브':
+        return 10.57
+    return COLUMN_WIDTHS.get(col_name, DEFAULT_WIDTH)
+
+
+def build_report_sheet(df):
+    """통합 DataFrame → 리포트 시트 DataFrame (39개 컬럼, COLUMN_GROUPS 순서)"""
+    output_df = pd.DataFrame()
+
+    # ========================================
+    # 1️⃣ 기본 정보 (8개) - 매칭 상태 포함
+    # ========================================
+    output_df['매칭상태'] = df.get('matching_status', np.nan)
+    output_df['신뢰도'] = df.get('matching_confidence', np.nan).apply(
+        lambda x: '' if pd.isna(x) or x == '' else x
+    )
+    output_df['로켓_카테고리'] = df.get('rocket_category', np.nan)
+    output_df['아이허브_카테고리'] = df.get('iherb_category', np.nan)
+    output_df['로켓_링크'] = df.get('rocket_url', np.nan)
+    output_df['아이허브_링크'] = df.get('iherb_url', np.nan)
+    output_df['품번'] = df.get('iherb_part_number', np.nan)
+    output_df['UPC'] = pd.to_numeric(df.get('iherb_upc', np.nan), errors='coerce').astype('Int64')
+
+    # ========================================
+    # 2️⃣ 핵심 지표 (9개)
+    # ========================================
+    output_df['순위'] = df.get('rocket_rank', np.nan)
+    output_df['판매량'] = df.get('iherb_sales_quantity', np.nan)
+    output_df['매출(원)'] = df.get('iherb_revenue', np.nan)
+    output_df['아이템위너비율'] = df.get('iherb_item_winner_ratio', np.nan)
+    output_df['가격격차(원)'] = df.get('price_diff', np.nan)
+    output_df['손익분기할인율'] = df.get('breakeven_discount_rate', np.nan)
+    output_df['추천할인율'] = df.get('recommended_discount_rate', np.nan)
+    output_df['요청할인율'] = df.get('requested_discount_rate', np.nan)
+    output_df['유리한곳'] = df.get('cheaper_source', np.nan)
+
+    # ========================================
+    # 3️⃣ 제품 정보 (7개)
+    # ========================================
+    output_df['로켓_제품명'] = df.get('rocket_product_name', np.nan)
+    output_df['아이허브_제품명'] = df.get('iherb_product_name', np.nan)
+    output_df['Product_ID'] = df.get('rocket_product_id', np.nan)
+    output_df['로켓_Vendor'] = df.get('rocket_vendor_id', np.nan)
+    output_df['로켓_Item'] = df.get('rocket_item_id', np.nan)
+    output_df['아이허브_Vendor'] = df.get('iherb_vendor_id', np.nan)
+    output_df['아이허브_Item'] = df.get('iherb_item_id', np.nan)
+
+    # ========================================
+    # 4️⃣ 가격 정보 (8개)
+    # ========================================
+    output_df['정가'] = df.get('rocket_original_price', np.nan)
+    output_df['할인율'] = df.get('rocket_discount_rate', np.nan)
+    output_df['로켓가격'] = df.get('rocket_price', np.nan)
+    output_df['판매가'] = df.get('iherb_price', np.nan)
+    output_df['정가_아이허브'] = df.get('iherb_original_price', np.nan)
+    output_df['쿠팡추천가'] = df.get('iherb_recommended_price', np.nan)
+    output_df['재고'] = df.get('iherb_stock', np.nan)
+    output_df['판매상태'] = df.get('iherb_stock_status', np.nan)
+
+    # ========================================
+    # 5️⃣ 판매 성과 (7개) - 간소화
+    # ========================================
+    output_df['평점'] = df.get('rocket_rating', np.nan)
+    output_df['리뷰수'] = df.get('rocket_reviews', np.nan)
+    output_df['매출비중'] = df.get('매출비중', np.nan)
+    output_df['주문'] = np.nan  # 통합 DB에 없음
+    output_df['판매량비중'] = df.get('판매량비중', np.nan)
+    output_df['구매전환율'] = np.nan  # 통합 DB에 없음
+    output_df['취소율'] = np.nan  # 통합 DB에 없음
+
+    return output_df
+
+
+def sheet_name_of(date_str):
+    """날짜 → 시트명 (YYYYMMDD)"""
+    return date_str.replace('-', '')[:10]
+
+
+def create_excel_report(date_data_dict, output_path, engine='auto'):
     """Excel 리포트 생성 - 단일 시트 (매칭 + 미매칭 통합)
-    
+
     Args:
         date_data_dict: {날짜: DataFrame}
         output_path: 출력 파일 경로
+        engine: 'xlsxwriter' (한 번에 서식 포함 기록) / 'openpyxl' (기존: 쓰기 → 재로드 → 서식) / 'auto'
     """
 
     if not date_data_dict:
         print("❌ 데이터가 없어 엑셀 생성을 건너뜁니다.")
         return
 
+    if engine == 'auto':
+        engine = 'xlsxwriter' if xlsxwriter is not None else 'openpyxl'
+
     print(f"\n{'='*80}")
     print(f"📊 Excel 리포트 생성 (단일 시트 통합)")
     print(f"{'='*80}")
 
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        for date_str, df in date_data_dict.items():
-            if df.empty:
-                continue
+    sheets = []
+    for date_str, df in date_data_dict.items():
+        if df.empty:
+            continue
+        sheets.append((sheet_name_of(date_str), build_report_sheet(df)))
 
-            # 컬럼 재구성 (41개)
-            output_df = pd.DataFrame()
-
-            # ========================================
-            # 1️⃣ 기본 정보 (8개) - 매칭 상태 포함
-            # ========================================
-            output_df['매칭상태'] = df.get('matching_status', np.nan)
-            output_df['신뢰도'] = df.get('matching_confidence', np.nan).apply(
-                lambda x: '' if pd.isna(x) or x == '' else x
-            )
-            output_df['로켓_카테고리'] = df.get('rocket_category', np.nan)
-            output_df['아이허브_카테고리'] = df.get('iherb_category', np.nan)
-            output_df['로켓_링크'] = df.get('rocket_url', np.nan)
-            output_df['아이허브_링크'] = df.get('iherb_url', np.nan)
-            output_df['품번'] = df.get('iherb_part_number', np.nan)
-            output_df['UPC'] = pd.to_numeric(df.get('iherb_upc', np.nan), errors='coerce').astype('Int64')
-
-            # ========================================
-            # 2️⃣ 핵심 지표 (9개)
-            # ========================================
-            output_df['순위'] = df.get('rocket_rank', np.nan)
-            output_df['판매량'] = df.get('iherb_sales_quantity', np.nan)
-            output_df['매출(원)'] = df.get('iherb_revenue', np.nan)
-            output_df['아이템위너비율'] = df.get('iherb_item_winner_ratio', np.nan)
-            output_df['가격격차(원)'] = df.get('price_diff', np.nan)
-            output_df['손익분기할인율'] = df.get('breakeven_discount_rate', np.nan)
-            output_df['추천할인율'] = df.get('recommended_discount_rate', np.nan)
-            output_df['요청할인율'] = df.get('requested_discount_rate', np.nan)
-            output_df['유리한곳'] = df.get('cheaper_source', np.nan)
-
-            # ========================================
-            # 3️⃣ 제품 정보 (7개)
-            # ========================================
-            output_df['로켓_제품명'] = df.get('rocket_product_name', np.nan)
-            output_df['아이허브_제품명'] = df.get('iherb_product_name', np.nan)
-            output_df['Product_ID'] = df.get('rocket_product_id', np.nan)
-            output_df['로켓_Vendor'] = df.get('rocket_vendor_id', np.nan)
-            output_df['로켓_Item'] = df.get('rocket_item_id', np.nan)
-            output_df['아이허브_Vendor'] = df.get('iherb_vendor_id', np.nan)
-            output_df['아이허브_Item'] = df.get('iherb_item_id', np.nan)
-
-            # ========================================
-            # 4️⃣ 가격 정보 (8개)
-            # ========================================
-            output_df['정가'] = df.get('rocket_original_price', np.nan)
-            output_df['할인율'] = df.get('rocket_discount_rate', np.nan)
-            output_df['로켓가격'] = df.get('rocket_price', np.nan)
-            output_df['판매가'] = df.get('iherb_price', np.nan)
-            output_df['정가_아이허브'] = df.get('iherb_original_price', np.nan)
-            output_df['쿠팡추천가'] = df.get('iherb_recommended_price', np.nan)
-            output_df['재고'] = df.get('iherb_stock', np.nan)
-            output_df['판매상태'] = df.get('iherb_stock_status', np.nan)
-
-            # ========================================
-            # 5️⃣ 판매 성과 (7개) - 간소화
-            # ========================================
-            output_df['평점'] = df.get('rocket_rating', np.nan)
-            output_df['리뷰수'] = df.get('rocket_reviews', np.nan)
-            output_df['매출비중'] = df.get('매출비중', np.nan)
-            output_df['주문'] = np.nan  # 통합 DB에 없음
-            output_df['판매량비중'] = df.get('판매량비중', np.nan)
-            output_df['구매전환율'] = np.nan  # 통합 DB에 없음
-            output_df['취소율'] = np.nan  # 통합 DB에 없음
-
-            # 시트 작성 (헤더 없이)
-            sheet_name = date_str.replace('-', '')[:10]  # YYYYMMDD
-            output_df.to_excel(writer, sheet_name=sheet_name, index=False, header=False)
+    if engine == 'xlsxwriter':
+        write_report_streaming(sheets, output_path)
+    else:
+        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+            for sheet_name, output_df in sheets:
+                # 시트 작성 (헤더 없이)
+                output_df.to_excel(writer, sheet_name=sheet_name, index=False, header=False)
+                print(f"   ✓ 시트 '{sheet_name}' 작성 완료 ({len(output_df):,}개)")
+
+        # 스타일 적용
+        apply_excel_styles(output_path)
+
+    print(f"\n✅ Excel 리포트 생성 완료: {output_path}")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 스트리밍 기록 (xlsxwriter: 헤더/서식/강조/링크를 한 번에)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _as_number(value):
+    """강조 판정용 숫자 (기존 apply_excel_styles와 같은 규칙: 변환 불가/빈 값 → 0)"""
+    try:
+        return float(value) if value else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def write_report_streaming(sheets, output_path):
+    """[(시트명, 리포트 DataFrame)] → 서식 포함 워크북 1회 기록
+
+    - 헤더/컬럼 서식은 워크북당 1번만 만들어 모든 시트가 공유
+    - 셀 서식은 (강조색, 링크) 조합별 Format 1개
+    - 저장 → load_workbook → insert_rows → 셀별 재서식 과정 없음
+    """
+    workbook = xlsxwriter.Workbook(str(output_path), {
+        'constant_memory': True,
+        'strings_to_numbers': False,
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+    })
+    try:
+        formats = FormatCache(workbook)
+
+        # 컬럼 레이아웃 (시트 공통): (그룹, 중간 헤더명, 하위 헤더명)
+        layout = [
+            (group, sub_group['name'], col_name)
+            for group in COLUMN_GROUPS
+            for sub_group in group['sub_groups']
+            for col_name in sub_group['cols']
+        ]
+        bottom_names = [col_name for _, _, col_name in layout]
+        widths = [column_width(sub_name, col_name) for _, sub_name, col_name in layout]
+        link_cols = {i for i, (_, sub_name, _) in enumerate(layout) if sub_name == '링크'}
+        share_cols = [bottom_names.index(name) for name in ('매출비중', '판매량비중')]
+
+        # 데이터 셀 서식: 강조색(None = 강조 없음) → Format
+        data_props = dict(border=1, valign='vcenter')
+        data_formats = {None: formats.get(**data_props)}
+        for fill in (HIGHLIGHT_GREEN, HIGHLIGHT_RED, HIGHLIGHT_YELLOW):
+            data_formats[fill] = formats.get(**data_props, bg_color=f"#{fill}", pattern=1)
+        link_format = formats.get(
+            border=1, font_color=f"#{LINK_FONT_COLOR}", underline=1,
+            align='center', valign='vcenter'
+        )
+
+        for sheet_name, output_df in sheets:
+            ws = workbook.add_worksheet(sheet_name)
+            n_cols = len(output_df.columns)
+
+            _write_headers_streaming(ws, formats)
+            for col_idx, width in enumerate(widths[:n_cols]):
+                ws.set_column(col_idx, col_idx, width)
+
+            _write_rows_streaming(ws, output_df, bottom_names, link_cols, data_formats, link_format)
+
+            last_row = HEADER_ROWS + len(output_df) - 1
+            for col_idx in share_cols:
+                ws.conditional_format(HEADER_ROWS, col_idx, last_row, col_idx, {
+                    'type': 'data_bar',
+                    'min_type': 'num', 'min_value': 0,
+                    'max_type': 'num', 'max_value': 100,
+                    'bar_color': f"#{DATA_BAR_COLOR}",
+                    'data_bar_2010': False,
+                })
+
+            ws.freeze_panes(HEADER_ROWS, FREEZE_COL - 1)
+            ws.autofilter(HEADER_ROWS - 1, 0, last_row, n_cols - 1)
 
             print(f"   ✓ 시트 '{sheet_name}' 작성 완료 ({len(output_df):,}개)")
+    finally:
+        workbook.close()
 
-    # 스타일 적용
-    apply_excel_styles(output_path)
 
-    print(f"\n✅ Excel 리포트 생성 완료: {output_path}")
+def _write_headers_streaming(ws, formats):
+    """3단 헤더 (constant_memory 모드는 행 순서대로만 쓸 수 있으므로 1단 → 2단 → 3단)"""
+
+    def header_format(color, font_color, font_size, wrap=False):
+        return formats.get(
+            bg_color=f"#{color}", pattern=1,
+            font_color=f"#{font_color}", bold=True, font_size=font_size,
+            align='center', valign='vcenter', text_wrap=wrap, border=1,
+        )
+
+    def write_span(row, start, span, text, fmt):
+        if span > 1:
+            ws.merge_range(row, start, row, start + span - 1, text, fmt)
+        else:
+            ws.write_string(row, start, text, fmt)
+
+    # 상위 헤더
+    col_pos = 0
+    for group in COLUMN_GROUPS:
+        total_span = sum(len(sg['cols']) for sg in group['sub_groups'])
+        write_span(0, col_pos, total_span, group['name'], header_format(group['color_top'], "FFFFFF", 11))
+        col_pos += total_span
+
+    # 중간 헤더
+    col_pos = 0
+    for group in COLUMN_GROUPS:
+        fmt = header_format(group['color_mid'], "FFFFFF", 11)
+        for sub_group in group['sub_groups']:
+            write_span(1, col_pos, len(sub_group['cols']), sub_group['name'], fmt)
+            col_pos += len(sub_group['cols'])
+
+    # 하위 헤더
+    col_pos = 0
+    for group in COLUMN_GROUPS:
+        fmt = header_format(group['color_bottom'], "000000", 10, wrap=True)
+        for sub_group in group['sub_groups']:
+            for col_name in sub_group['cols']:
+                ws.write_string(2, col_pos, col_name, fmt)
+                col_pos += 1
+
+
+def _write_rows_streaming(ws, output_df, bottom_names, link_cols, data_formats, link_format):
+    """데이터 행 순차 기록 (강조색/링크를 쓰는 시점에 결정)"""
+
+    def col_idx_of(name):
+        return bottom_names.index(name) if name in bottom_names else None
+
+    winner_col = col_idx_of('아이템위너비율')
+    positive_red_cols = [
+        c for c in (col_idx_of('손익분기할인율'), col_idx_of('추천할인율'), col_idx_of('요청할인율'))
+        if c is not None
+    ]
+    price_diff_col = col_idx_of('가격격차(원)')
+    cheaper_col = col_idx_of('유리한곳')
+    conf_col = col_idx_of('신뢰도')
+
+    cheaper_fills = {'아이허브': HIGHLIGHT_GREEN, '로켓직구': HIGHLIGHT_RED}
+    conf_fills = {'High': HIGHLIGHT_GREEN, 'Medium': HIGHLIGHT_YELLOW, 'Low': HIGHLIGHT_RED}
+
+    url_count = 0
+    for offset, values in enumerate(output_df.itertuples(index=False, name=None)):
+        row = HEADER_ROWS + offset
+        values = [to_cell_value(v) for v in values]
+
+        # 조건부 강조 (기존 apply_excel_styles 규칙)
+        fills = {}
+        if winner_col is not None and _as_number(values[winner_col]) >= 30:
+            fills[winner_col] = HIGHLIGHT_GREEN
+        for col_idx in positive_red_cols:
+            if _as_number(values[col_idx]) > 0:
+                fills[col_idx] = HIGHLIGHT_RED
+        if price_diff_col is not None and cheaper_col is not None and values[cheaper_col] in cheaper_fills:
+            fills[price_diff_col] = cheaper_fills[values[cheaper_col]]
+        if conf_col is not None and values[conf_col] in conf_fills:
+            fills[conf_col] = conf_fills[values[conf_col]]
+
+        for col_idx, value in enumerate(values):
+            if col_idx in link_cols and value and str(value).strip() and str(value).startswith('http'):
+                if url_count < MAX_URLS_PER_SHEET and ws.write_url(row, col_idx, str(value), link_format, 'Link') == 0:
+                    url_count += 1
+                else:
+                    ws.write_string(row, col_idx, str(value), link_format)
+                continue
+
+            fmt = data_formats[fills.get(col_idx)]
+            if value is None or value == '':
+                ws.write_blank(row, col_idx, None, fmt)
+            elif isinstance(value, bool):
+                ws.write_boolean(row, col_idx, value, fmt)
+            elif isinstance(value, (int, float)):
+                ws.write_number(row, col_idx, value, fmt)
+            else:
+                ws.write_string(row, col_idx, value, fmt)
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 기존 스타일 적용 (openpyxl: 재로드 → 셀별 서식)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
 def apply_excel_styles(output_path):
     """Excel 스타일 적용 - 3단 헤더 + 매칭상태 구분"""
 
     wb = load_workbook(output_path)
 
-    # 색상 팔레트
-    INFO_DARK  = "0F172A"
-    INFO_MID   = "475569"
-    INFO_LIGHT = "E2E8F0"
-    PRIMARY_DARK = "5E2A8A"
-    PRIMARY_MID  = "7A3EB1"
-    PRIMARY_LIGHT= "D2B7E5"
-    SECONDARY_DARK = "305496"
-    SECONDARY_MID = "4472C4"
-    SECONDARY_LIGHT = "B4C7E7"
-    TERTIARY_DARK = "C55A11"
-    TERTIARY_MID = "F4B084"
-    TERTIARY_LIGHT = "FBE5D6"
-    SUCCESS_DARK = "375623"
-    SUCCESS_MID = "548235"
-    SUCCESS_LIGHT = "A8D08D"
-    
-    HIGHLIGHT_GREEN = "C6EFCE"
-    HIGHLIGHT_RED = "FFC7CE"
-    HIGHLIGHT_YELLOW = "FFEB9C"
-
     header_font_white = Font(color="FFFFFF", bold=True, size=11)
     header_font_dark = Font(color="000000", bold=True, size=10)
-    
+
     thin_border = Border(
         left=Side(style='thin'),
         right=Side(style='thin'),
@@ -236,71 +577,6 @@ def apply_excel_styles(output_path):
         bottom=Side(style='thin')
     )
 
-    # 컬럼 그룹 정의 (39개)
-    column_groups = [
-        # 1️⃣ 기본 정보 (8개)
-        {
-            'name': '기본 정보',
-            'color_top': INFO_DARK,
-            'color_mid': INFO_MID,
-            'color_bottom': INFO_LIGHT,
-            'sub_groups': [
-                {'name': '매칭', 'cols': ['상태', '신뢰도']},
-                {'name': '카테고리', 'cols': ['로켓', '아이허브']},
-                {'name': '링크', 'cols': ['로켓', '아이허브']},
-                {'name': '상품번호', 'cols': ['품번', 'UPC']}
-            ]
-        },
-        # 2️⃣ 핵심 지표 (9개)
-        {
-            'name': '핵심 지표',
-            'color_top': PRIMARY_DARK,
-            'color_mid': PRIMARY_MID,
-            'color_bottom': PRIMARY_LIGHT,
-            'sub_groups': [
-                {'name': '로켓', 'cols': ['순위']},
-                {'name': '아이허브', 'cols': ['판매량', '매출(원)', '아이템위너비율']},
-                {'name': '종합', 'cols': ['가격격차(원)', '손익분기할인율', '추천할인율', '요청할인율', '유리한곳']}
-            ]
-        },
-        # 3️⃣ 제품 정보 (7개)
-        {
-            'name': '제품 정보',
-            'color_top': SECONDARY_DARK,
-            'color_mid': SECONDARY_MID,
-            'color_bottom': SECONDARY_LIGHT,
-            'sub_groups': [
-                {'name': '제품명', 'cols': ['로켓', '아이허브']},
-                {
-                    'name': '상품 ID', 
-                    'cols': ['Product_ID', '로켓_Vendor', '로켓_Item', '아이허브_Vendor', '아이허브_Item']
-                }
-            ]
-        },
-        # 4️⃣ 가격 정보 (8개)
-        {
-            'name': '가격 정보',
-            'color_top': TERTIARY_DARK,
-            'color_mid': TERTIARY_MID,
-            'color_bottom': TERTIARY_LIGHT,
-            'sub_groups': [
-                {'name': '로켓직구', 'cols': ['정가', '할인율', '로켓가격']},
-                {'name': '아이허브', 'cols': ['판매가', '정가', '쿠팡추천가', '재고', '판매상태']}
-            ]
-        },
-        # 5️⃣ 판매 성과 (7개)
-        {
-            'name': '판매 성과',
-            'color_top': SUCCESS_DARK,
-            'color_mid': SUCCESS_MID,
-            'color_bottom': SUCCESS_LIGHT,
-            'sub_groups': [
-                {'name': '로켓', 'cols': ['평점', '리뷰수']},
-                {'name': '아이허브', 'cols': ['매출비중', '주문', '판매량비중', '구매전환율', '취소율']}
-            ]
-        }
-    ]
-
     for sheet_name in wb.sheetnames:
         ws = wb[sheet_name]
 
@@ -310,7 +586,7 @@ def apply_excel_styles(output_path):
         # 헤더 작성
         col_pos = 1
         
-        for group in column_groups:
+        for group in COLUMN_GROUPS:
             group_name = group['name']
             color_top = group['color_top']
             color_mid = group['color_mid']
@@ -364,46 +640,6 @@ def apply_excel_styles(output_path):
             except ValueError:
                 return None
         
-        column_widths = {
-            '상태': 7.9,
-            '신뢰도': 9.71,
-            '로켓': 12.86,
-            '아이허브': 11.00,
-            '품번': 12.71,
-            'UPC': 15.00,
-            '순위': 7.86,
-            '판매량': 9.00,
-            '매출(원)': 10.14,
-            '아이템위너비율': 15.57,
-            '가격격차(원)': 13.43,
-            '손익분기할인율': 15.57,
-            '추천할인율': 12.29,
-            '요청할인율': 12.29,
-            '유리한곳': 10.57,
-            'Product_ID': 14.14,
-            '로켓_Vendor': 17.29,
-            '로켓_Item': 15.14,
-            '아이허브_Vendor': 17.29,
-            '아이허브_Item': 15.14,
-            '정가': 8.86,
-            '할인율': 9.00,
-            '로켓가격': 10.57,
-            '판매가': 10.57,
-            '쿠팡추천가': 12.29,
-            '재고': 7.29,
-            '판매상태': 10.57,
-            '평점': 8.86,
-            '리뷰수': 9.00,
-            '매출비중': 10.57,
-            '주문': 7.29,
-            '판매량비중': 12.29,
-            '구매전환율': 13.00,
-            '취소율': 9.00,
-        }
-
-        DEFAULT_WIDTH = 12
-        PRODUCT_NAME_WIDTH = 60.0
-
         for col_idx in range(1, ws.max_column + 1):
             col_letter = get_column_letter(col_idx)
             
@@ -419,8 +655,8 @@ def apply_excel_styles(output_path):
                 width = 7.29
             elif mid_header == '링크' and bottom_header == '아이허브':
                 width = 10.57
-            elif bottom_header in column_widths:
-                width = column_widths[bottom_header]
+            elif bottom_header in COLUMN_WIDTHS:
+                width = COLUMN_WIDTHS[bottom_header]
             else:
                 width = DEFAULT_WIDTH
 
@@ -526,8 +762,7 @@ def apply_excel_styles(output_path):
                     cell.alignment = Alignment(horizontal='center', vertical='center')
 
         # Freeze Panes
-        freeze_col = 17
-        ws.freeze_panes = ws.cell(row=4, column=freeze_col)
+        ws.freeze_panes = ws.cell(row=HEADER_ROWS + 1, column=FREEZE_COL)
 
         # 데이터바
         share_cols = ['매출비중', '판매량비중']
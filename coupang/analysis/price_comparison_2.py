@@ -23,6 +23,90 @@ from config.settings import Config
 from analysis.excel import quick_build, ExcelRenderer
 
 
+# 2단 헤더: C3
+FREEZE_PANES = (3, 3)
+
+# 출력 컬럼 정의 (데이터 구조만 정의, 그룹은 자동)
+COLUMN_MAP = {
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 1. 코어 정보 (6개)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    '매칭상태': ('matching_status',),
+    '신뢰도': ('matching_confidence',),
+    '품번': ('iherb_part_number',),
+    'UPC': ('iherb_upc', 'Int64'),
+    'Product_ID': ('product_id',),  # 🔥 공통 ID
+    '판매상태': ('iherb_stock_status',),
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 2. 카테고리 (2개)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    '로켓_카테고리': ('rocket_category',),
+    '아이허브_카테고리': ('iherb_category',),
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 3. 링크 (2개)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    '로켓_링크': ('rocket_url',),
+    '아이허브_링크': ('iherb_url',),
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 4. 순위 (1개)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    '순위': ('rocket_rank', 'Int64'),
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 5. 판매/위너 (6개)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    '판매량': ('iherb_sales_quantity', 'Int64'),
+    '매출(원)': ('iherb_revenue', 'Int64'),
+    '아이템위너비율': ('iherb_item_winner_ratio',),
+    '재고': ('iherb_stock', 'Int64'),
+    '매출비중': ('iherb_revenue', 'share'),
+    '판매량비중': ('iherb_sales_quantity', 'share'),
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 6. 할인전략 (6개) - 할인율 제외
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    '가격격차(원)': ('price_diff', 'Int64'),
+    '손익분기할인율': ('breakeven_discount_rate',),
+    '추천할인율': ('recommended_discount_rate',),
+    '요청할인율': ('requested_discount_rate',),
+    '유리한곳': ('cheaper_source',),
+    '쿠팡추천가': ('iherb_recommended_price', 'Int64'),
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 7. 제품명 (2개)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    '로켓_제품명': ('rocket_product_name',),
+    '아이허브_제품명': ('iherb_product_name',),
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 8. ID (4개)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    '로켓_Vendor': ('rocket_vendor_id',),
+    '로켓_Item': ('rocket_item_id',),
+    '아이허브_Vendor': ('iherb_vendor_id',),
+    '아이허브_Item': ('iherb_item_id',),
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 9. 가격상태 (6개) - 🔥 할인율 포함
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    '정가': ('rocket_original_price', 'Int64'),
+    '로켓가격': ('rocket_price', 'Int64'),
+    '로켓할인율': ('rocket_discount_rate',),  # 🔥 builders.py 패턴: "할인율" → "가격상태"
+    '판매가': ('iherb_price', 'Int64'),
+    '정가_아이허브': ('iherb_original_price', 'Int64'),
+    '아이허브할인율': ('iherb_discount_rate',),  # 🔥 builders.py 패턴: "할인율" → "가격상태"
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 10. 평가 (2개)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    '평점': ('rocket_rating',),
+    '리뷰수': ('rocket_reviews', 'Int64'),
+}
+
+
 def main():
     """메인 워크플로우 - 모든 로직 통합"""
     
@@ -54,90 +138,10 @@ def main():
     print(f"✅ {len(df):,}개 상품 로드")
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # [2] column_map 정의 (데이터 구조만 정의, 그룹은 자동)
+    # [2] column_map (모듈 상단 COLUMN_MAP - report_jobs와 공유)
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     print(f"\n[2/3] column_map 정의 중...")
-    
-    column_map = {
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 1. 코어 정보 (6개)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        '매칭상태': ('matching_status',),
-        '신뢰도': ('matching_confidence',),
-        '품번': ('iherb_part_number',),
-        'UPC': ('iherb_upc', 'Int64'),
-        'Product_ID': ('product_id',),  # 🔥 공통 ID
-        '판매상태': ('iherb_stock_status',),
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 2. 카테고리 (2개)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        '로켓_카테고리': ('rocket_category',),
-        '아이허브_카테고리': ('iherb_category',),
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 3. 링크 (2개)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        '로켓_링크': ('rocket_url',),
-        '아이허브_링크': ('iherb_url',),
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 4. 순위 (1개)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        '순위': ('rocket_rank', 'Int64'),
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 5. 판매/위너 (6개)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        '판매량': ('iherb_sales_quantity', 'Int64'),
-        '매출(원)': ('iherb_revenue', 'Int64'),
-        '아이템위너비율': ('iherb_item_winner_ratio',),
-        '재고': ('iherb_stock', 'Int64'),
-        '매출비중': ('iherb_revenue', 'share'),
-        '판매량비중': ('iherb_sales_quantity', 'share'),
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 6. 할인전략 (6개) - 할인율 제외
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        '가격격차(원)': ('price_diff', 'Int64'),
-        '손익분기할인율': ('breakeven_discount_rate',),
-        '추천할인율': ('recommended_discount_rate',),
-        '요청할인율': ('requested_discount_rate',),
-        '유리한곳': ('cheaper_source',),
-        '쿠팡추천가': ('iherb_recommended_price', 'Int64'),
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 7. 제품명 (2개)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        '로켓_제품명': ('rocket_product_name',),
-        '아이허브_제품명': ('iherb_product_name',),
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 8. ID (4개)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        '로켓_Vendor': ('rocket_vendor_id',),
-        '로켓_Item': ('rocket_item_id',),
-        '아이허브_Vendor': ('iherb_vendor_id',),
-        '아이허브_Item': ('iherb_item_id',),
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 9. 가격상태 (6개) - 🔥 할인율 포함
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        '정가': ('rocket_original_price', 'Int64'),
-        '로켓가격': ('rocket_price', 'Int64'),
-        '로켓할인율': ('rocket_discount_rate',),  # 🔥 builders.py 패턴: "할인율" → "가격상태"
-        '판매가': ('iherb_price', 'Int64'),
-        '정가_아이허브': ('iherb_original_price', 'Int64'),
-        '아이허브할인율': ('iherb_discount_rate',),  # 🔥 builders.py 패턴: "할인율" → "가격상태"
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 10. 평가 (2개)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        '평점': ('rocket_rating',),
-        '리뷰수': ('rocket_reviews', 'Int64'),
-    }
-    
-    print(f"✅ {len(column_map)}개 컬럼 정의")
+    print(f"✅ {len(COLUMN_MAP)}개 컬럼 정의")
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # [3] Excel 생성 (Excel Layer에 전부 위임)
@@ -146,8 +150,8 @@ def main():
     
     config, output_df = quick_build(
         df, 
-        column_map,
-        freeze_panes=(3, 3)  # 2단 헤더: C3
+        COLUMN_MAP,
+        freeze_panes=FREEZE_PANES
     )
     
     Config.OUTPUT_DIR.mkdir(exist_ok=True)
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+리포트 병렬 생성 (Report Job Runner)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+날짜별 / 카테고리별 워크북을 프로세스 풀에서 동시에 렌더링
+
+  1. 필요한 스냅샷 뷰를 날짜당 1번만 로드 (DataManager 1개)
+  2. 리포트 종류별 뷰 준비 (가격 비교: 비중 컬럼 / 가격 비교 2: 메트릭 컬럼)
+  3. 작업(워크북 1개)마다 필요한 행만 잘라 워커 프로세스로 전달
+  4. 워커는 create_excel_report / ExcelRenderer로 파일 1개 기록
+
+📌 xlsx 파일 하나는 한 프로세스만 쓸 수 있음
+  - 날짜 시트를 한 파일로 합치는 작업 → 워커 1개가 시트를 모아 한 번에 기록
+  - --split-dates → 날짜마다 별도 파일 (날짜 수만큼 병렬)
+
+사용법:
+    python analysis/report_jobs.py --dates 3 --by-category --workers 4
+    python analysis/report_jobs.py --reports price_comparison --dates 7 --split-dates
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.data_manager import DataManager
+from src.metrics.core import MetricsManager
+from analysis.excel import quick_build, ExcelRenderer
+from analysis.price_comparison import add_share_columns, create_excel_report, get_available_dates
+from analysis.price_comparison_2 import COLUMN_MAP, FREEZE_PANES
+
+
+REPORT_KINDS = ['price_comparison', 'price_comparison_2']
+
+
+@dataclass
+class ReportJob:
+    """작업 1개 = 워크북 1개"""
+    kind: str                       # 'price_comparison' / 'price_comparison_2'
+    output_path: str
+    dates: List[str] = field(default_factory=list)  # price_comparison: 날짜별 시트 / price_comparison_2: 첫 날짜
+    category: Optional[str] = None  # None이면 전체
+
+
+UNCATEGORIZED = "미분류"  # 로켓/아이허브 카테고리 모두 없는 행
+
+
+def category_of(df: pd.DataFrame) -> pd.Series:
+    """행별 카테고리 (로켓 카테고리 우선, 없으면 아이허브 카테고리, 둘 다 없으면 미분류)"""
+    def clean(col):
+        # category dtype는 서로 카테고리 집합이 달라 object로 합침 (빈 문자열은 결측 취급)
+        if col not in df.columns:
+            return pd.Series(index=df.index, dtype=object)
+        values = df[col].astype(object)
+        return values.where(values.notna() & (values.astype(str).str.strip() != ''))
+
+    return clean('rocket_category').fillna(clean('iherb_category')).fillna(UNCATEGORIZED)
+
+
+def _file_token(text: str) -> str:
+    """파일명용 문자열 (경로 구분자/공백 → _)"""
+    return re.sub(r'[\\/:*?"<>|\s]+', '_', str(text)).strip('_')
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 뷰 로드 (날짜당 1회)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def load_snapshot_views(db_path, dates: List[str], include_unmatched: bool = True) -> Dict[str, pd.DataFrame]:
+    """날짜별 스냅샷 뷰 (DB 조회 + 매칭/계산은 날짜당 1번)"""
+    dm = DataManager(str(db_path))
+    views = {}
+    for date_str in dates:
+        df = dm.get_snapshot_view(target_date=date_str, include_unmatched=include_unmatched)
+        if df.empty:
+            print(f"⚠️ {date_str}: 데이터 없음")
+            continue
+        views[date_str] = df
+    return views
+
+
+def prepare_report_views(
+    snapshot_views: Dict[str, pd.DataFrame],
+    kinds: List[str],
+) -> Dict[Tuple[str, str], pd.DataFrame]:
+    """
+    스냅샷 뷰 → 리포트 종류별 뷰
+
+    Returns:
+        {(kind, date): DataFrame}
+
+    ※ 비중은 워크북에 담기는 행 기준 (카테고리 작업은 job_frames에서 해당 카테고리 합계로 재계산,
+      price_comparison_2는 quick_build가 받은 행으로 계산 → 두 리포트 기준 동일)
+    """
+    metrics = MetricsManager(data_manager=None)  # DB 조회 없이 컬럼 선택만
+    prepared = {}
+    for date_str, df in snapshot_views.items():
+        # 메트릭 뷰는 비중/정수 변환 전 원본에서 복사
+        if 'price_comparison_2' in kinds:
+            prepared[('price_comparison_2', date_str)] = metrics.project_snapshot_view(df, ['all'])
+        if 'price_comparison' in kinds:
+            prepared[('price_comparison', date_str)] = add_share_columns(df)
+    return prepared
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 작업 계획
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def plan_jobs(
+    dates: List[str],
+    kinds: List[str],
+    output_dir,
+    categories: Optional[List[str]] = None,
+    split_dates: bool = False,
+) -> List[ReportJob]:
+    """
+    작업 목록 생성
+
+    Args:
+        dates: 스냅샷 날짜 (최신 → 과거)
+        kinds: 리포트 종류
+        output_dir: 출력 폴더
+        categories: 카테고리별 파일 (None이면 전체 1개)
+        split_dates: 가격 비교 리포트를 날짜별 파일로 분리 (기본: 날짜별 시트 1파일)
+    """
+    output_dir = Path(output_dir)
+    today = datetime.now().strftime('%Y%m%d')
+    jobs = []
+
+    for category in (categories or [None]):
+        suffix = f"_{_file_token(category)}" if category else ""
+
+        if 'price_comparison' in kinds:
+            if split_dates:
+                for date_str in dates:
+                    name = f"rocket_vs_iherb_{date_str.replace('-', '')}{suffix}.xlsx"
+                    jobs.append(ReportJob('price_comparison', str(output_dir / name), [date_str], category))
+            else:
+                name = f"rocket_vs_iherb_{today}{suffix}.xlsx"
+                jobs.append(ReportJob('price_comparison', str(output_dir / name), list(dates), category))
+
+        if 'price_comparison_2' in kinds:
+            # 단일 스냅샷 리포트 → 날짜마다 파일 1개
+            targets = dates if split_dates else dates[:1]
+            for date_str in targets:
+                name = f"price_comparison_{date_str.replace('-', '')}{suffix}.xlsx"
+                jobs.append(ReportJob('price_comparison_2', str(output_dir / name), [date_str], category))
+
+    return jobs
+
+
+def job_frames(job: ReportJob, views: Dict[Tuple[str, str], pd.DataFrame]) -> List[Tuple[str, pd.DataFrame]]:
+    """작업에 필요한 (날짜, DataFrame) - 카테고리 작업은 해당 행만 (워커로 보내는 데이터 최소화)
+
+    카테고리 작업의 가격 비교 비중은 잘라낸 행 기준으로 다시 계산 (카테고리 내 비중)
+    """
+    frames = []
+    for date_str in job.dates:
+        df = views.get((job.kind, date_str))
+        if df is None or df.empty:
+            continue
+        if job.category is not None:
+            df = df[(category_of(df) == job.category).to_numpy()].reset_index(drop=True)
+            if df.empty:
+                continue
+            if job.kind == 'price_comparison':
+                df = add_share_columns(df)
+        frames.append((date_str, df))
+    return frames
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 렌더링 (워커 프로세스)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def render_job(job: ReportJob, frames: List[Tuple[str, pd.DataFrame]]) -> dict:
+    """
+    워크북 1개 렌더링 (프로세스 풀에서 호출되므로 모듈 최상위 함수)
+
+    Returns:
+        {'path': str, 'success': bool, 'rows': int, 'seconds': float, 'error': str}
+    """
+    start = time.perf_counter()
+    result = {'path': job.output_path, 'success': False, 'rows': 0, 'seconds': 0.0, 'error': None}
+
+    try:
+        if not frames:
+            result['error'] = "데이터 없음"
+            return result
+
+        if job.kind == 'price_comparison':
+            create_excel_report(dict(frames), job.output_path)
+            result['rows'] = sum(len(df) for _, df in frames)
+            result['success'] = True
+
+        elif job.kind == 'price_comparison_2':
+            _, df = frames[0]
+            config, output_df = quick_build(df, COLUMN_MAP, freeze_panes=FREEZE_PANES)
+            rendered = ExcelRenderer(job.output_path).render(output_df, config)
+            result['rows'] = rendered.get('rows', 0)
+            result['success'] = rendered['success']
+            result['error'] = rendered.get('error')
+
+        else:
+            result['error'] = f"알 수 없는 리포트 종류: {job.kind}"
+
+    except Exception as e:
+        result['error'] = str(e)
+
+    finally:
+        result['seconds'] = round(time.perf_counter() - start, 2)
+
+    return result
+
+
+def run_report_jobs(
+    jobs: List[ReportJob],
+    views: Dict[Tuple[str, str], pd.DataFrame],
+    workers: Optional[int] = None,
+) -> List[dict]:
+    """
+    작업 실행
+
+    Args:
+        jobs: plan_jobs 결과
+        views: prepare_report_views 결과
+        workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행)
+
+    Returns:
+        render_job 결과 목록 (jobs 순서)
+    """
+    if not jobs:
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    print(f"\n🚀 리포트 {len(jobs)}개 생성 (워커 {workers}개)")
+
+    for job in jobs:
+        Path(job.output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    if workers <= 1:
+        results = [render_job(job, job_frames(job, views)) for job in jobs]
+    else:
+        results = [None] * len(jobs)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(render_job, job, job_frames(job, views)): i
+                for i, job in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:  # 워커 프로세스 비정상 종료 등
+                    results[i] = {'path': jobs[i].output_path, 'success': False, 'rows': 0,
+                                  'seconds': 0.0, 'error': str(e)}
+
+    for result in results:
+        if result['success']:
+            print(f"   ✓ {Path(result['path']).name} ({result['rows']:,}행, {result['seconds']}초)")
+        else:
+            print(f"   ✗ {Path(result['path']).name}: {result['error']}")
+
+    return results
+
+
+def main():
+    """메인 함수"""
+    from config.settings import Config
+
+    parser = argparse.ArgumentParser(description="날짜별/카테고리별 리포트 병렬 생성")
+    parser.add_argument('--reports', nargs='+', default=REPORT_KINDS, choices=REPORT_KINDS)
+    parser.add_argument('--dates', type=int, default=1, help="최신 스냅샷 날짜 수")
+    parser.add_argument('--by-category', action='store_true', help="카테고리별 파일 생성")
+    parser.add_argument('--split-dates', action='store_true', help="날짜별 파일 생성 (기본: 날짜별 시트)")
+    parser.add_argument('--workers', type=int, default=int(os.getenv('REPORT_WORKERS', '0')) or None,
+                        help="프로세스 수 (기본: CPU 수, 환경변수 REPORT_WORKERS)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+
+    dates = get_available_dates(Config.INTEGRATED_DB_PATH)[:args.dates]
+    if not dates:
+        print("❌ 사용 가능한 날짜가 없습니다.")
+        return
+
+    print(f"\n{'='*80}")
+    print(f"📊 리포트 병렬 생성: {', '.join(args.reports)}")
+    print(f"{'='*80}")
+    print(f"처리 날짜: {', '.join(dates)}")
+
+    snapshot_views = load_snapshot_views(Config.INTEGRATED_DB_PATH, dates)
+    if not snapshot_views:
+        print("\n❌ 생성할 데이터가 없습니다.")
+        return
+
+    categories = None
+    if args.by_category:
+        categories = sorted({c for df in snapshot_views.values() for c in category_of(df).unique()})
+        print(f"카테고리: {len(categories)}개")
+
+    views = prepare_report_views(snapshot_views, args.reports)
+    jobs = plan_jobs(list(snapshot_views), args.reports, Config.OUTPUT_DIR, categories, args.split_dates)
+    results = run_report_jobs(jobs, views, args.workers)
+
+    ok = sum(1 for r in results if r['success'])
+    print(f"\n✅ {ok}/{len(results)}개 완료 ({time.perf_counter() - started:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,5 +8,6 @@ Data Manager Package
 """
 
 from .core import DataManager
+from .dtypes import apply_dtypes, memory_report
 
-__all__ = ['DataManager']
\ No newline at end of file
+__all__ = ['DataManager', 'apply_dtypes', 'memory_report']
\ No newline at end of file
@@ -9,29 +9,51 @@ Price Calculator
 
 import pandas as pd
 import numpy as np
+from typing import Collection, Optional
+
+
+# 계산 결과 컬럼 (추가 순서 유지)
+OUTPUT_COLUMNS = [
+    'price_diff',
+    'price_diff_pct',
+    'cheaper_source',
+    'breakeven_discount_rate',
+    'recommended_discount_rate',
+    'requested_discount_rate',
+]
 
 
 class PriceCalculator:
     """가격 비교 계산"""
     
     @staticmethod
-    def calculate_price_comparison(df: pd.DataFrame) -> pd.DataFrame:
+    def calculate_price_comparison(df: pd.DataFrame, columns: Optional[Collection[str]] = None) -> pd.DataFrame:
         """가격 비교 계산 (기존 data_manager 로직)
         
         Args:
             df: 통합 DataFrame
+            columns: 필요한 컬럼 (None이면 OUTPUT_COLUMNS 전체 계산)
         
         Returns:
             가격 비교 컬럼이 추가된 DataFrame
         """
         
+        outputs = [c for c in OUTPUT_COLUMNS if columns is None or c in columns]
+        if not outputs:
+            return df
+        
         df = df.copy()
         
+        def numeric(col):
+            if col in df.columns:
+                return pd.to_numeric(df[col], errors='coerce')
+            return pd.Series(np.nan, index=df.index)
+        
         # 가격 변수
-        rp = pd.to_numeric(df.get('rocket_price', 0), errors='coerce')
-        ip = pd.to_numeric(df.get('iherb_price', 0), errors='coerce')
-        op = pd.to_numeric(df.get('iherb_original_price', 0), errors='coerce')
-        rec_p = pd.to_numeric(df.get('iherb_recommended_price', 0), errors='coerce')
+        rp = numeric('rocket_price')
+        ip = numeric('iherb_price')
+        op = numeric('iherb_original_price')
+        rec_p = numeric('iherb_recommended_price')
         
         # 유효성 체크
         valid = rp.gt(0) & ip.gt(0)
@@ -39,45 +61,47 @@ class PriceCalculator:
         valid_req = op.gt(0) & rec_p.gt(0)
         
         # 초기화
-        df['price_diff'] = pd.NA
-        df['price_diff_pct'] = pd.NA
-        df['cheaper_source'] = pd.NA
-        df['breakeven_discount_rate'] = pd.NA
-        df['recommended_discount_rate'] = pd.NA
-        df['requested_discount_rate'] = pd.NA
+        for col in outputs:
+            df[col] = pd.NA
         
         # 가격 차이
         diff = (ip - rp).where(valid).astype('float')
-        pct = (diff / rp * 100).where(valid).replace([np.inf, -np.inf], np.nan).round(1)
+        
+        if 'price_diff' in outputs:
+            df.loc[valid, 'price_diff'] = diff[valid]
+        
+        if 'price_diff_pct' in outputs:
+            pct = (diff / rp * 100).where(valid).replace([np.inf, -np.inf], np.nan).round(1)
+            df.loc[valid, 'price_diff_pct'] = pct[valid]
         
         # 손익분기 할인율 (로켓 가격에 맞추려면)
-        breakeven = ((ip - rp) / ip * 100).where(valid).replace([np.inf, -np.inf], np.nan).round(1)
+        if 'breakeven_discount_rate' in outputs:
+            breakeven = ((ip - rp) / ip * 100).where(valid).replace([np.inf, -np.inf], np.nan).round(1)
+            df.loc[valid, 'breakeven_discount_rate'] = breakeven[valid]
         
         # 추천 할인율 (판매가 기준)
-        recommended = ((ip - rec_p) / ip * 100).where(valid_rec).replace([np.inf, -np.inf], np.nan).round(1)
+        if 'recommended_discount_rate' in outputs:
+            recommended = ((ip - rec_p) / ip * 100).where(valid_rec).replace([np.inf, -np.inf], np.nan).round(1)
+            df.loc[valid_rec, 'recommended_discount_rate'] = recommended[valid_rec]
         
         # 요청 할인율 (정가 기준)
-        requested = ((op - rec_p) / op * 100).where(valid_req).replace([np.inf, -np.inf], np.nan).round(1)
-        
-        # 값 할당
-        df.loc[valid, 'price_diff'] = diff[valid]
-        df.loc[valid, 'price_diff_pct'] = pct[valid]
-        df.loc[valid, 'breakeven_discount_rate'] = breakeven[valid]
-        df.loc[valid_rec, 'recommended_discount_rate'] = recommended[valid_rec]
-        df.loc[valid_req, 'requested_discount_rate'] = requested[valid_req]
+        if 'requested_discount_rate' in outputs:
+            requested = ((op - rec_p) / op * 100).where(valid_req).replace([np.inf, -np.inf], np.nan).round(1)
+            df.loc[valid_req, 'requested_discount_rate'] = requested[valid_req]
         
         # 유리한 곳
-        df.loc[valid, 'cheaper_source'] = np.where(
-            df.loc[valid, 'price_diff'] > 0, '로켓직구',
-            np.where(df.loc[valid, 'price_diff'] < 0, '아이허브', '동일')
-        )
-        
-        # 통계
-        if valid.sum() > 0:
-            cheaper_counts = df.loc[valid, 'cheaper_source'].value_counts()
-            print(f"\n   💰 가격 경쟁력:")
-            for source, count in cheaper_counts.items():
-                pct_val = count / valid.sum() * 100
-                print(f"      • {source}: {count:,}개 ({pct_val:.1f}%)")
-        
-        return df
\ No newline at end of file
+        if 'cheaper_source' in outputs:
+            df.loc[valid, 'cheaper_source'] = np.where(
+                diff[valid] > 0, '로켓직구',
+                np.where(diff[valid] < 0, '아이허브', '동일')
+            )
+            
+            # 통계
+            if valid.sum() > 0:
+                cheaper_counts = df.loc[valid, 'cheaper_source'].value_counts()
+                print(f"\n   💰 가격 경쟁력:")
+                for source, count in cheaper_counts.items():
+                    pct_val = count / valid.sum() * 100
+                    print(f"      • {source}: {count:,}개 ({pct_val:.1f}%)")
+        
+        return df
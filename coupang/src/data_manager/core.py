@@ -14,11 +14,17 @@ DataManager Core
 """
 
 import pandas as pd
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Collection, Set
 
 from .db_loader import DataLoader
 from .matcher import ProductMatcher
 from .calculator import PriceCalculator
+from .dtypes import apply_dtypes, memory_report
+
+
+# 컬럼 프로젝션과 무관하게 항상 로드 (매칭 / 미매칭 판별 / 정렬 / 패널 키)
+ROCKET_KEY_COLUMNS = ["rocket_vendor_id", "rocket_product_id", "rocket_product_name"]
+IHERB_KEY_COLUMNS = ["iherb_vendor_id", "iherb_product_id", "iherb_product_name", "iherb_sales_quantity"]
 
 
 class DataManager:
@@ -60,6 +66,13 @@ class DataManager:
         sid = self.loader.get_latest_snapshot_id()
         return sid
 
+    @staticmethod
+    def _needed_columns(columns: Optional[Collection[str]]) -> Optional[Set[str]]:
+        """요청 컬럼 + 내부 필수 컬럼 (None이면 전체)"""
+        if columns is None:
+            return None
+        return set(columns) | set(ROCKET_KEY_COLUMNS) | set(IHERB_KEY_COLUMNS)
+
     # ------------------------------------------------------------------
     # 1) 단일 스냅샷 뷰 (기존 get_integrated_df 로직 → get_snapshot_view로 이동)
     # ------------------------------------------------------------------
@@ -68,6 +81,8 @@ class DataManager:
         target_date: Optional[str] = None,
         snapshot_id: Optional[int] = None,
         include_unmatched: bool = True,
+        columns: Optional[Collection[str]] = None,
+        typed: bool = True,
     ) -> pd.DataFrame:
         """
         단일 스냅샷 통합 뷰 생성
@@ -76,6 +91,9 @@ class DataManager:
             target_date: 특정 날짜 (YYYY-MM-DD) – None이면 최신 snapshot
             snapshot_id: 특정 snapshot ID (지정 시 target_date보다 우선)
             include_unmatched: 아이허브 미매칭 상품 포함 여부
+            columns: 필요한 컬럼 (파생 컬럼은 원천 컬럼 포함, metrics.schema.required_columns)
+                     None이면 전체. 지정 시 SELECT / URL / 할인율 / 가격 비교 계산을 이 범위로 제한
+            typed: 타입 스키마 적용 여부 (dtypes.apply_dtypes - category / Int32 / Arrow 문자열)
 
         Returns:
             통합 DataFrame
@@ -86,9 +104,10 @@ class DataManager:
         if sid is None:
             return pd.DataFrame()
 
-        # 2. 로켓 / 아이허브 데이터 로드
-        df_rocket = self.loader.load_rocket_data(sid)
-        df_iherb = self.loader.load_iherb_data(sid)
+        # 2. 로켓 / 아이허브 데이터 로드 (필요한 컬럼만)
+        needed = self._needed_columns(columns)
+        df_rocket = self.loader.load_rocket_data(sid, needed)
+        df_iherb = self.loader.load_iherb_data(sid, needed)
 
         if df_rocket.empty and df_iherb.empty:
             return pd.DataFrame()
@@ -183,17 +202,18 @@ class DataManager:
             return df_final
 
         # 5. 가격 비교 / 할인율 계산을 "최종 df_final" 전체에 한 번만 적용
-        df_final = self.calculator.calculate_price_comparison(df_final)
+        df_final = self.calculator.calculate_price_comparison(df_final, needed)
 
         # 6. 공통 product_id 생성 (로켓 우선, 없으면 아이허브)
-        if "rocket_product_id" not in df_final.columns:
-            df_final["rocket_product_id"] = pd.NA
-        if "iherb_product_id" not in df_final.columns:
-            df_final["iherb_product_id"] = pd.NA
-
-        df_final["product_id"] = df_final["rocket_product_id"].combine_first(
-            df_final["iherb_product_id"]
-        )
+        if needed is None or "product_id" in needed:
+            if "rocket_product_id" not in df_final.columns:
+                df_final["rocket_product_id"] = pd.NA
+            if "iherb_product_id" not in df_final.columns:
+                df_final["iherb_product_id"] = pd.NA
+
+            df_final["product_id"] = df_final["rocket_product_id"].combine_first(
+                df_final["iherb_product_id"]
+            )
 
         # 7. 기본 정렬: 매칭 우선, 그 안에서는 판매량(오늘) 기준 내림차순
         if "matching_status" in df_final.columns:
@@ -216,6 +236,10 @@ class DataManager:
 
             df_final = df_final.drop(columns=["_sort_key"]).reset_index(drop=True)
 
+        # 8. 타입 스키마 적용 (object → category / nullable 정수 / 문자열)
+        if typed:
+            df_final = apply_dtypes(df_final)
+
         return df_final
 
     def get_integrated_df(
@@ -234,6 +258,28 @@ class DataManager:
             include_unmatched=include_unmatched,
         )
 
+    def memory_report(
+        self,
+        target_date: Optional[str] = None,
+        snapshot_id: Optional[int] = None,
+        days: int = 90,
+    ) -> pd.DataFrame:
+        """
+        스냅샷 1개 기준 컬럼별 메모리 (타입 적용 전/후) + days일 패널 예상치 출력
+
+        Returns:
+            memory_report 결과 DataFrame (빈 스냅샷이면 빈 DataFrame)
+        """
+        df_raw = self.get_snapshot_view(
+            target_date=target_date,
+            snapshot_id=snapshot_id,
+            typed=False,
+        )
+        if df_raw.empty:
+            return pd.DataFrame()
+
+        return memory_report(apply_dtypes(df_raw), baseline=df_raw, days=days)
+
     # ------------------------------------------------------------------
     # 2) 여러 스냅샷(panel) 뷰
     # ------------------------------------------------------------------
@@ -242,6 +288,7 @@ class DataManager:
         snapshot_ids: Optional[List[int]] = None,
         n_latest: int = 3,
         include_unmatched: bool = True,
+        columns: Optional[Collection[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         여러 스냅샷을 한 번에 가져오는 panel 기반 뷰.
@@ -255,6 +302,8 @@ class DataManager:
                 - 예: n_latest=3 → 최신 3개 스냅샷
             include_unmatched:
                 - 각 snapshot_view에서 미매칭 포함 여부
+            columns:
+                - 각 snapshot_view에 필요한 컬럼 (None이면 전체)
 
         Returns:
             panel: 리스트 형태
@@ -307,6 +356,7 @@ class DataManager:
             df = self.get_snapshot_view(
                 snapshot_id=sid,
                 include_unmatched=include_unmatched,
+                columns=columns,
             )
             if df is None or df.empty:
                 continue
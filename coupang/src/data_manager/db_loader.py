@@ -13,7 +13,54 @@ Data Loaders
 
 import sqlite3
 import pandas as pd
-from typing import Optional
+from typing import Collection, Dict, Optional
+
+
+# 출력 컬럼 → SELECT 식 (p: products / pr: product_price / f: product_features)
+ROCKET_SELECT: Dict[str, str] = {
+    'rocket_vendor_id': 'p.vendor_item_id',
+    'rocket_product_id': 'p.product_id',
+    'rocket_item_id': 'p.item_id',
+    'rocket_product_name': 'p.name',
+    'rocket_price': 'pr.rocket_price',
+    'rocket_original_price': 'pr.rocket_original_price',
+    'rocket_rank': 'f.rocket_rank',
+    'rocket_rating': 'f.rocket_rating',
+    'rocket_reviews': 'f.rocket_reviews',
+    'rocket_category': 'f.rocket_category',
+}
+
+IHERB_SELECT: Dict[str, str] = {
+    'iherb_vendor_id': 'p.vendor_item_id',
+    'iherb_product_id': 'p.product_id',
+    'iherb_item_id': 'p.item_id',
+    'iherb_product_name': 'p.name',
+    'iherb_part_number': 'p.part_number',
+    'iherb_upc': 'p.upc',
+    'iherb_price': 'pr.iherb_price',
+    'iherb_original_price': 'pr.iherb_original_price',
+    'iherb_recommended_price': 'pr.iherb_recommended_price',
+    'iherb_stock': 'f.iherb_stock',
+    'iherb_stock_status': 'f.iherb_stock_status',
+    'iherb_revenue': 'f.iherb_revenue',
+    'iherb_sales_quantity': 'f.iherb_sales_quantity',
+    'iherb_item_winner_ratio': 'f.iherb_item_winner_ratio',
+    'iherb_category': 'f.iherb_category',
+    'iherb_sales_quantity_last_7d': 'f.iherb_sales_quantity_last_7d',
+    'iherb_coupang_share_last_7d': 'f.iherb_coupang_share_last_7d',
+}
+
+
+def _wanted(column: str, columns: Optional[Collection[str]]) -> bool:
+    """columns가 None이면 전체"""
+    return columns is None or column in columns
+
+
+def _select_clause(select_map: Dict[str, str], columns: Optional[Collection[str]]) -> str:
+    """요청 컬럼만 SELECT 목록으로"""
+    return ",\n                ".join(
+        f"{expr} AS {name}" for name, expr in select_map.items() if _wanted(name, columns)
+    )
 
 
 class DataLoader:
@@ -22,22 +69,19 @@ class DataLoader:
     def __init__(self, db_path: str):
         self.db_path = db_path
     
-    def load_rocket_data(self, snapshot_id: int) -> pd.DataFrame:
-        """로켓직구 데이터 로드"""
+    def load_rocket_data(self, snapshot_id: int, columns: Optional[Collection[str]] = None) -> pd.DataFrame:
+        """로켓직구 데이터 로드
+        
+        Args:
+            snapshot_id: 스냅샷 ID
+            columns: 필요한 컬럼 (None이면 전체) - SELECT / URL / 할인율 계산을 이 범위로 제한
+        """
         conn = sqlite3.connect(self.db_path)
         
-        query = """
+        # 조인은 유지 (product_price: 대상 필터 / product_features: 순위 정렬)
+        query = f"""
             SELECT 
-                p.vendor_item_id AS rocket_vendor_id,
-                p.product_id AS rocket_product_id,
-                p.item_id AS rocket_item_id,
-                p.name AS rocket_product_name,
-                pr.rocket_price,
-                pr.rocket_original_price,
-                f.rocket_rank,
-                f.rocket_rating,
-                f.rocket_reviews,
-                f.rocket_category
+                {_select_clause(ROCKET_SELECT, columns)}
             FROM products p
             INNER JOIN product_price pr 
                 ON p.vendor_item_id = pr.vendor_item_id 
@@ -53,26 +97,29 @@ class DataLoader:
         conn.close()
         
         # URL 재구성
-        df['rocket_url'] = df.apply(
-            lambda row: self._compose_url(
-                row['rocket_product_id'],
-                row['rocket_item_id'],
-                row['rocket_vendor_id']
-            ) if pd.notna(row['rocket_product_id']) else None,
-            axis=1
-        )
+        if _wanted('rocket_url', columns):
+            df['rocket_url'] = df.apply(
+                lambda row: self._compose_url(
+                    row['rocket_product_id'],
+                    row['rocket_item_id'],
+                    row['rocket_vendor_id']
+                ) if pd.notna(row['rocket_product_id']) else None,
+                axis=1
+            )
         
         # 할인율 계산
-        df['rocket_discount_rate'] = 0.0
-        valid_price = (df['rocket_price'] > 0) & (df['rocket_original_price'] > 0)
-        df.loc[valid_price, 'rocket_discount_rate'] = (
-            (1 - df.loc[valid_price, 'rocket_price'] / 
-             df.loc[valid_price, 'rocket_original_price']) * 100
-        ).round(1)
+        if _wanted('rocket_discount_rate', columns):
+            df['rocket_discount_rate'] = 0.0
+            valid_price = (df['rocket_price'] > 0) & (df['rocket_original_price'] > 0)
+            df.loc[valid_price, 'rocket_discount_rate'] = (
+                (1 - df.loc[valid_price, 'rocket_price'] / 
+                 df.loc[valid_price, 'rocket_original_price']) * 100
+            ).round(1)
         
         # 통계
         print(f"   ✓ 로켓직구: {len(df):,}개 상품")
-        print(f"   ✓ Product ID 있음: {df['rocket_product_id'].notna().sum():,}개")
+        if 'rocket_product_id' in df.columns:
+            print(f"   ✓ Product ID 있음: {df['rocket_product_id'].notna().sum():,}개")
         
         if 'rocket_category' in df.columns:
             category_counts = df['rocket_category'].value_counts()
@@ -84,34 +131,23 @@ class DataLoader:
         
         return df
     
-    def load_iherb_data(self, snapshot_id: int) -> pd.DataFrame:
+    def load_iherb_data(self, snapshot_id: int, columns: Optional[Collection[str]] = None) -> pd.DataFrame:
         """아이허브 데이터 로드
         
         🔥 핵심 수정:
         - iherb_discount_rate 계산 추가
         - UPC/할인율 데이터 진단 통계 추가
+        
+        Args:
+            snapshot_id: 스냅샷 ID
+            columns: 필요한 컬럼 (None이면 전체) - SELECT / URL / 할인율 계산을 이 범위로 제한
         """
         conn = sqlite3.connect(self.db_path)
         
-        query = """
+        # 조인은 유지 (WHERE 조건이 product_price / product_features 모두 사용)
+        query = f"""
             SELECT 
-                p.vendor_item_id AS iherb_vendor_id,
-                p.product_id AS iherb_product_id,
-                p.item_id AS iherb_item_id,
-                p.name AS iherb_product_name,
-                p.part_number AS iherb_part_number,
-                p.upc AS iherb_upc,
-                pr.iherb_price,
-                pr.iherb_original_price,
-                pr.iherb_recommended_price,
-                f.iherb_stock,
-                f.iherb_stock_status,
-                f.iherb_revenue,
-                f.iherb_sales_quantity,
-                f.iherb_item_winner_ratio,
-                f.iherb_category,
-                f.iherb_sales_quantity_last_7d,
-                f.iherb_coupang_share_last_7d
+                {_select_clause(IHERB_SELECT, columns)}
             FROM products p
             LEFT JOIN product_price pr 
                 ON p.vendor_item_id = pr.vendor_item_id 
@@ -127,47 +163,53 @@ class DataLoader:
         conn.close()
         
         # URL 재구성
-        df['iherb_url'] = df.apply(
-            lambda row: self._compose_url(
-                row['iherb_product_id'],
-                row['iherb_item_id'],
-                row['iherb_vendor_id']
-            ) if pd.notna(row['iherb_product_id']) else None,
-            axis=1
-        )
+        if _wanted('iherb_url', columns):
+            df['iherb_url'] = df.apply(
+                lambda row: self._compose_url(
+                    row['iherb_product_id'],
+                    row['iherb_item_id'],
+                    row['iherb_vendor_id']
+                ) if pd.notna(row['iherb_product_id']) else None,
+                axis=1
+            )
         
         # 🔥 아이허브 할인율 계산 추가
-        df['iherb_discount_rate'] = 0.0
-        valid_price = (df['iherb_price'] > 0) & (df['iherb_original_price'] > 0)
-        
-        if valid_price.sum() > 0:
-            df.loc[valid_price, 'iherb_discount_rate'] = (
-                (1 - df.loc[valid_price, 'iherb_price'] / 
-                 df.loc[valid_price, 'iherb_original_price']) * 100
-            ).round(1)
+        if _wanted('iherb_discount_rate', columns):
+            df['iherb_discount_rate'] = 0.0
+            valid_price = (df['iherb_price'] > 0) & (df['iherb_original_price'] > 0)
+            
+            if valid_price.sum() > 0:
+                df.loc[valid_price, 'iherb_discount_rate'] = (
+                    (1 - df.loc[valid_price, 'iherb_price'] / 
+                     df.loc[valid_price, 'iherb_original_price']) * 100
+                ).round(1)
         
-        # 🔥 진단 통계 출력
+        # 🔥 진단 통계 출력 (로드한 컬럼만)
         print(f"   ✓ 아이허브: {len(df):,}개 상품")
-        print(f"   ✓ Product ID 있음: {df['iherb_product_id'].notna().sum():,}개")
-        print(f"   ✓ 정가 있음: {(df['iherb_original_price'] > 0).sum():,}개")
+        if 'iherb_product_id' in df.columns:
+            print(f"   ✓ Product ID 있음: {df['iherb_product_id'].notna().sum():,}개")
+        if 'iherb_original_price' in df.columns:
+            print(f"   ✓ 정가 있음: {(df['iherb_original_price'] > 0).sum():,}개")
         
         # 할인율 계산 통계
-        discount_calculated = (df['iherb_discount_rate'] > 0).sum()
-        if discount_calculated > 0:
-            print(f"   ✓ 할인율 계산됨: {discount_calculated:,}개 ({discount_calculated/len(df)*100:.1f}%)")
-            avg_discount = df[df['iherb_discount_rate'] > 0]['iherb_discount_rate'].mean()
-            print(f"   ✓ 평균 할인율: {avg_discount:.1f}%")
-        else:
-            print(f"   ⚠️  할인율 계산 불가: iherb_original_price 데이터가 없습니다")
-            print(f"   💡 해결: price_inventory 엑셀의 '할인율기준가' 컬럼 확인 필요")
+        if 'iherb_discount_rate' in df.columns:
+            discount_calculated = (df['iherb_discount_rate'] > 0).sum()
+            if discount_calculated > 0:
+                print(f"   ✓ 할인율 계산됨: {discount_calculated:,}개 ({discount_calculated/len(df)*100:.1f}%)")
+                avg_discount = df[df['iherb_discount_rate'] > 0]['iherb_discount_rate'].mean()
+                print(f"   ✓ 평균 할인율: {avg_discount:.1f}%")
+            else:
+                print(f"   ⚠️  할인율 계산 불가: iherb_original_price 데이터가 없습니다")
+                print(f"   💡 해결: price_inventory 엑셀의 '할인율기준가' 컬럼 확인 필요")
         
         # UPC 통계
-        upc_valid = df['iherb_upc'].notna().sum()
-        if upc_valid > 0:
-            print(f"   ✓ UPC 있음: {upc_valid:,}개 ({upc_valid/len(df)*100:.1f}%)")
-        else:
-            print(f"   ⚠️  UPC 데이터 없음")
-            print(f"   💡 해결: UPC 엑셀 파일(20251024_*.xlsx)을 로드해야 합니다")
+        if 'iherb_upc' in df.columns:
+            upc_valid = df['iherb_upc'].notna().sum()
+            if upc_valid > 0:
+                print(f"   ✓ UPC 있음: {upc_valid:,}개 ({upc_valid/len(df)*100:.1f}%)")
+            else:
+                print(f"   ⚠️  UPC 데이터 없음")
+                print(f"   💡 해결: UPC 엑셀 파일(20251024_*.xlsx)을 로드해야 합니다")
         
         # 카테고리 분포
         if 'iherb_category' in df.columns:
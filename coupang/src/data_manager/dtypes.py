@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Column Dtypes
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+통합 뷰 컬럼 타입 스키마 + 메모리 리포트
+
+  - 반복 문자열 (매칭 상태 / 카테고리 / 재고 상태 등) → category
+  - 가격 / 수량 → nullable Int32 / Int64
+  - ID / 상품명 / URL → Arrow 문자열 (pyarrow 미설치 시 python 문자열)
+  - 비율 / 평점 → float64
+
+매처(iterrows)와 PriceCalculator(pd.NA 초기화)를 거치면 대부분 object가 되므로
+get_snapshot_view 마지막에 한 번 적용한다.
+"""
+
+import pandas as pd
+from typing import Dict, Optional
+
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = pd.StringDtype("pyarrow")
+except ImportError:
+    STRING_DTYPE = pd.StringDtype("python")
+
+
+# 저카디널리티 문자열
+CATEGORY_COLUMNS = [
+    'matching_status',
+    'matching_method',
+    'matching_confidence',
+    'rocket_category',
+    'iherb_category',
+    'iherb_stock_status',
+    'cheaper_source',
+]
+
+# 가격 / 수량 (원 단위 가격은 Int32 범위 안, 매출은 Int64)
+INTEGER_COLUMNS: Dict[str, str] = {
+    'rocket_price': 'Int32',
+    'rocket_original_price': 'Int32',
+    'iherb_price': 'Int32',
+    'iherb_original_price': 'Int32',
+    'iherb_recommended_price': 'Int32',
+    'price_diff': 'Int32',
+    'rocket_rank': 'Int32',
+    'rocket_reviews': 'Int32',
+    'iherb_stock': 'Int32',
+    'iherb_sales_quantity': 'Int32',
+    'iherb_sales_quantity_last_7d': 'Int32',
+    'iherb_revenue': 'Int64',
+    'rocket_pack': 'Int32',
+    'rocket_unit': 'Int32',
+    'iherb_pack': 'Int32',
+    'iherb_unit': 'Int32',
+}
+
+# 비율 / 평점 / 용량
+FLOAT_COLUMNS = [
+    'rocket_rating',
+    'rocket_discount_rate',
+    'iherb_discount_rate',
+    'iherb_item_winner_ratio',
+    'iherb_coupang_share_last_7d',
+    'rocket_weight',
+    'iherb_weight',
+    'price_diff_pct',
+    'breakeven_discount_rate',
+    'recommended_discount_rate',
+    'requested_discount_rate',
+]
+
+# ID / 상품명 / URL
+STRING_COLUMNS = [
+    'product_id',
+    'rocket_vendor_id',
+    'rocket_product_id',
+    'rocket_item_id',
+    'rocket_product_name',
+    'rocket_url',
+    'iherb_vendor_id',
+    'iherb_product_id',
+    'iherb_item_id',
+    'iherb_product_name',
+    'iherb_url',
+    'iherb_part_number',
+    'iherb_upc',
+]
+
+
+def _to_integer(series: pd.Series, dtype: str) -> pd.Series:
+    """숫자 변환 후 nullable 정수 (소수점 값이 있으면 float64 유지)"""
+    numeric = pd.to_numeric(series, errors='coerce').astype('float64')
+    try:
+        return numeric.astype(dtype)
+    except (TypeError, ValueError, OverflowError):
+        return numeric
+
+
+def _to_string(series: pd.Series) -> pd.Series:
+    """문자열 변환 (결측은 NA 유지, 1386.0 같은 float ID는 정수 표기로)"""
+    def as_text(value):
+        if pd.isna(value):
+            return pd.NA
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+
+    return series.map(as_text).astype(STRING_DTYPE)
+
+
+def apply_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """통합 뷰에 타입 스키마 적용 (스키마에 없는 컬럼은 그대로)
+
+    Args:
+        df: get_snapshot_view 결과
+
+    Returns:
+        타입이 적용된 새 DataFrame
+    """
+    if df.empty:
+        return df
+
+    df = df.copy()
+
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(object).where(df[col].notna(), None).astype('category')
+
+    for col, dtype in INTEGER_COLUMNS.items():
+        if col in df.columns:
+            df[col] = _to_integer(df[col], dtype)
+
+    for col in FLOAT_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+
+    for col in STRING_COLUMNS:
+        if col in df.columns:
+            df[col] = _to_string(df[col])
+
+    return df
+
+
+def memory_report(df: pd.DataFrame, baseline: Optional[pd.DataFrame] = None, days: int = 90) -> pd.DataFrame:
+    """컬럼별 메모리 사용량 출력 + N일 패널 예상 사용량
+
+    Args:
+        df: 측정할 DataFrame (보통 apply_dtypes 결과)
+        baseline: 비교 대상 (보통 타입 적용 전 DataFrame)
+        days: 패널 예상 일수 (스냅샷 1개 × days)
+
+    Returns:
+        컬럼별 dtype / MB (baseline 지정 시 before_dtype / before_MB 포함) DataFrame
+    """
+    mb = 1024 * 1024
+    report = pd.DataFrame({
+        'dtype': df.dtypes.astype(str),
+        'MB': df.memory_usage(deep=True, index=False) / mb,
+    })
+    if baseline is not None:
+        report['before_dtype'] = baseline.dtypes.astype(str).reindex(report.index)
+        report['before_MB'] = (baseline.memory_usage(deep=True, index=False) / mb).reindex(report.index)
+    report = report.sort_values('MB', ascending=False)
+
+    total = report['MB'].sum()
+    print(f"\n💾 메모리 리포트 ({len(df):,}행 × {len(df.columns)}열)")
+    print(f"{'컬럼':<36}{'dtype':>16}{'MB':>10}", end='')
+    print(f"{'이전 dtype':>16}{'이전 MB':>10}" if baseline is not None else '')
+    for col, row in report.iterrows():
+        print(f"{col:<36}{row['dtype']:>16}{row['MB']:>10.2f}", end='')
+        print(f"{row['before_dtype']:>16}{row['before_MB']:>10.2f}" if baseline is not None else '')
+
+    print(f"\n   ✓ 스냅샷 1개: {total:,.2f}MB")
+    if baseline is not None:
+        before = report['before_MB'].sum()
+        if total > 0:
+            print(f"   ✓ 타입 적용 전: {before:,.2f}MB ({before / total:.1f}배)")
+    print(f"   ✓ {days}일 패널 예상: {total * days:,.1f}MB")
+
+    return report
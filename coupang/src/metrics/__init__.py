@@ -15,7 +15,9 @@ from .schema import (
     PERFORMANCE_ROLLING_7D,
     META_METRICS,
     ALL_METRICS,
-    METRIC_GROUPS
+    METRIC_GROUPS,
+    METRIC_DEPENDENCIES,
+    required_columns
 )
 
 __all__ = [
@@ -27,4 +29,6 @@ __all__ = [
     'META_METRICS',
     'ALL_METRICS',
     'METRIC_GROUPS',
+    'METRIC_DEPENDENCIES',
+    'required_columns',
 ]
\ No newline at end of file
@@ -10,7 +10,7 @@ Metrics Layer 표준 인터페이스
 from typing import List, Optional, Sequence
 import pandas as pd
 
-from .schema import METRIC_GROUPS
+from .schema import METRIC_GROUPS, required_columns
 from .temporal import build_snapshot_panel, compute_multiple_deltas, _sanitize_label
 
 
@@ -123,6 +123,27 @@ class MetricsManager:
             )
             return df_panel
     
+    def project_snapshot_view(
+        self,
+        df: pd.DataFrame,
+        metric_groups: Sequence[str] = ['all'],
+    ) -> pd.DataFrame:
+        """
+        이미 로드한 단일 스냅샷 뷰(DataManager.get_snapshot_view) → 메트릭 그룹 컬럼만
+        
+        같은 스냅샷으로 여러 리포트를 만들 때 DB 재조회 없이
+        get_view(n_latest=1)와 같은 결과를 얻기 위해 사용
+        """
+        if df.empty:
+            return df
+        return self._select_columns(df, self._resolve_metric_groups(metric_groups))
+    
+    @staticmethod
+    def _select_columns(df: pd.DataFrame, selected_metrics: List[str]) -> pd.DataFrame:
+        """필요한 컬럼만 선택 (존재하는 것만)"""
+        available = [c for c in selected_metrics if c in df.columns]
+        return df[available].copy()
+    
     def _resolve_metric_groups(self, groups: Sequence[str]) -> List[str]:
         """그룹명 → 실제 컬럼 리스트 변환"""
         if 'all' in groups:
@@ -153,23 +174,26 @@ class MetricsManager:
     ) -> pd.DataFrame:
         """단일 스냅샷 뷰"""
         
+        # 선택한 메트릭 계산에 필요한 컬럼만 로드
+        columns = required_columns(selected_metrics)
+        
         if snapshot_ids:
             sid = snapshot_ids[0]
             df = self.dm.get_snapshot_view(
                 snapshot_id=sid,
-                include_unmatched=include_unmatched
+                include_unmatched=include_unmatched,
+                columns=columns
             )
         else:
             df = self.dm.get_snapshot_view(
-                include_unmatched=include_unmatched
+                include_unmatched=include_unmatched,
+                columns=columns
             )
         
         if df.empty:
             return df
         
-        # 필요한 컬럼만 선택 (존재하는 것만)
-        available = [c for c in selected_metrics if c in df.columns]
-        return df[available].copy()
+        return self._select_columns(df, selected_metrics)
     
     def _get_panel_view(
         self,
@@ -183,11 +207,13 @@ class MetricsManager:
     ) -> pd.DataFrame:
         """복수 스냅샷 wide 패널 뷰"""
         
-        # 1. 패널 데이터 로드
+        # 1. 패널 데이터 로드 (Key + 선택 메트릭 계산에 필요한 컬럼만)
+        key_cols = ['iherb_vendor_id']  # 기본 키
         panels = self.dm.get_panel_views(
             snapshot_ids=snapshot_ids,
             n_latest=n_latest,
-            include_unmatched=include_unmatched
+            include_unmatched=include_unmatched,
+            columns=required_columns(key_cols + list(selected_metrics))
         )
         
         if not panels:
@@ -208,8 +234,7 @@ class MetricsManager:
         
         print(f"\n🏷️  라벨: {labels}")
         
-        # 3. Key 컬럼 결정 (조인 기준)
-        key_cols = ['iherb_vendor_id']  # 기본 키
+        # 3. Key 컬럼 결정 (조인 기준) - 1에서 결정한 key_cols
         
         # 🔥 핵심 수정: Key 컬럼을 selected_metrics에 자동 추가
         metrics_with_keys = list(key_cols) + [m for m in selected_metrics if m not in key_cols]
@@ -106,6 +106,45 @@ METRIC_GROUPS: Dict[str, List[str]] = {
 }
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 파생 메트릭 의존성 (컬럼 프로젝션 pushdown용)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 여기 없는 메트릭은 DB 컬럼 그대로 (원천 컬럼 = 자기 자신)
+# DataManager는 요청된 컬럼만 SELECT / 계산 (매칭·정렬용 컬럼은 DataManager가 직접 추가)
+
+METRIC_DEPENDENCIES: Dict[str, List[str]] = {
+    # DataLoader: URL 재구성 / 할인율
+    "rocket_url": ["rocket_product_id", "rocket_item_id", "rocket_vendor_id"],
+    "iherb_url": ["iherb_product_id", "iherb_item_id", "iherb_vendor_id"],
+    "rocket_discount_rate": ["rocket_price", "rocket_original_price"],
+    "iherb_discount_rate": ["iherb_price", "iherb_original_price"],
+    # PriceCalculator: 가격 비교
+    "price_diff": ["rocket_price", "iherb_price"],
+    "price_diff_pct": ["rocket_price", "iherb_price"],
+    "cheaper_source": ["rocket_price", "iherb_price"],
+    "breakeven_discount_rate": ["rocket_price", "iherb_price"],
+    "recommended_discount_rate": ["iherb_price", "iherb_recommended_price"],
+    "requested_discount_rate": ["iherb_original_price", "iherb_recommended_price"],
+    # DataManager: 공통 ID
+    "product_id": ["rocket_product_id", "iherb_product_id"],
+}
+
+
+def required_columns(metrics: List[str]) -> List[str]:
+    """메트릭 목록 → 로드/계산해야 할 컬럼 (파생 메트릭 + 원천 컬럼, 순서 유지)"""
+    resolved: List[str] = []
+    seen = set()
+    stack = list(reversed(list(metrics)))
+    while stack:
+        m = stack.pop()
+        if m in seen:
+            continue
+        seen.add(m)
+        resolved.append(m)
+        stack.extend(reversed(METRIC_DEPENDENCIES.get(m, [])))
+    return resolved
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 엑셀 출력용 메타데이터
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
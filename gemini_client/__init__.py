@@ -0,0 +1,38 @@
+"""
+Gemini Client - 공용 Gemini API 모듈
+
+쿼터(RPM/TPM) 인지형 asyncio 클라이언트
+
+사용 예시:
+    from gemini_client import get_shared_client
+
+    client = get_shared_client(api_key)
+    text = client.generate_text_sync("Say 'OK'")
+
+    # 동시 요청 (쿼터 한도까지 자동 조절)
+    results = await asyncio.gather(*[client.generate_text(p) for p in prompts])
+
+환경변수:
+    GEMINI_RPM: 분당 요청 한도 (기본 15)
+    GEMINI_TPM: 분당 토큰 한도 (기본 1,000,000)
+    GEMINI_API_ENDPOINT: API 엔드포인트 재지정 (로컬 fake 서버 테스트용)
+"""
+
+from .rate_limiter import TokenBucket
+from .client import (
+    GeminiClient,
+    UsageStats,
+    get_shared_client,
+    is_retryable_error,
+    estimate_tokens,
+)
+
+
+__all__ = [
+    'GeminiClient',
+    'UsageStats',
+    'TokenBucket',
+    'get_shared_client',
+    'is_retryable_error',
+    'estimate_tokens',
+]
@@ -0,0 +1,272 @@
+"""
+Gemini 공용 클라이언트
+- asyncio 인터페이스 (동기 호출부와 같은 버킷 공유)
+- RPM/TPM 토큰 버킷으로 쿼터 한도까지 동시 요청
+- 429/503 수신 시 jitter 포함 지수 백오프
+- usage_metadata 기반 토큰 사용량 집계
+"""
+
+import os
+import random
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Optional
+
+import google.generativeai as genai
+
+from .rate_limiter import TokenBucket
+
+
+# 기본 쿼터 (gemini-2.0-flash 무료 등급 기준, 환경변수로 조정)
+DEFAULT_RPM = int(os.getenv("GEMINI_RPM", "15"))
+DEFAULT_TPM = int(os.getenv("GEMINI_TPM", "1000000"))
+
+# API 엔드포인트 재지정 (로컬 fake 모델 서버 테스트용, REST 전송)
+DEFAULT_API_ENDPOINT = os.getenv("GEMINI_API_ENDPOINT")
+
+# 이미지 1장당 토큰 (Gemini 고정 과금 기준)
+IMAGE_TOKENS = 258
+
+RETRYABLE_CODES = (429, 503)
+RETRYABLE_KEYWORDS = ("429", "503", "RESOURCE_EXHAUSTED", "UNAVAILABLE", "overloaded")
+
+# genai.configure는 프로세스 전역 → 처음 설정한 (API 키, 엔드포인트)만 허용
+_configured = None
+_configure_lock = threading.Lock()
+
+
+@dataclass
+class UsageStats:
+    """누적 사용량"""
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """429(쿼터 초과) / 503(과부하) 여부"""
+    code = getattr(error, "code", None)
+    try:
+        if code is not None and int(code) in RETRYABLE_CODES:
+            return True
+    except (TypeError, ValueError):
+        pass
+
+    message = str(error)
+    return any(keyword in message for keyword in RETRYABLE_KEYWORDS)
+
+
+def configure_once(api_key: str, api_endpoint: Optional[str] = None):
+    """
+    genai 전역 설정 (프로세스당 1회)
+
+    다른 키/엔드포인트로 다시 설정하면 앞서 만든 클라이언트 설정을 덮어쓰므로 ValueError
+    """
+    global _configured
+    config = (api_key, api_endpoint)
+    with _configure_lock:
+        if _configured == config:
+            return
+        if _configured is not None:
+            raise ValueError("Gemini는 프로세스당 API 키/엔드포인트 1개만 사용 가능")
+        if api_endpoint:
+            genai.configure(api_key=api_key, transport="rest", client_options={"api_endpoint": api_endpoint})
+        else:
+            genai.configure(api_key=api_key)
+        _configured = config
+
+
+def estimate_tokens(contents: Any) -> int:
+    """요청 전 토큰 수 추정 (문자 3개 ≈ 1토큰, 이미지는 고정값)"""
+    if contents is None:
+        return 0
+    if isinstance(contents, str):
+        return max(1, len(contents) // 3)
+    if isinstance(contents, (list, tuple)):
+        return sum(estimate_tokens(part) for part in contents)
+    return IMAGE_TOKENS
+
+
+class GeminiClient:
+    """쿼터 인지형 Gemini 클라이언트 (같은 API 키를 쓰는 호출부끼리 공유)"""
+
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = "gemini-2.0-flash",
+        rpm: int = DEFAULT_RPM,
+        tpm: int = DEFAULT_TPM,
+        max_retries: int = 5,
+        base_delay: float = 2.0,
+        max_delay: float = 60.0,
+        api_endpoint: Optional[str] = DEFAULT_API_ENDPOINT,
+    ):
+        """
+        Args:
+            api_key: Gemini API 키
+            model_name: 모델명
+            rpm: 분당 요청 한도
+            tpm: 분당 토큰 한도
+            max_retries: 429/503 재시도 횟수
+            base_delay: 백오프 기본 대기 (초)
+            max_delay: 백오프 최대 대기 (초)
+            api_endpoint: API 엔드포인트 (예: "http://localhost:8080", 지정 시 REST 전송)
+        """
+        configure_once(api_key, api_endpoint)
+        self.model_name = model_name
+        self.model = genai.GenerativeModel(model_name)
+
+        self.request_bucket = TokenBucket.per_minute(rpm)
+        self.token_bucket = TokenBucket.per_minute(tpm)
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self.usage = UsageStats()
+        self._usage_lock = threading.Lock()
+
+    # ---------------------------------------------------------------------
+    # Public API
+    # ---------------------------------------------------------------------
+
+    async def generate(self, contents: Any, **kwargs) -> Any:
+        """
+        generate_content 비동기 호출 (쿼터 대기 + 재시도)
+
+        요청은 스레드에서 동기 generate_content로 보냄
+        (aio 채널은 처음 만든 이벤트 루프에 묶이고 REST 전송은 async 미지원)
+
+        Args:
+            contents: 프롬프트 문자열 또는 [프롬프트, 이미지, ...] 리스트
+            **kwargs: generate_content에 그대로 전달
+
+        Returns:
+            Gemini 응답 객체
+        """
+        estimated = estimate_tokens(contents)
+
+        for attempt in range(self.max_retries + 1):
+            await self.request_bucket.acquire(1)
+            await self.token_bucket.acquire(estimated)
+
+            try:
+                response = await asyncio.to_thread(self.model.generate_content, contents, **kwargs)
+            except Exception as e:
+                if not self._should_retry(e, attempt):
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            self._record_usage(response, estimated)
+            return response
+
+    def generate_sync(self, contents: Any, **kwargs) -> Any:
+        """generate_content 동기 호출 (기존 동기 호출부용, 같은 버킷 공유)"""
+        estimated = estimate_tokens(contents)
+
+        for attempt in range(self.max_retries + 1):
+            self.request_bucket.acquire_sync(1)
+            self.token_bucket.acquire_sync(estimated)
+
+            try:
+                response = self.model.generate_content(contents, **kwargs)
+            except Exception as e:
+                if not self._should_retry(e, attempt):
+                    raise
+                time.sleep(self._backoff(attempt))
+                continue
+
+            self._record_usage(response, estimated)
+            return response
+
+    async def generate_text(self, contents: Any, **kwargs) -> str:
+        """응답 텍스트만 반환"""
+        response = await self.generate(contents, **kwargs)
+        return response.text.strip()
+
+    def generate_text_sync(self, contents: Any, **kwargs) -> str:
+        """응답 텍스트만 반환 (동기)"""
+        response = self.generate_sync(contents, **kwargs)
+        return response.text.strip()
+
+    def usage_summary(self) -> str:
+        """사용량 요약 문자열"""
+        u = self.usage
+        return (
+            f"요청 {u.requests}회 (재시도 {u.retries}, 실패 {u.failures}) | "
+            f"토큰 input={u.prompt_tokens:,}, output={u.output_tokens:,}, total={u.total_tokens:,}"
+        )
+
+    # ---------------------------------------------------------------------
+    # Private Methods
+    # ---------------------------------------------------------------------
+
+    def _should_retry(self, error: Exception, attempt: int) -> bool:
+        retryable = is_retryable_error(error)
+
+        with self._usage_lock:
+            if retryable and attempt < self.max_retries:
+                self.usage.retries += 1
+            else:
+                self.usage.failures += 1
+
+        if not retryable or attempt >= self.max_retries:
+            return False
+
+        # 다른 동시 요청도 함께 쉬도록 버킷 비움
+        self.request_bucket.drain()
+        print(f"  [GEMINI] 쿼터/과부하 응답 → 백오프 ({attempt + 1}/{self.max_retries}): {str(error)[:80]}")
+        return True
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter 지수 백오프"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(self.base_delay / 2, ceiling)
+
+    def _record_usage(self, response: Any, estimated: int):
+        """usage_metadata 집계 + 예상 토큰과의 차액 정산"""
+        meta = getattr(response, "usage_metadata", None)
+        prompt_tokens = getattr(meta, "prompt_token_count", 0) or 0
+        output_tokens = getattr(meta, "candidates_token_count", 0) or 0
+        total_tokens = getattr(meta, "total_token_count", 0) or (prompt_tokens + output_tokens)
+
+        if total_tokens:
+            diff = total_tokens - estimated
+            if diff > 0:
+                self.token_bucket.consume(diff)
+            elif diff < 0:
+                self.token_bucket.refund(-diff)
+
+        with self._usage_lock:
+            self.usage.requests += 1
+            self.usage.prompt_tokens += prompt_tokens
+            self.usage.output_tokens += output_tokens
+            self.usage.total_tokens += total_tokens
+
+
+_shared_clients = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_client(api_key: str, model_name: str = "gemini-2.0-flash", **kwargs) -> GeminiClient:
+    """
+    (API 키, 모델) 단위 공용 클라이언트
+
+    쿼터는 API 키 단위이므로 호출부마다 클라이언트를 만들지 않고 공유
+    """
+    key = (api_key, model_name)
+    with _shared_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = GeminiClient(api_key, model_name=model_name, **kwargs)
+            _shared_clients[key] = client
+        return client
@@ -0,0 +1,104 @@
+"""
+Gemini 쿼터 관리 - 토큰 버킷
+RPM(분당 요청 수) / TPM(분당 토큰 수) 한도를 버킷 2개로 관리
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    토큰 버킷
+
+    - capacity 만큼 쌓이고, 초당 refill_rate 만큼 채워짐
+    - 스레드/이벤트 루프 구분 없이 공유 가능 (내부 잠금은 threading.Lock)
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Args:
+            capacity: 버킷 최대 크기
+            refill_rate: 초당 보충량
+        """
+        if capacity <= 0 or refill_rate <= 0:
+            raise ValueError("capacity, refill_rate는 0보다 커야 함")
+
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, limit: float) -> "TokenBucket":
+        """분당 한도로 생성 (버스트 = 1분 한도)"""
+        return cls(capacity=limit, refill_rate=limit / 60.0)
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+
+    def _reserve(self, amount: float) -> float:
+        """
+        amount 만큼 차감 시도
+
+        Returns:
+            0이면 차감 완료, 양수면 그만큼 더 기다려야 함 (초)
+        """
+        # 버킷보다 큰 요청은 버킷 전체를 쓰는 것으로 처리 (영구 대기 방지)
+        amount = min(float(amount), self.capacity)
+
+        with self._lock:
+            self._refill()
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) / self.refill_rate
+
+    async def acquire(self, amount: float = 1.0):
+        """비동기 대기 후 차감"""
+        while True:
+            wait = self._reserve(amount)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, amount: float = 1.0):
+        """동기 대기 후 차감"""
+        while True:
+            wait = self._reserve(amount)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def consume(self, amount: float):
+        """
+        대기 없이 차감 (음수 잔고 허용)
+
+        예상 토큰보다 실제 사용량이 많았을 때 차액 정산용
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+
+    def refund(self, amount: float):
+        """예상보다 적게 쓴 만큼 반환"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+    def drain(self):
+        """버킷 비우기 (429 수신 시 다른 요청도 함께 쉬도록)"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0)
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
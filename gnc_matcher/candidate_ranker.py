@@ -0,0 +1,385 @@
+"""
+쿠팡 후보 로컬 사전 랭킹
+✨ Gemini 호출 전 결정적(deterministic) 점수로 후보 정렬
+- 명확한 일치 → 로컬 자동 선택
+- 명확한 불일치 → 로컬 자동 거절
+- 애매한 경우만 상위 k개를 Gemini로 전달
+"""
+
+import re
+import sys
+import os
+import statistics
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from coupang_manager.selectors import CoupangHTMLHelper
+
+
+# 영문 → 한글 표기 (쿠팡 상품명은 한글 음차가 많음)
+KOREAN_ALIASES = {
+    'gnc': ['지엔씨'],
+    'fish': ['피쉬', '피시'],
+    'oil': ['오일'],
+    'omega': ['오메가'],
+    'triple': ['트리플'],
+    'strength': ['스트렝스', '스트렝쓰'],
+    'mega': ['메가'],
+    'men': ['맨', '남성'],
+    'women': ['우먼', '여성'],
+    'vitamin': ['비타민'],
+    'multivitamin': ['멀티비타민'],
+    'probiotic': ['프로바이오틱', '유산균'],
+    'collagen': ['콜라겐'],
+    'biotin': ['비오틴'],
+    'magnesium': ['마그네슘'],
+    'calcium': ['칼슘'],
+    'zinc': ['아연'],
+    'iron': ['철분'],
+    'lutein': ['루테인'],
+    'coq10': ['코큐텐', '코엔자임'],
+    'glucosamine': ['글루코사민'],
+    'protein': ['프로틴', '단백질'],
+    'krill': ['크릴'],
+    'garlic': ['마늘', '갈릭'],
+    'ginseng': ['인삼', '진생'],
+    'prenatal': ['임산부'],
+    'kids': ['키즈', '어린이'],
+    'energy': ['에너지'],
+    'sport': ['스포츠'],
+    'ultra': ['울트라'],
+}
+
+# 이름 비교에서 제외할 토큰 (정수 단위 등은 count로 따로 비교)
+STOPWORDS = {
+    'the', 'and', 'with', 'of', 'for', 'plus', 'formula', 'dietary', 'supplement',
+    'ct', 'count', 'tablets', 'tablet', 'capsules', 'capsule', 'caplets', 'caplet',
+    'softgels', 'softgel', 'caps', 'tabs', 'servings',
+}
+
+DOSE_PATTERN = r'(\d+(?:\.\d+)?)\s*(mg|mcg|iu|g|ml)\b'
+
+# 묶음 상품 신호 ("1개"는 낱개)
+BUNDLE_PATTERNS = [
+    r'(?<!\d)[2-9]\s*개(?!입)',
+    r'(?<!\d)[2-9]\s*병',
+    r'(?<!\d)[2-9]\s*통',
+    r'(?<![a-z])[x×]\s*[2-9](?!\d)',
+    r'(?<!\d)[2-9]\s*[x×]',
+    r'세트',
+    r'묶음',
+    r'(?<!\d)[2-9]\s*pack',
+]
+
+SINGLE_PATTERN = r'낱개|(?<!\d)1\s*(?:개|병|통)(?!입)'
+
+
+@dataclass
+class CandidateScore:
+    """후보 1개 점수"""
+    candidate: Any
+    score: float
+    features: Dict[str, float] = field(default_factory=dict)
+    rejected: bool = False
+    reasons: List[str] = field(default_factory=list)
+
+
+@dataclass
+class RankingResult:
+    """랭킹 결과"""
+    decision: str                     # 'accept', 'reject', 'ambiguous'
+    ranked: List[CandidateScore]
+    selected: Optional[Any] = None
+    top_k: List[Any] = field(default_factory=list)
+    reason: str = ""
+
+    @property
+    def top_score(self) -> float:
+        return self.ranked[0].score if self.ranked else 0.0
+
+
+def _normalize(text: str) -> str:
+    text = (text or "").lower()
+    text = re.sub(DOSE_PATTERN, lambda m: f" {m.group(1).replace('.', 'p')}{m.group(2)} ", text)
+    return re.sub(r'[^0-9a-z가-힣]+', ' ', text).strip()
+
+
+def _english_tokens(text: str) -> Set[str]:
+    tokens = set(re.findall(r'[0-9a-z]+', _normalize(text)))
+    return {t for t in tokens if t not in STOPWORDS and not t.isdigit()}
+
+
+def _compact_korean(text: str) -> str:
+    return re.sub(r'\s+', '', text or "").lower()
+
+
+class CandidateRanker:
+    """브랜드/이름/정수/단가/낱개 신호 기반 후보 랭킹"""
+
+    WEIGHTS = {
+        'brand': 0.20,
+        'name': 0.35,
+        'count': 0.30,
+        'unit_price': 0.05,
+        'single': 0.10,
+    }
+
+    def __init__(
+        self,
+        accept_threshold: float = 0.80,
+        reject_threshold: float = 0.25,
+        min_margin: float = 0.15,
+        top_k: int = 3,
+    ):
+        """
+        Args:
+            accept_threshold: 이 점수 이상 + 조건 충족 시 로컬 자동 선택
+            reject_threshold: 최고 점수가 이 미만이면 로컬 자동 거절
+            min_margin: 자동 선택 시 2위와의 최소 점수 차
+            top_k: 애매한 경우 Gemini로 보낼 후보 수
+        """
+        self.accept_threshold = accept_threshold
+        self.reject_threshold = reject_threshold
+        self.min_margin = min_margin
+        self.top_k = top_k
+
+    # ---------------------------------------------------------------------
+    # Public API
+    # ---------------------------------------------------------------------
+
+    def rank(self, gnc_product: Any, candidates: List[Any]) -> RankingResult:
+        """후보 정렬 + 로컬 판정"""
+        if not candidates:
+            return RankingResult(decision='reject', ranked=[], reason="후보 없음")
+
+        median_unit = self._median_unit_price(candidates)
+        scored = [self.score(gnc_product, c, median_unit) for c in candidates]
+
+        # 점수 내림차순, 동점이면 검색 순위 유지
+        ranked = sorted(scored, key=lambda s: (s.rejected, -s.score))
+        alive = [s for s in ranked if not s.rejected]
+
+        if not alive or alive[0].score < self.reject_threshold:
+            reasons = "; ".join(r for s in ranked[:3] for r in s.reasons[:1]) or "유사 후보 없음"
+            return RankingResult(decision='reject', ranked=ranked, reason=f"로컬 판정 - {reasons}")
+
+        best = alive[0]
+        second = alive[1].score if len(alive) > 1 else 0.0
+
+        if (
+            best.score >= self.accept_threshold
+            and best.score - second >= self.min_margin
+            and best.features.get('count') == 1.0
+            and best.features.get('brand') == 1.0
+        ):
+            return RankingResult(
+                decision='accept',
+                ranked=ranked,
+                selected=best.candidate,
+                top_k=[best.candidate],
+                reason=f"로컬 판정 - 브랜드, 제품명, 용량 일치 (점수 {best.score:.2f})",
+            )
+
+        return RankingResult(
+            decision='ambiguous',
+            ranked=ranked,
+            top_k=[s.candidate for s in alive[:self.top_k]],
+            reason=f"로컬 판정 보류 (1위 {best.score:.2f}, 2위 {second:.2f})",
+        )
+
+    def score(self, gnc_product: Any, candidate: Any, median_unit: Optional[float] = None) -> CandidateScore:
+        """후보 1개 점수 계산"""
+        name = getattr(candidate, 'name', '') or ''
+        gnc_name = getattr(gnc_product, 'product_name', '') or ''
+        gnc_brand = getattr(gnc_product, 'brand', '') or ''
+        gnc_count = getattr(gnc_product, 'count', None)
+
+        result = CandidateScore(candidate=candidate, score=0.0)
+        f = result.features
+
+        f['brand'] = self._brand_score(gnc_brand, name)
+        if f['brand'] == 0.0:
+            result.reasons.append("브랜드 불일치")
+
+        f['name'] = self._name_score(gnc_name, name)
+
+        coupang_count = CoupangHTMLHelper.extract_count(name)
+        f['count'] = self._count_score(gnc_count, coupang_count)
+        if f['count'] == 0.0:
+            result.rejected = True
+            result.reasons.append(f"용량 불일치 ({gnc_count} vs {coupang_count})")
+
+        is_bundle = self.is_bundle(name)
+        f['single'] = 0.0 if is_bundle else (1.0 if re.search(SINGLE_PATTERN, name) else 0.7)
+        if is_bundle:
+            result.rejected = True
+            result.reasons.append("묶음 상품")
+
+        f['unit_price'] = self._unit_price_score(candidate, coupang_count, median_unit)
+
+        result.score = round(sum(self.WEIGHTS[k] * v for k, v in f.items()), 4)
+        return result
+
+    @staticmethod
+    def is_bundle(name: str) -> bool:
+        """묶음 상품 여부"""
+        lower = (name or "").lower()
+        return any(re.search(p, lower) for p in BUNDLE_PATTERNS)
+
+    # ---------------------------------------------------------------------
+    # Features
+    # ---------------------------------------------------------------------
+
+    def _brand_score(self, brand: str, name: str) -> float:
+        brand_tokens = _english_tokens(brand)
+        if not brand_tokens:
+            return 0.5
+
+        name_tokens = _english_tokens(name)
+        compact = _compact_korean(name)
+
+        hits = 0
+        for token in brand_tokens:
+            if token in name_tokens or any(a in compact for a in KOREAN_ALIASES.get(token, [])):
+                hits += 1
+        return hits / len(brand_tokens)
+
+    def _name_score(self, gnc_name: str, name: str) -> float:
+        """GNC 상품명 토큰이 후보명에 포함된 비율 (영문 토큰 또는 한글 표기)"""
+        gnc_tokens = _english_tokens(gnc_name)
+        if not gnc_tokens:
+            return 0.0
+
+        name_tokens = _english_tokens(name)
+        compact = _compact_korean(name)
+
+        hits = 0
+        for token in gnc_tokens:
+            if token in name_tokens:
+                hits += 1
+            elif len(token) >= 3 and token in compact:
+                hits += 1
+            elif any(a in compact for a in KOREAN_ALIASES.get(token, [])):
+                hits += 1
+        return hits / len(gnc_tokens)
+
+    @staticmethod
+    def _count_score(gnc_count: Optional[int], coupang_count: Optional[int]) -> float:
+        if not gnc_count or not coupang_count:
+            return 0.5
+        if gnc_count == coupang_count:
+            return 1.0
+        if abs(gnc_count - coupang_count) / gnc_count <= 0.10:
+            return 0.7
+        return 0.0
+
+    @staticmethod
+    def _per_unit(candidate: Any, count: Optional[int]) -> Optional[float]:
+        unit_price = getattr(candidate, 'unit_price', None)
+        if unit_price:
+            return float(unit_price)
+        sale_price = getattr(candidate, 'sale_price', 0) or 0
+        if sale_price and count:
+            return sale_price / count
+        return None
+
+    def _median_unit_price(self, candidates: List[Any]) -> Optional[float]:
+        values = [
+            self._per_unit(c, CoupangHTMLHelper.extract_count(getattr(c, 'name', '') or ''))
+            for c in candidates
+        ]
+        values = [v for v in values if v]
+        return statistics.median(values) if values else None
+
+    def _unit_price_score(self, candidate: Any, count: Optional[int], median_unit: Optional[float]) -> float:
+        """후보들 중앙값 대비 1정당 가격 (묶음/다른 제품이면 크게 벗어남)"""
+        per_unit = self._per_unit(candidate, count)
+        if not per_unit or not median_unit:
+            return 0.5
+        ratio = per_unit / median_unit
+        if 0.6 <= ratio <= 1.6:
+            return 1.0
+        return 0.0
+
+
+class LocalMatchReport:
+    """
+    로컬 판정 정밀도/재현율 집계
+
+    기준(reference)은 Gemini 선택 결과, 집계는 교차 검증(audit)한 accept/reject 판정만
+    - accept 판정이 Gemini 선택과 같으면 TP, 다르면 FP
+    - Gemini가 선택했는데 로컬이 같은 후보를 accept하지 못하면 FN
+    - 보류(ambiguous)는 전부 Gemini로 가므로 표본 비율이 달라 별도 줄로 집계
+    """
+
+    def __init__(self):
+        self.decisions = {'accept': 0, 'reject': 0, 'ambiguous': 0}
+        self.tp = 0
+        self.fp = 0
+        self.fn = 0
+        self.reject_agree = 0
+        self.reject_disagree = 0
+        self.ambiguous_picked = 0
+        self.ambiguous_none = 0
+        self.gemini_calls = 0
+        self.gemini_candidates = 0
+
+    def record_decision(self, decision: str):
+        self.decisions[decision] = self.decisions.get(decision, 0) + 1
+
+    def record_gemini_call(self, n_candidates: int):
+        self.gemini_calls += 1
+        self.gemini_candidates += n_candidates
+
+    def record_ambiguous(self, reference_url: Optional[str]):
+        """보류 → Gemini 결과 (precision/recall에는 넣지 않음)"""
+        if reference_url:
+            self.ambiguous_picked += 1
+        else:
+            self.ambiguous_none += 1
+
+    def record_reference(self, decision: str, local_url: Optional[str], reference_url: Optional[str]):
+        """교차 검증한 accept/reject 판정을 Gemini(기준) 결과와 비교"""
+        if decision == 'accept':
+            if reference_url and reference_url == local_url:
+                self.tp += 1
+            else:
+                self.fp += 1
+                if reference_url:
+                    self.fn += 1
+        elif decision == 'reject':
+            if reference_url:
+                self.reject_disagree += 1
+                self.fn += 1
+            else:
+                self.reject_agree += 1
+
+    @property
+    def precision(self) -> Optional[float]:
+        total = self.tp + self.fp
+        return self.tp / total if total else None
+
+    @property
+    def recall(self) -> Optional[float]:
+        total = self.tp + self.fn
+        return self.tp / total if total else None
+
+    def summary(self) -> str:
+        def pct(v):
+            return f"{v * 100:.1f}%" if v is not None else "N/A"
+
+        reject_total = self.reject_agree + self.reject_disagree
+        reject_precision = self.reject_agree / reject_total if reject_total else None
+        avg_candidates = self.gemini_candidates / self.gemini_calls if self.gemini_calls else 0
+
+        return "\n".join([
+            f"로컬 판정: 선택 {self.decisions['accept']} / 거절 {self.decisions['reject']} / 보류 {self.decisions['ambiguous']}",
+            f"Gemini 호출: {self.gemini_calls}회 (평균 후보 {avg_candidates:.1f}개)",
+            f"로컬 선택 precision: {pct(self.precision)} (TP {self.tp}, FP {self.fp}, 교차 검증 표본 기준)",
+            f"로컬 선택 recall:    {pct(self.recall)} (FN {self.fn}, 교차 검증 표본 기준)",
+            f"로컬 거절 precision: {pct(reject_precision)} ({self.reject_agree}/{reject_total})",
+            f"보류 → Gemini 선택 {self.ambiguous_picked} / 매칭 불가 {self.ambiguous_none}",
+        ])
@@ -8,13 +8,14 @@ import os
 import time
 import re
 from typing import List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 from coupang_manager import CoupangBrowser
 from coupang_manager.selectors import CoupangSelectors, CoupangHTMLHelper
+from search_cache import NS_COUPANG, normalize_query
 
 
 @dataclass
@@ -54,20 +55,58 @@ class CoupangProduct:
 class CoupangCrawler:
     """쿠팡 크롤러 v3.0 - 검색 결과 전용"""
     
-    def __init__(self, browser_manager: CoupangBrowser):
+    def __init__(self, browser_manager: CoupangBrowser, cache=None):
         if not browser_manager:
             raise ValueError("browser_manager 필요")
         
         self.browser = browser_manager
         self.driver = browser_manager.driver
         self.selectors = CoupangSelectors()
+        self.cache = cache  # SearchCache (선택)
     
     # ---------------------------------------------------------------------
     # Public API
     # ---------------------------------------------------------------------
     
-    def search_products(self, query: str, top_n: int = 5) -> List[CoupangProduct]:
-        """쿠팡 검색 및 상위 N개 제품 반환 (검색 결과에서 모든 정보 수집)"""
+    def search_products(self, query: str, top_n: int = 5, use_cache: bool = True) -> List[CoupangProduct]:
+        """쿠팡 검색 및 상위 N개 제품 반환 (캐시 우선)"""
+        key = normalize_query(query)
+        
+        if self.cache and use_cache:
+            cached = self.cache.get(NS_COUPANG, key)
+            if cached and cached.get('top_n', 0) >= top_n:
+                print(f"  ✓ 쿠팡 캐시 사용")
+                return [CoupangProduct(**item) for item in cached['items'][:top_n]]
+        
+        products = self._fetch_products(query, top_n)
+        
+        # 빈 결과는 일시적 오류일 수 있으므로 캐시하지 않음
+        if products and self.cache:
+            raw_html = self.driver.page_source if self.cache.store_html else None
+            self.cache.set(NS_COUPANG, key, {
+                '_args': {'query': query, 'top_n': top_n},
+                'top_n': top_n,
+                'items': [asdict(p) for p in products],
+            }, raw_html=raw_html)
+        
+        return products
+    
+    def revalidate_stale(self) -> int:
+        """stale 캐시로 응답했던 검색어 재검색"""
+        if not self.cache:
+            return 0
+        
+        pending = self.cache.pending_revalidation(NS_COUPANG)
+        for args in pending:
+            self.search_products(args['query'], top_n=args.get('top_n', 5), use_cache=False)
+        return len(pending)
+    
+    # ---------------------------------------------------------------------
+    # Private Methods
+    # ---------------------------------------------------------------------
+    
+    def _fetch_products(self, query: str, top_n: int) -> List[CoupangProduct]:
+        """쿠팡 검색 페이지 접속 후 파싱 (검색 결과에서 모든 정보 수집)"""
         products: List[CoupangProduct] = []
         
         try:
@@ -89,10 +128,6 @@ class CoupangCrawler:
         
         return products
     
-    # ---------------------------------------------------------------------
-    # Private Methods
-    # ---------------------------------------------------------------------
-    
     def _apply_single_item_filter(self):
         """낱개상품 필터 적용"""
         try:
@@ -107,15 +142,35 @@ class CoupangCrawler:
             print(f"  ⚠ 낱개상품 필터 없음")
     
     def _parse_search_results(self, top_n: int) -> List[CoupangProduct]:
-        """검색 결과에서 모든 정보 추출"""
+        """검색 결과에서 모든 정보 추출 (카드 전체를 execute_script 1회로 직렬화)"""
         products: List[CoupangProduct] = []
         
         try:
-            elements = self.driver.find_elements("css selector", self.selectors.PRODUCT_LIST_ITEM)
-            print(f"  ✓ {len(elements)}개 상품 발견")
+            s = self.selectors
+            selector_map = {
+                'item': s.PRODUCT_LIST_ITEM,
+                'name': s.PRODUCT_NAME,
+                'link': s.PRODUCT_LINK,
+                'image': s.PRODUCT_IMAGE,
+                'discount': s.PRICE_DISCOUNT_RATE,
+                'original': s.PRICE_ORIGINAL,
+                'sale': s.PRICE_SALE,
+                'unit': s.PRICE_UNIT,
+                'fee_badge': s.SHIPPING_FEE_BADGE,
+                'free_span': s.FREE_SHIPPING_SPAN,
+                'date_span': s.DELIVERY_DATE_SPAN,
+                'image_badge': s.IMAGE_BADGE,
+                'coupick': s.COUPICK_BADGE,
+                'rating': s.RATING_CONTAINER,
+                'rating_star': s.RATING_STAR,
+                'rating_count': s.RATING_COUNT,
+            }
             
-            for rank, elem in enumerate(elements[:top_n], 1):
-                product = self._parse_product_element(elem, rank)
+            payload = self.driver.execute_script(self.EXTRACT_CARDS_JS, selector_map, top_n) or {}
+            print(f"  ✓ {payload.get('total', 0)}개 상품 발견")
+            
+            for rank, raw in enumerate(payload.get('cards', []), 1):
+                product = self._product_from_raw(raw, rank)
                 if product:
                     products.append(product)
             
@@ -126,38 +181,71 @@ class CoupangCrawler:
         
         return products
     
-    def _parse_product_element(self, elem, rank: int) -> Optional[CoupangProduct]:
-        """상품 카드에서 모든 정보 추출"""
+    # 카드별 원시 필드 직렬화 (Python 측 파싱은 CoupangHTMLHelper가 담당)
+    EXTRACT_CARDS_JS = """
+        const sel = arguments[0];
+        const topN = arguments[1];
+        
+        const one = (root, css) => { try { return root.querySelector(css); } catch (e) { return null; } };
+        const all = (root, css) => { try { return Array.from(root.querySelectorAll(css)); } catch (e) { return []; } };
+        const text = (el) => el ? (el.innerText || '').trim() : '';
+        
+        const items = all(document, sel.item);
+        const cards = items.slice(0, topN).map(card => {
+            const link = one(card, sel.link);
+            const img = one(card, sel.image);
+            const fee = all(card, sel.fee_badge);
+            const rating = one(card, sel.rating);
+            const star = rating ? one(rating, sel.rating_star) : null;
+            const count = rating ? one(rating, sel.rating_count) : null;
+            
+            return {
+                name: text(one(card, sel.name)),
+                has_name: !!one(card, sel.name),
+                url: link ? (link.getAttribute('href') || '') : null,
+                full_url: link ? (link.href || '') : null,
+                image_src: img ? (img.getAttribute('src') || '') : null,
+                image_data_src: img ? (img.getAttribute('data-src') || '') : null,
+                discount_texts: all(card, sel.discount).map(text),
+                original_text: one(card, sel.original) ? text(one(card, sel.original)) : null,
+                sale_items: all(card, sel.sale).map(el => ({cls: el.getAttribute('class') || '', text: text(el)})),
+                unit_texts: all(card, sel.unit).map(text),
+                fee_badge_text: fee.length ? text(fee[0]) : null,
+                free_span_texts: all(card, sel.free_span).map(text),
+                date_span_texts: all(card, sel.date_span).map(text),
+                badge_srcs: all(card, sel.image_badge).map(el => el.getAttribute('src') || ''),
+                has_coupick: all(card, sel.coupick).length > 0,
+                rating_style: star ? (star.getAttribute('style') || '') : null,
+                rating_count_text: count ? text(count) : null,
+            };
+        });
+        
+        return {total: items.length, cards: cards};
+    """
+    
+    def _product_from_raw(self, raw: dict, rank: int) -> Optional[CoupangProduct]:
+        """직렬화된 카드 필드 → CoupangProduct"""
         try:
             # 상품명
-            name = ""
-            try:
-                name_elem = elem.find_element("css selector", self.selectors.PRODUCT_NAME)
-                name = name_elem.text.strip()
-            except:
+            if not raw.get('has_name'):
                 return None
+            name = raw.get('name') or ""
             
-            # URL
-            url = ""
-            try:
-                link_elem = elem.find_element("css selector", self.selectors.PRODUCT_LINK)
-                url = link_elem.get_attribute('href')
-                if url and not url.startswith('http'):
-                    url = "https://www.coupang.com" + url
-            except:
+            # URL (selenium get_attribute('href')와 같이 절대 경로 우선)
+            if raw.get('url') is None:
                 return None
+            url = raw.get('full_url') or raw.get('url') or ""
+            if url and not url.startswith('http'):
+                url = "https://www.coupang.com" + url
             
             # 썸네일
-            thumbnail_url: Optional[str] = None
-            try:
-                img_elem = elem.find_element("css selector", self.selectors.PRODUCT_IMAGE)
-                thumbnail_url = img_elem.get_attribute('src')
+            thumbnail_url: Optional[str] = raw.get('image_src')
+            if raw.get('image_src') is not None:
                 if not thumbnail_url or thumbnail_url.startswith('data:'):
-                    thumbnail_url = img_elem.get_attribute('data-src')
+                    thumbnail_url = raw.get('image_data_src')
                 if thumbnail_url and thumbnail_url.startswith("//"):
                     thumbnail_url = "https:" + thumbnail_url
-            except:
-                pass
+            thumbnail_url = thumbnail_url or None
             
             # ============================================================
             # 가격 정보
@@ -165,115 +253,74 @@ class CoupangCrawler:
             
             # 할인율
             discount_rate = 0
-            try:
-                discount_elems = elem.find_elements("css selector", self.selectors.PRICE_DISCOUNT_RATE)
-                for d_elem in discount_elems:
-                    text = d_elem.text.strip()
-                    rate = CoupangHTMLHelper.extract_discount_rate(text)
-                    if rate:
-                        discount_rate = rate
-                        break
-            except:
-                pass
+            for text in raw.get('discount_texts', []):
+                rate = CoupangHTMLHelper.extract_discount_rate(text)
+                if rate:
+                    discount_rate = rate
+                    break
             
             # 정가 (할인 전)
             original_price = 0
-            try:
-                original_elem = elem.find_element("css selector", self.selectors.PRICE_ORIGINAL)
-                original_text = original_elem.text.strip()
-                original_price = CoupangHTMLHelper.extract_price(original_text) or 0
-            except:
-                pass
+            if raw.get('original_text'):
+                original_price = CoupangHTMLHelper.extract_price(raw['original_text']) or 0
             
-            # 판매가 (할인 후)
+            # 판매가 (할인 후) - fw-text-[20px] 클래스를 가진 요소
             sale_price = 0
-            try:
-                price_elems = elem.find_elements("css selector", self.selectors.PRICE_SALE)
-                for p_elem in price_elems:
-                    # fw-text-[20px] 클래스를 가진 요소 찾기
-                    classes = p_elem.get_attribute('class') or ''
-                    if 'fw-text-[20px]' in classes or 'fw-font-bold' in classes:
-                        price_text = p_elem.text.strip()
-                        sale_price = CoupangHTMLHelper.extract_price(price_text) or 0
-                        if sale_price > 0:
-                            break
-            except:
-                pass
+            for item in raw.get('sale_items', []):
+                classes = item.get('cls', '')
+                if 'fw-text-[20px]' in classes or 'fw-font-bold' in classes:
+                    sale_price = CoupangHTMLHelper.extract_price(item.get('text', '')) or 0
+                    if sale_price > 0:
+                        break
             
             # 1정당 가격
             unit_price: Optional[int] = None
-            try:
-                unit_elems = elem.find_elements("css selector", self.selectors.PRICE_UNIT)
-                for u_elem in unit_elems:
-                    unit_text = u_elem.text.strip()
-                    unit_price = CoupangHTMLHelper.extract_unit_price(unit_text)
-                    if unit_price:
-                        break
-            except:
-                pass
+            for text in raw.get('unit_texts', []):
+                unit_price = CoupangHTMLHelper.extract_unit_price(text)
+                if unit_price:
+                    break
             
             # ============================================================
             # 배송 정보
             # ============================================================
             
-            # 배송비 추출
             is_free_shipping = False
             shipping_fee = 0
             
-            try:
-                # 1. 유료 배송비 배지 확인 (우선순위)
-                fee_badge = elem.find_elements("css selector", self.selectors.SHIPPING_FEE_BADGE)
-                if fee_badge:
-                    badge_text = fee_badge[0].text.strip()
-                    # "배송비 2,500원 조건부 무료배송" → 2500 추출
-                    shipping_fee = CoupangHTMLHelper.extract_shipping_fee(badge_text)
-                    if shipping_fee == 0 and "무료" in badge_text:
+            badge_text = raw.get('fee_badge_text')
+            if badge_text is not None:
+                # 1. 유료 배송비 배지 ("배송비 2,500원 조건부 무료배송" → 2500)
+                shipping_fee = CoupangHTMLHelper.extract_shipping_fee(badge_text)
+                if shipping_fee == 0 and "무료" in badge_text:
+                    is_free_shipping = True
+            else:
+                # 2. 무료배송 span
+                for text in raw.get('free_span_texts', []):
+                    if CoupangHTMLHelper.is_free_shipping(text):
                         is_free_shipping = True
-                else:
-                    # 2. 무료배송 span 확인
-                    free_span = elem.find_elements("css selector", self.selectors.FREE_SHIPPING_SPAN)
-                    if free_span:
-                        for span in free_span:
-                            if CoupangHTMLHelper.is_free_shipping(span.text):
-                                is_free_shipping = True
-                                shipping_fee = 0
-                                break
-            except Exception as e:
-                pass
+                        shipping_fee = 0
+                        break
             
-            # 도착 예정일
+            # 도착 예정일 (보통 2개: "내일(수)" + "도착 보장")
             delivery_date: Optional[str] = None
-            try:
-                date_spans = elem.find_elements("css selector", self.selectors.DELIVERY_DATE_SPAN)
-                if date_spans and len(date_spans) >= 2:
-                    # 보통 2개: "내일(수)" + "도착 보장"
-                    delivery_date = date_spans[0].text.strip() + " " + date_spans[1].text.strip()
-            except:
-                pass
+            date_texts = raw.get('date_span_texts', [])
+            if len(date_texts) >= 2:
+                delivery_date = date_texts[0] + " " + date_texts[1]
             
             # 배지 (쿠팡PICK, 로켓배송, 직구 등)
             badges: List[str] = []
             delivery_type: Optional[str] = None
             
-            try:
-                # 이미지 배지
-                badge_imgs = elem.find_elements("css selector", self.selectors.IMAGE_BADGE)
-                for img in badge_imgs:
-                    src = img.get_attribute('src') or ''
-                    d_type = CoupangHTMLHelper.parse_delivery_type(src)
-                    if d_type:
-                        badges.append(d_type)
-                        if not delivery_type:
-                            delivery_type = d_type
-                
-                # 쿠팡PICK 배지
-                coupick = elem.find_elements("css selector", self.selectors.COUPICK_BADGE)
-                if coupick:
-                    badges.append("쿠팡PICK")
-            except:
-                pass
+            for src in raw.get('badge_srcs', []):
+                d_type = CoupangHTMLHelper.parse_delivery_type(src)
+                if d_type:
+                    badges.append(d_type)
+                    if not delivery_type:
+                        delivery_type = d_type
+            
+            if raw.get('has_coupick'):
+                badges.append("쿠팡PICK")
             
-            # 로켓배송 여부
             is_rocket = CoupangHTMLHelper.is_rocket_delivery(badges)
             
             # ============================================================
@@ -283,26 +330,10 @@ class CoupangCrawler:
             rating: Optional[float] = None
             review_count: Optional[int] = None
             
-            try:
-                rating_container = elem.find_element("css selector", self.selectors.RATING_CONTAINER)
-                
-                # 별점
-                try:
-                    star_elem = rating_container.find_element("css selector", self.selectors.RATING_STAR)
-                    style = star_elem.get_attribute("style") or ""
-                    rating = CoupangHTMLHelper.extract_rating_from_style(style)
-                except:
-                    pass
-                
-                # 리뷰 수
-                try:
-                    count_elem = rating_container.find_element("css selector", self.selectors.RATING_COUNT)
-                    count_text = count_elem.text.strip()
-                    review_count = CoupangHTMLHelper.extract_review_count(count_text)
-                except:
-                    pass
-            except:
-                pass
+            if raw.get('rating_style') is not None:
+                rating = CoupangHTMLHelper.extract_rating_from_style(raw['rating_style'])
+            if raw.get('rating_count_text') is not None:
+                review_count = CoupangHTMLHelper.extract_review_count(raw['rating_count_text'])
             
             # 최종가
             final_price = sale_price + shipping_fee
@@ -329,4 +360,4 @@ class CoupangCrawler:
         
         except Exception as e:
             print(f"  [DEBUG] 상품 파싱 오류: {e}")
-            return None
\ No newline at end of file
+            return None
@@ -4,19 +4,33 @@ Gemini 기반 상품 매칭 - 개선 버전
 - 이미지 비교: 엄격하게 (최종 검증)
 """
 
-import google.generativeai as genai
+import sys
+import os
 from PIL import Image
 import requests
 from io import BytesIO
 from typing import Tuple, Optional, List, Any
 
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from gemini_client import GeminiClient, get_shared_client
+
+
+def _resolve_client(api_key: Optional[str], client: Optional[GeminiClient]) -> GeminiClient:
+    """client 우선, 없으면 API 키 단위 공용 클라이언트"""
+    if client is not None:
+        return client
+    if not api_key:
+        raise ValueError("api_key 또는 client 필요")
+    return get_shared_client(api_key)
+
 
 class CandidateSelector:
     """Gemini 후보 선택 - 관대한 1차 필터링"""
     
-    def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
+    def __init__(self, api_key: Optional[str] = None, client: Optional[GeminiClient] = None):
+        self.client = _resolve_client(api_key, client)
     
     def select_best_candidate(self, gnc_product: Any, candidates: List[Any]) -> Tuple[Optional[Any], str, str]:
         """
@@ -34,32 +48,42 @@ class CandidateSelector:
             return None, "none", "후보가 없어 매칭 불가"
         
         try:
-            gnc_name = getattr(gnc_product, "product_name", "") or getattr(gnc_product, "name", "")
-            gnc_desc = getattr(gnc_product, "description", "")
+            prompt = self._build_prompt(gnc_product, candidates)
+            result = self.client.generate_text_sync(prompt)
+            return self._parse_selection(result, candidates)
             
-            gnc_info = f"""
+        except Exception as e:
+            print(f"  ✗ Gemini 선택 실패: {e}")
+            return None, 'none', f"API 오류: {str(e)}"
+    
+    def _build_prompt(self, gnc_product: Any, candidates: List[Any]) -> str:
+        """후보 선택 프롬프트 생성"""
+        gnc_name = getattr(gnc_product, "product_name", "") or getattr(gnc_product, "name", "")
+        gnc_desc = getattr(gnc_product, "description", "")
+        
+        gnc_info = f"""
 GNC 원본 상품:
 - 상품명: {gnc_name}
 - 추가 정보: {gnc_desc if gnc_desc else '없음'}
 """
-            
-            def fmt_num(value):
-                if value is None:
-                    return "미확인"
-                if isinstance(value, (int, float)):
-                    return f"{value:,}"
-                return str(value)
-            
-            candidates_info = "\n\n".join([
-                f"""후보 {i+1}:
+        
+        def fmt_num(value):
+            if value is None:
+                return "미확인"
+            if isinstance(value, (int, float)):
+                return f"{value:,}"
+            return str(value)
+        
+        candidates_info = "\n\n".join([
+            f"""후보 {i+1}:
 - 상품명: {c.name}
 - 가격: {fmt_num(getattr(c, "final_price", None))}원
 - 리뷰 수: {fmt_num(getattr(c, "review_count", None))}개
 - 평점: {fmt_num(getattr(c, "rating", None))}"""
-                for i, c in enumerate(candidates)
-            ])
-            
-            prompt = f"""
+            for i, c in enumerate(candidates)
+        ])
+        
+        prompt = f"""
 원본 상품과 쿠팡 후보들을 비교하여 가장 유사한 제품을 선택하세요.
 
 원본 상품:
@@ -84,73 +108,51 @@ GNC 원본 상품:
 선택: 후보 X (또는 매칭 불가)
 이유: (선택 시: "브랜드, 제품명, 맛, 용량 모두 일치" / 매칭 불가 시: "브랜드 불일치" 또는 "맛 다름" 등 불일치 이유)
 """
-            
-            response = self.model.generate_content(prompt)
-            result = response.text.strip()
-            
-            # 🐛 디버그: Gemini 응답 확인
-            print(f"  🔍 Gemini 응답:\n{result}\n")
-            
-            # 매칭 불가 확인
-            if '매칭 불가' in result or '매칭불가' in result:
-                return None, 'none', result
-            
-            # 신뢰도 파싱 (없으면 medium으로 기본 설정)
-            confidence = 'medium'  # ⭐ 기본값 변경
-            lower = result.lower()
-            
-            if 'high' in lower or '신뢰도: high' in result:
-                confidence = 'high'
-            elif 'medium' in lower or '신뢰도: medium' in result:
-                confidence = 'medium'
-            elif 'low' in lower or '신뢰도: low' in result:
-                confidence = 'none'  # low는 매칭 불가
-            
-            # low 신뢰도면 매칭 불가
-            if confidence == 'none':
-                return None, 'none', result
-            
-            # 후보 파싱 (1부터 시작, 후보 1 = candidates[0])
-            print(f"  🐛 파싱 시도: candidates 수={len(candidates)}")
-            for i in range(1, len(candidates) + 1):  # ⭐ 1부터 len+1까지
-                search_text = f"후보 {i}"
-                print(f"  🐛 검색: '{search_text}' in result? {search_text in result}")
-                if search_text in result:
-                    print(f"  ✅ 후보 {i} 찾음! → candidates[{i-1}]")
-                    return candidates[i-1], confidence, result  # ⭐ i-1 인덱스
-            
-            # 파싱 실패
-            print(f"  ❌ 파싱 실패!")
-            print(f"  📄 전체 응답:\n{repr(result)}")
-            return None, 'none', f"응답 파싱 실패\n{result}"
-            
-        except Exception as e:
-            print(f"  ✗ Gemini 선택 실패: {e}")
-            return None, 'none', f"API 오류: {str(e)}"
+        return prompt
+    
+    def _parse_selection(self, result: str, candidates: List[Any]) -> Tuple[Optional[Any], str, str]:
+        """Gemini 응답에서 선택 후보/신뢰도 파싱"""
+        # 🐛 디버그: Gemini 응답 확인
+        print(f"  🔍 Gemini 응답:\n{result}\n")
+        
+        # 매칭 불가 확인
+        if '매칭 불가' in result or '매칭불가' in result:
+            return None, 'none', result
+        
+        # 신뢰도 파싱 (없으면 medium으로 기본 설정)
+        confidence = 'medium'  # ⭐ 기본값 변경
+        lower = result.lower()
+        
+        if 'high' in lower or '신뢰도: high' in result:
+            confidence = 'high'
+        elif 'medium' in lower or '신뢰도: medium' in result:
+            confidence = 'medium'
+        elif 'low' in lower or '신뢰도: low' in result:
+            confidence = 'none'  # low는 매칭 불가
+        
+        # low 신뢰도면 매칭 불가
+        if confidence == 'none':
+            return None, 'none', result
+        
+        # 후보 파싱 (1부터 시작, 후보 1 = candidates[0])
+        print(f"  🐛 파싱 시도: candidates 수={len(candidates)}")
+        for i in range(1, len(candidates) + 1):  # ⭐ 1부터 len+1까지
+            search_text = f"후보 {i}"
+            print(f"  🐛 검색: '{search_text}' in result? {search_text in result}")
+            if search_text in result:
+                print(f"  ✅ 후보 {i} 찾음! → candidates[{i-1}]")
+                return candidates[i-1], confidence, result  # ⭐ i-1 인덱스
+        
+        # 파싱 실패
+        print(f"  ❌ 파싱 실패!")
+        print(f"  📄 전체 응답:\n{repr(result)}")
+        return None, 'none', f"응답 파싱 실패\n{result}"
 
 
 class ImageMatcher:
     """Gemini Vision 이미지 비교 - 엄격한 최종 검증"""
     
-    def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
-    
-    def compare_images(self, gnc_url: str, coupang_url: str) -> Tuple[bool, str, str]:
-        """
-        두 이미지 비교 - 엄격한 기준
-        
-        Returns:
-            (일치 여부, 신뢰도, 이유)
-        """
-        try:
-            gnc_img = self._download_image(gnc_url)
-            coupang_img = self._download_image(coupang_url)
-            
-            if not gnc_img or not coupang_img:
-                return False, "low", "이미지 다운로드 실패"
-            
-            prompt = """
+    PROMPT = """
 두 이미지가 동일한 제품인지 판단하세요.
 
 **체크리스트:**
@@ -169,31 +171,50 @@ class ImageMatcher:
 판정: 일치 (또는 불일치)
 이유: (일치 시: "브랜드, 제품명, 맛 모두 동일" / 불일치 시: "브랜드 다름" 또는 "맛 불일치" 등 불일치 이유)
 """
+    
+    def __init__(self, api_key: Optional[str] = None, client: Optional[GeminiClient] = None):
+        self.client = _resolve_client(api_key, client)
+    
+    def compare_images(self, gnc_url: str, coupang_url: str) -> Tuple[bool, str, str]:
+        """
+        두 이미지 비교 - 엄격한 기준
+        
+        Returns:
+            (일치 여부, 신뢰도, 이유)
+        """
+        try:
+            gnc_img = self._download_image(gnc_url)
+            coupang_img = self._download_image(coupang_url)
             
-            response = self.model.generate_content([prompt, gnc_img, coupang_img])
-            result = response.text.strip()
-            
-            # 일치 여부 확인
-            is_match = '일치' in result and '불일치' not in result
-            
-            # 신뢰도 파싱
-            confidence = 'medium'
-            lower = result.lower()
-            if 'high' in lower or '신뢰도: high' in result:
-                confidence = 'high'
-            elif 'low' in lower or '신뢰도: low' in result:
-                confidence = 'low'
-            
-            # low 신뢰도면 불일치로 처리
-            if confidence == 'low':
-                return False, 'low', f"낮은 신뢰도로 불일치 처리\n{result}"
+            if not gnc_img or not coupang_img:
+                return False, "low", "이미지 다운로드 실패"
             
-            return is_match, confidence, result
+            result = self.client.generate_text_sync([self.PROMPT, gnc_img, coupang_img])
+            return self._parse_verdict(result)
             
         except Exception as e:
             print(f"  ✗ 이미지 비교 실패: {e}")
             return False, "error", str(e)
     
+    def _parse_verdict(self, result: str) -> Tuple[bool, str, str]:
+        """판정 응답 파싱"""
+        # 일치 여부 확인
+        is_match = '일치' in result and '불일치' not in result
+        
+        # 신뢰도 파싱
+        confidence = 'medium'
+        lower = result.lower()
+        if 'high' in lower or '신뢰도: high' in result:
+            confidence = 'high'
+        elif 'low' in lower or '신뢰도: low' in result:
+            confidence = 'low'
+        
+        # low 신뢰도면 불일치로 처리
+        if confidence == 'low':
+            return False, 'low', f"낮은 신뢰도로 불일치 처리\n{result}"
+        
+        return is_match, confidence, result
+    
     def _download_image(self, url: str) -> Optional[Image.Image]:
         """이미지 다운로드"""
         try:
@@ -205,4 +226,4 @@ class ImageMatcher:
             return Image.open(BytesIO(response.content))
             
         except:
-            return None
\ No newline at end of file
+            return None
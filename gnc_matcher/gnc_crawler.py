@@ -12,7 +12,9 @@ sys.path.insert(0, project_root)
 import time
 import re
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+
+from search_cache import NS_GNC
 
 
 @dataclass
@@ -29,13 +31,14 @@ class GNCProduct:
 class GNCCrawler:
     """GNC 크롤러"""
     
-    def __init__(self, browser_manager=None, debug: bool = False):
+    def __init__(self, browser_manager=None, debug: bool = False, cache=None):
         if not browser_manager:
             raise ValueError("browser_manager 필요")
         
         self.browser = browser_manager
         self.driver = browser_manager.driver
         self.debug = debug
+        self.cache = cache  # SearchCache (선택)
     
     def _check_perimeterx(self) -> bool:
         """PerimeterX 감지 - 정확한 키워드만 사용"""
@@ -101,8 +104,39 @@ class GNCCrawler:
                 print("\n⚠️  아직 PerimeterX가 감지됩니다. 다시 확인하세요.")
                 print("   브라우저에서 CAPTCHA를 완료했는지 확인하세요.")
     
-    def search_product(self, product_code: str) -> Optional[GNCProduct]:
-        """GNC 상품 검색"""
+    def search_product(self, product_code: str, use_cache: bool = True) -> Optional[GNCProduct]:
+        """GNC 상품 검색 (캐시 우선)"""
+        key = str(product_code).strip()
+        
+        if self.cache and use_cache:
+            cached = self.cache.get(NS_GNC, key)
+            if cached:
+                print(f"  ✓ GNC 캐시 사용")
+                return GNCProduct(**cached['product'])
+        
+        product = self._fetch_product(product_code)
+        
+        if product and self.cache:
+            raw_html = self.driver.page_source if self.cache.store_html else None
+            self.cache.set(NS_GNC, key, {
+                '_args': {'product_code': key},
+                'product': asdict(product),
+            }, raw_html=raw_html)
+        
+        return product
+    
+    def revalidate_stale(self) -> int:
+        """stale 캐시로 응답했던 항목 재검색"""
+        if not self.cache:
+            return 0
+        
+        pending = self.cache.pending_revalidation(NS_GNC)
+        for args in pending:
+            self.search_product(args['product_code'], use_cache=False)
+        return len(pending)
+    
+    def _fetch_product(self, product_code: str) -> Optional[GNCProduct]:
+        """GNC 사이트 검색"""
         try:
             print(f"  GNC 검색 URL 접속...")
             
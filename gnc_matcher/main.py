@@ -4,11 +4,10 @@ GNC-쿠팡 자동 매칭 시스템 v3.0
 ✨ 30개 칼럼으로 확장 (배송 정보, 할인율, 배지 등 추가)
 """
 
-import pandas as pd
-from openpyxl import load_workbook
 import time
 import sys
 import os
+import random
 from typing import List, Optional, Dict
 from dataclasses import dataclass, asdict
 from datetime import datetime
@@ -22,7 +21,18 @@ from coupang_manager import CoupangBrowser
 from gnc_crawler import GNCCrawler, GNCProduct
 from coupang_crawler import CoupangCrawler, CoupangProduct
 from gemini_matcher import ImageMatcher, CandidateSelector
+from gemini_client import get_shared_client
 from priority_detector import detect_red_font_rows
+from workbook_loader import load_product_sheet
+from result_store import ResultStore
+from candidate_ranker import CandidateRanker, LocalMatchReport
+from search_cache import SearchCache
+
+
+DB_PATH = "matching_results.db"
+CACHE_PATH = "search_cache.db"
+CACHE_TTL_HOURS = 24 * 7      # 신선 기간
+CACHE_STALE_HOURS = 24 * 7    # 만료 전까지 stale로 사용 후 재검증
 
 
 def clean_reason(text: str) -> str:
@@ -87,6 +97,8 @@ class MatchResult:
     selection_reason: str = ""
     image_match: str = ""
     image_reason: str = ""
+    selection_method: str = ""           # local / gemini
+    local_score: Optional[float] = None  # 로컬 랭킹 1위 점수
     
     processed_at: str = ""
 
@@ -94,86 +106,108 @@ class MatchResult:
 class ProductMatchingSystem:
     """GNC-쿠팡 자동 매칭 v3.0"""
     
-    def __init__(self, excel_path: str, gemini_api_key: Optional[str] = None, headless: bool = False):
+    def __init__(self, excel_path: str, gemini_api_key: Optional[str] = None, headless: bool = False,
+                 audit_rate: float = 0.1):
         self.excel_path = excel_path
         self.headless = headless
         self.browser = None
+        self.search_cache = None
+        
+        # 로컬 사전 랭킹 (audit_rate: 로컬 판정을 Gemini로 교차 검증할 비율)
+        self.ranker = CandidateRanker()
+        self.local_report = LocalMatchReport()
+        self.audit_rate = audit_rate
         
-        # AI 매처
+        # AI 매처 (같은 키를 쓰는 다른 호출부와 쿼터 공유)
         if gemini_api_key:
-            self.image_matcher = ImageMatcher(gemini_api_key)
-            self.candidate_selector = CandidateSelector(gemini_api_key)
+            self.gemini_client = get_shared_client(gemini_api_key)
+            self.image_matcher = ImageMatcher(client=self.gemini_client)
+            self.candidate_selector = CandidateSelector(client=self.gemini_client)
             self.use_gemini = True
             print("✓ Gemini API 사용")
         else:
+            self.gemini_client = None
             self.image_matcher = None
             self.candidate_selector = None
             self.use_gemini = False
             print("⚠ Gemini API 없음")
         
         self.results: List[MatchResult] = []
-        self.output_path = f"matching_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         
-        # 기존 결과 파일 확인
-        existing_files = sorted([f for f in os.listdir('.') if f.startswith('matching_results_') and f.endswith('.csv')])
-        if existing_files:
-            latest_file = existing_files[-1]
-            print(f"\n⚠ 기존 결과 파일 발견: {latest_file}")
+        # 결과 저장소 (SQLite, run_id 단위)
+        self.store = ResultStore(DB_PATH)
+        self.run_id = None
+        
+        # 기존 실행 확인 (등록 시각 기준 최신)
+        latest_run = self.store.latest_run() or self._import_legacy_csv()
+        if latest_run:
+            print(f"\n⚠ 기존 실행 발견: {latest_run} ({self.store.count(latest_run)}개 처리됨)")
             response = input("이어서 진행하시겠습니까? (y/n): ").lower()
             if response == 'y':
-                self.output_path = latest_file
-                print(f"✓ 이어서 실행: {self.output_path}\n")
-            else:
-                print(f"✓ 새로 시작: {self.output_path}\n")
+                self.run_id = latest_run
+                print(f"✓ 이어서 실행: {self.run_id}\n")
+        
+        if not self.run_id:
+            self.run_id = self.store.start_run(excel_path=excel_path)
+            print(f"✓ 새로 시작: {self.run_id}\n")
+        
+        self.output_path = f"matching_results_{self.run_id}.csv"
     
-    def load_existing_results(self) -> set:
-        """기존 처리된 NO 로드"""
-        if os.path.exists(self.output_path):
-            try:
-                df = pd.read_csv(self.output_path, encoding='utf-8-sig')
-                processed_nos = set(df['no'].tolist())
-                print(f"✓ 기존 결과 {len(processed_nos)}개 로드")
-                return processed_nos
-            except Exception as e:
-                print(f"⚠ 기존 결과 로드 실패: {e}")
-        return set()
+    def _import_legacy_csv(self) -> Optional[str]:
+        """DB 도입 전 matching_results_*.csv가 있으면 최신 파일(수정 시각 기준)을 가져옴"""
+        legacy_files = [f for f in os.listdir('.') if f.startswith('matching_results_') and f.endswith('.csv')]
+        if not legacy_files:
+            return None
+        
+        latest_file = max(legacy_files, key=os.path.getmtime)
+        run_id = latest_file[len('matching_results_'):-len('.csv')]
+        try:
+            imported = self.store.import_csv(latest_file, run_id)
+            print(f"✓ 기존 CSV 가져오기: {latest_file} ({imported}개)")
+            return run_id
+        except Exception as e:
+            print(f"⚠ 기존 CSV 가져오기 실패: {e}")
+            return None
+    
+    def load_existing_results(self) -> int:
+        """기존 처리 결과 수 (목록 전체를 읽지 않음)"""
+        processed = self.store.count(self.run_id)
+        if processed:
+            print(f"✓ 기존 결과 {processed}개")
+        return processed
+    
+    def is_processed(self, product_data: Dict) -> bool:
+        """처리 여부 (인덱스 조회)"""
+        return self.store.is_processed(self.run_id, product_data.get('NO'))
     
     def initialize_crawlers(self):
         """크롤러 초기화"""
         print("\n크롤러 초기화...")
         self.browser = CoupangBrowser(headless=self.headless)
         
-        self.gnc_crawler = GNCCrawler(browser_manager=self.browser)
-        self.coupang_crawler = CoupangCrawler(browser_manager=self.browser)
+        self.search_cache = SearchCache(CACHE_PATH, ttl_hours=CACHE_TTL_HOURS, stale_hours=CACHE_STALE_HOURS)
+        self.gnc_crawler = GNCCrawler(browser_manager=self.browser, cache=self.search_cache)
+        self.coupang_crawler = CoupangCrawler(browser_manager=self.browser, cache=self.search_cache)
         print("✓ 준비 완료\n")
     
     def load_products(self, priority_numbers: Optional[List[int]] = None):
         """엑셀 로드"""
         print(f"엑셀 로드: {self.excel_path}")
         
-        wb = load_workbook(self.excel_path)
-        ws = wb.active
+        sheet = load_product_sheet(self.excel_path)
+        priority_set = set(priority_numbers or [])
         
         priority_products = []
         normal_products = []
         
-        headers = [cell.value for cell in ws[1]]
-        
-        for row_idx in range(2, ws.max_row + 1):
-            row_data = {}
-            for col_idx, header in enumerate(headers, 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                row_data[header] = cell.value
-            
+        for row_data in sheet.rows:
             product_no = row_data.get('NO')
             
-            if priority_numbers and product_no in priority_numbers:
+            if product_no in priority_set:
                 priority_products.append(row_data)
             else:
                 normal_products.append(row_data)
         
-        wb.close()
-        
         print(f"✓ 우선순위: {len(priority_products)}개")
         print(f"✓ 일반: {len(normal_products)}개\n")
         
@@ -230,15 +264,9 @@ class ProductMatchingSystem:
             
             # [4] 후보 선택
             print("\n[4] 후보 선택...")
-            if self.use_gemini and self.candidate_selector:
-                selected, confidence, reason = self.candidate_selector.select_best_candidate(
-                    gnc_product=gnc,  # ✅ 수정: gnc_name → gnc_product
-                    candidates=candidates
-                )
-            else:
-                selected = None
-                confidence = "none"
-                reason = "Gemini API 없음"
+            selected, confidence, reason, method, local_score = self._select_candidate(gnc, candidates)
+            result.selection_method = method
+            result.local_score = local_score
             
             if not selected:
                 print(f"  ✗ 매칭 불가")
@@ -302,6 +330,50 @@ class ProductMatchingSystem:
             print(f"\n✗ 오류: {e}")
             return result
     
+    def _select_candidate(self, gnc: GNCProduct, candidates: List[CoupangProduct]):
+        """
+        로컬 사전 랭킹 → 애매한 경우만 Gemini (상위 k개)
+        
+        Returns:
+            (선택 상품, 신뢰도, 이유, 판정 방식, 로컬 1위 점수)
+        """
+        ranking = self.ranker.rank(gnc, candidates)
+        self.local_report.record_decision(ranking.decision)
+        print(f"  로컬 판정: {ranking.decision} (1위 점수 {ranking.top_score:.2f})")
+        
+        # 로컬 판정 일부는 Gemini로 교차 검증 (precision/recall 측정용)
+        audit = (
+            ranking.decision != 'ambiguous'
+            and self.use_gemini
+            and random.random() < self.audit_rate
+        )
+        
+        if ranking.decision == 'accept':
+            if audit:
+                reference, _, _ = self.candidate_selector.select_best_candidate(gnc_product=gnc, candidates=candidates)
+                self.local_report.record_gemini_call(len(candidates))
+                self.local_report.record_reference('accept', ranking.selected.url, reference.url if reference else None)
+            return ranking.selected, 'high', f"선택: 로컬\n이유: {ranking.reason}", 'local', ranking.top_score
+        
+        if ranking.decision == 'reject':
+            if audit:
+                reference, _, _ = self.candidate_selector.select_best_candidate(gnc_product=gnc, candidates=candidates)
+                self.local_report.record_gemini_call(len(candidates))
+                self.local_report.record_reference('reject', None, reference.url if reference else None)
+            return None, 'none', f"매칭 불가\n이유: {ranking.reason}", 'local', ranking.top_score
+        
+        if not (self.use_gemini and self.candidate_selector):
+            return None, 'none', "Gemini API 없음", 'none', ranking.top_score
+        
+        print(f"  Gemini 후보: {len(ranking.top_k)}/{len(candidates)}개")
+        selected, confidence, reason = self.candidate_selector.select_best_candidate(
+            gnc_product=gnc,
+            candidates=ranking.top_k
+        )
+        self.local_report.record_gemini_call(len(ranking.top_k))
+        self.local_report.record_ambiguous(selected.url if selected else None)
+        return selected, confidence, reason, 'gemini', ranking.top_score
+    
     def _generate_query(self, gnc: GNCProduct) -> str:
         """쿠팡 검색 쿼리 생성"""
         if gnc.brand:
@@ -309,46 +381,23 @@ class ProductMatchingSystem:
         return gnc.product_name
     
     def save_results(self):
-        """실시간 저장 (append 모드)"""
+        """결과 저장 (버퍼링 후 일괄 트랜잭션)"""
         if not self.results:
             return
         
-        df = pd.DataFrame([asdict(r) for r in self.results])
-        
-        # 파일이 존재하면 append, 없으면 새로 생성
-        if os.path.exists(self.output_path):
-            # 기존 파일의 마지막이 개행으로 끝나는지 확인
-            with open(self.output_path, 'rb') as f:
-                f.seek(-1, 2)  # 파일 끝에서 1바이트 전으로 이동
-                last_char = f.read(1)
-                needs_newline = (last_char != b'\n')
-            
-            # append 모드로 저장
-            if needs_newline:
-                # 개행 추가 후 저장
-                with open(self.output_path, 'a', encoding='utf-8-sig') as f:
-                    f.write('\n')
-            
-            df.to_csv(self.output_path, mode='a', header=False, index=False, encoding='utf-8-sig')
-        else:
-            df.to_csv(self.output_path, index=False, encoding='utf-8-sig')
-        
-        # processed_nos 업데이트 (중복 처리 방지)
-        if hasattr(self, 'processed_nos'):
-            for r in self.results:
-                self.processed_nos.add(r.no)
+        for r in self.results:
+            self.store.add(self.run_id, asdict(r))
         
         # 저장 후 results 초기화 (메모리 절약)
         self.results.clear()
-        print(f"  💾 실시간 저장 완료")
     
     def run(self, priority_numbers: Optional[List[int]] = None):
         """실행"""
         try:
             self.initialize_crawlers()
             
-            # 기존 처리된 NO 로드
-            self.processed_nos = self.load_existing_results()
+            # 기존 처리 결과 확인
+            processed_count = self.load_existing_results()
             
             priority, normal = self.load_products(priority_numbers)
             
@@ -359,9 +408,9 @@ class ProductMatchingSystem:
                 print(f"{'='*60}")
                 
                 # 미처리 상품만 필터링
-                priority_to_process = [p for p in priority if p.get('NO') not in self.processed_nos]
+                priority_to_process = [p for p in priority if not self.is_processed(p)]
                 
-                if self.processed_nos:
+                if processed_count:
                     processed_priority = len(priority) - len(priority_to_process)
                     print(f"✓ 우선순위 전체: {len(priority)}개")
                     print(f"✓ 이미 처리됨: {processed_priority}개")
@@ -384,9 +433,9 @@ class ProductMatchingSystem:
                 print(f"{'='*60}")
                 
                 # 미처리 상품만 필터링
-                normal_to_process = [p for p in normal if p.get('NO') not in self.processed_nos]
+                normal_to_process = [p for p in normal if not self.is_processed(p)]
                 
-                if self.processed_nos:
+                if processed_count:
                     processed_normal = len(normal) - len(normal_to_process)
                     print(f"✓ 일반 상품 전체: {len(normal)}개")
                     print(f"✓ 이미 처리됨: {processed_normal}개")
@@ -399,21 +448,35 @@ class ProductMatchingSystem:
                     print(f"\n진행: {idx}/{len(normal_to_process)}")
                     result = self.process_product(p)
                     self.results.append(result)
-                    self.save_results()  # ✅ 매번 저장 (우선순위와 동일)
+                    self.save_results()
                     time.sleep(2)
-                
-                # 마지막 저장은 이미 위에서 매번 하므로 불필요
-                # self.save_results()  # 제거
+            
+            # stale 캐시로 처리한 검색은 마지막에 재검증
+            revalidated = self.gnc_crawler.revalidate_stale() + self.coupang_crawler.revalidate_stale()
+            if revalidated:
+                print(f"✓ 캐시 재검증: {revalidated}건")
             
             print(f"\n✓ 완료")
-            print(f"✓ 결과 파일: {self.output_path}")
         
         except KeyboardInterrupt:
             print("\n\n⚠️  사용자가 중단했습니다")
-            print("✓ 처리된 결과는 이미 저장되었습니다")
-            print(f"✓ 결과 파일: {self.output_path}")
+            print("✓ 처리된 결과는 저장됩니다")
         
         finally:
+            try:
+                self.store.export_csv(self.run_id, self.output_path)
+                print(f"✓ 결과 DB: {DB_PATH} (run_id: {self.run_id})")
+                print(f"✓ 결과 파일: {self.output_path}")
+            except Exception as e:
+                print(f"⚠ 결과 export 실패: {e}")
+            finally:
+                self.store.close()
+            print(f"\n[로컬 판정 리포트]\n{self.local_report.summary()}")
+            if self.search_cache:
+                print(f"✓ 검색 캐시: {self.search_cache.stats()}")
+                self.search_cache.close()
+            if self.gemini_client:
+                print(f"✓ Gemini 사용량: {self.gemini_client.usage_summary()}")
             if self.browser:
                 self.browser.close()
 
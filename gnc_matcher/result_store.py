@@ -0,0 +1,183 @@
+"""
+매칭 결과 저장소 (SQLite)
+- (run_id, no) 기본키 인덱스로 이어하기 조회 O(1)
+- 결과는 버퍼에 모았다가 트랜잭션 단위로 일괄 저장
+- CSV/Excel은 필요할 때 export
+"""
+
+import json
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+
+DEFAULT_DB_PATH = "matching_results.db"
+
+
+class ResultStore:
+    """매칭 결과 SQLite 저장소"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, batch_size: int = 20, flush_interval: float = 30.0):
+        """
+        Args:
+            db_path: DB 파일 경로
+            batch_size: 버퍼가 이 크기에 도달하면 저장
+            flush_interval: 마지막 저장 후 이 시간(초)이 지나면 저장
+        """
+        self.db_path = str(db_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+        self._buffer: List[tuple] = []
+        self._last_flush = time.monotonic()
+
+    def _init_schema(self):
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id      TEXT PRIMARY KEY,
+                excel_path  TEXT,
+                created_at  TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS results (
+                run_id        TEXT NOT NULL,
+                no            INTEGER NOT NULL,
+                processed_at  TEXT,
+                data          TEXT NOT NULL,
+                PRIMARY KEY (run_id, no)
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_runs_created ON runs(created_at);
+        """)
+        self.conn.commit()
+
+    # ---------------------------------------------------------------------
+    # 실행(run) 관리
+    # ---------------------------------------------------------------------
+
+    def start_run(self, run_id: Optional[str] = None, excel_path: str = "") -> str:
+        """새 실행 등록"""
+        run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.conn.execute(
+            "INSERT OR IGNORE INTO runs (run_id, excel_path, created_at) VALUES (?, ?, ?)",
+            (run_id, excel_path, datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'))
+        )
+        self.conn.commit()
+        return run_id
+
+    def latest_run(self) -> Optional[str]:
+        """가장 최근 실행 ID (등록 시각 기준)"""
+        row = self.conn.execute(
+            "SELECT run_id FROM runs ORDER BY created_at DESC LIMIT 1"
+        ).fetchone()
+        return row[0] if row else None
+
+    # ---------------------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------------------
+
+    def is_processed(self, run_id: str, no: Any) -> bool:
+        """처리 여부 (기본키 조회, 버퍼 포함)"""
+        try:
+            no = int(no)
+        except (TypeError, ValueError):
+            return False
+
+        if any(r[0] == run_id and r[1] == no for r in self._buffer):
+            return True
+
+        row = self.conn.execute(
+            "SELECT 1 FROM results WHERE run_id = ? AND no = ?", (run_id, no)
+        ).fetchone()
+        return row is not None
+
+    def count(self, run_id: str) -> int:
+        """저장된 결과 수 (버퍼 제외)"""
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM results WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        return row[0]
+
+    # ---------------------------------------------------------------------
+    # 저장
+    # ---------------------------------------------------------------------
+
+    def add(self, run_id: str, result: Dict[str, Any]):
+        """결과 추가 (버퍼링, 조건 충족 시 자동 저장)"""
+        self._buffer.append((
+            run_id,
+            int(result['no']),
+            result.get('processed_at', ''),
+            json.dumps(result, ensure_ascii=False, default=str),
+        ))
+
+        if len(self._buffer) >= self.batch_size or \
+                time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> int:
+        """버퍼를 한 트랜잭션으로 저장"""
+        if not self._buffer:
+            return 0
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO results (run_id, no, processed_at, data) VALUES (?, ?, ?, ?)",
+                self._buffer
+            )
+
+        saved = len(self._buffer)
+        self._buffer.clear()
+        self._last_flush = time.monotonic()
+        return saved
+
+    def import_csv(self, csv_path: str, run_id: str) -> int:
+        """기존 matching_results_*.csv 가져오기 (레거시 이어하기용)"""
+        df = pd.read_csv(csv_path, encoding='utf-8-sig')
+        df = df.astype(object).where(pd.notna(df), None)
+
+        self.start_run(run_id, "")
+        for record in df.to_dict('records'):
+            if record.get('no') is None:
+                continue
+            self.add(run_id, record)
+        self.flush()
+        return len(df)
+
+    # ---------------------------------------------------------------------
+    # Export
+    # ---------------------------------------------------------------------
+
+    def to_dataframe(self, run_id: str) -> pd.DataFrame:
+        """실행 결과 DataFrame (no 순)"""
+        self.flush()
+        rows = self.conn.execute(
+            "SELECT data FROM results WHERE run_id = ? ORDER BY no", (run_id,)
+        ).fetchall()
+        return pd.DataFrame([json.loads(r[0]) for r in rows])
+
+    def export_csv(self, run_id: str, path: str) -> Path:
+        df = self.to_dataframe(run_id)
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+        return Path(path)
+
+    def export_excel(self, run_id: str, path: str) -> Path:
+        df = self.to_dataframe(run_id)
+        df.to_excel(path, index=False)
+        return Path(path)
+
+    def close(self):
+        """남은 버퍼 저장 후 종료"""
+        try:
+            self.flush()
+        finally:
+            self.conn.close()
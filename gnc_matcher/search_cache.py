@@ -0,0 +1,134 @@
+"""
+검색 결과 캐시 (SQLite, TTL + stale-while-revalidate)
+- GNC: product_code → GNCProduct
+- 쿠팡: 정규화된 검색어 → List[CoupangProduct]
+
+TTL 이내: 신선 → 그대로 사용
+TTL ~ TTL+stale 구간: 오래됨 → 일단 사용하고 재검증 대기열에 등록
+그 이후: 만료 → 새로 검색
+"""
+
+import json
+import re
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DEFAULT_CACHE_PATH = "search_cache.db"
+
+NS_GNC = "gnc"
+NS_COUPANG = "coupang"
+
+
+def normalize_query(query: str) -> str:
+    """검색어 정규화 (대소문자/공백 차이 무시)"""
+    return re.sub(r'\s+', ' ', str(query or '')).strip().lower()
+
+
+class SearchCache:
+    """검색 결과 영속 캐시"""
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_CACHE_PATH,
+        ttl_hours: float = 24 * 7,
+        stale_hours: float = 24 * 7,
+        store_html: bool = False,
+    ):
+        """
+        Args:
+            db_path: 캐시 DB 경로
+            ttl_hours: 신선 기간 (시간)
+            stale_hours: TTL 이후 재검증 전까지 사용 가능한 기간 (시간)
+            store_html: 원본 HTML도 함께 저장할지
+        """
+        self.db_path = str(db_path)
+        self.ttl = ttl_hours * 3600
+        self.stale = stale_hours * 3600
+        self.store_html = store_html
+
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS search_cache (
+                namespace   TEXT NOT NULL,
+                key         TEXT NOT NULL,
+                payload     TEXT NOT NULL,
+                raw_html    TEXT,
+                fetched_at  REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+        # 재검증 대기열 {(namespace, key): 원본 인자}
+        self._pending: Dict[Tuple[str, str], dict] = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """
+        캐시 조회
+
+        Returns:
+            payload (dict/list) 또는 None (미스/만료)
+        """
+        row = self.conn.execute(
+            "SELECT payload, fetched_at FROM search_cache WHERE namespace = ? AND key = ?",
+            (namespace, key)
+        ).fetchone()
+
+        if not row:
+            self.misses += 1
+            return None
+
+        payload, fetched_at = row
+        age = time.time() - fetched_at
+
+        if age <= self.ttl:
+            self.hits += 1
+            return json.loads(payload)
+
+        if age <= self.ttl + self.stale:
+            self.stale_hits += 1
+            data = json.loads(payload)
+            self._pending[(namespace, key)] = data.get('_args', {})
+            return data
+
+        self.misses += 1
+        return None
+
+    def set(self, namespace: str, key: str, payload: dict, raw_html: Optional[str] = None):
+        """캐시 저장 (payload['_args']에 재검증용 원본 인자 보관)"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO search_cache (namespace, key, payload, raw_html, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                namespace, key,
+                json.dumps(payload, ensure_ascii=False, default=str),
+                raw_html if self.store_html else None,
+                time.time(),
+            )
+        )
+        self.conn.commit()
+        self._pending.pop((namespace, key), None)
+
+    def pending_revalidation(self, namespace: str) -> List[dict]:
+        """재검증 대기 중인 항목의 원본 인자 목록"""
+        return [args for (ns, _), args in list(self._pending.items()) if ns == namespace]
+
+    def purge_expired(self) -> int:
+        """stale 기간까지 지난 항목 삭제"""
+        cutoff = time.time() - (self.ttl + self.stale)
+        cur = self.conn.execute("DELETE FROM search_cache WHERE fetched_at < ?", (cutoff,))
+        self.conn.commit()
+        return cur.rowcount
+
+    def stats(self) -> str:
+        return f"hit {self.hits} / stale {self.stale_hits} / miss {self.misses}"
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,80 @@
+"""
+GNC 상품 리스트 엑셀 로더
+✨ read-only 스트리밍 1회 파싱으로 상품 행 + 빨간색 폰트(우선순위) 동시 추출
+"""
+
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List
+
+from openpyxl import load_workbook
+
+
+RED_RGB = 'FFFF0000'
+
+
+@dataclass
+class ProductSheet:
+    """엑셀 파싱 결과"""
+    headers: List[Any]
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    priority_numbers: List[int] = field(default_factory=list)
+
+
+def _is_red_font(cell) -> bool:
+    """A열 셀 폰트가 빨간색인지 (read-only 셀은 style 배열에서 조회)"""
+    font = getattr(cell, 'font', None)
+    if not font or not font.color:
+        return False
+    rgb = str(font.color.rgb) if hasattr(font.color, 'rgb') else ''
+    return RED_RGB in rgb
+
+
+def load_product_sheet(excel_path: str) -> ProductSheet:
+    """
+    상품 시트 로드 (파일이 바뀌지 않았으면 이전 파싱 결과 재사용)
+
+    Returns:
+        ProductSheet(headers, rows, priority_numbers)
+    """
+    stat = os.stat(excel_path)
+    return _load_product_sheet(os.path.abspath(excel_path), stat.st_mtime, stat.st_size)
+
+
+@lru_cache(maxsize=4)
+def _load_product_sheet(excel_path: str, mtime: float, size: int) -> ProductSheet:
+    wb = load_workbook(excel_path, read_only=True)
+    try:
+        ws = wb.active
+        rows_iter = ws.iter_rows()
+
+        header_row = next(rows_iter, None)
+        if header_row is None:
+            return ProductSheet(headers=[])
+
+        headers = [cell.value for cell in header_row]
+        no_idx = headers.index('NO') if 'NO' in headers else 0
+        width = len(headers)
+
+        sheet = ProductSheet(headers=headers)
+
+        for row in rows_iter:
+            values = [getattr(cell, 'value', None) for cell in row[:width]]
+            if len(values) < width:
+                values.extend([None] * (width - len(values)))
+
+            if all(v is None for v in values):
+                continue
+
+            sheet.rows.append(dict(zip(headers, values)))
+
+            # 스타일 조회는 A열만
+            if row and _is_red_font(row[0]):
+                no_value = values[no_idx]
+                if no_value:
+                    sheet.priority_numbers.append(int(no_value))
+
+        return sheet
+    finally:
+        wb.close()
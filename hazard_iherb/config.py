@@ -16,6 +16,7 @@ MFDS_API_KEY = "ec1d322edd5e4fc2a3f6"
 SERVICE_ID = "I2715"
 BASE_URL = "http://openapi.foodsafetykorea.go.kr/api"
 PAGE_SIZE = 1000
+MFDS_PARALLELISM = 4  # 동시 페이지 요청 수
 
 # Gemini API
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -29,6 +30,18 @@ IMG_DIR = PROJECT_DIR / "hazard_images"
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 UNIFIED_CSV = PROJECT_DIR / "csv" / "unified_results.csv"
 
+# 결과 저널 (append-only, UNIFIED_CSV는 여기서 compact하여 생성)
+RESULT_JOURNAL_DB = PROJECT_DIR / "csv" / "unified_results.db"
+
+# 이미지 저장소 (내용/지각 해시 → 이전 검색·검증 결과)
+IMAGE_STORE_DB = PROJECT_DIR / "csv" / "image_store.db"
+
+# iHerb 스크래핑 캐시 (상품코드 → 브랜드/제품명/이미지)
+SCRAPE_CACHE_DB = PROJECT_DIR / "csv" / "scrape_cache.db"
+
+# 쿠팡 통합 DB (products.upc / part_number → 바코드 매칭)
+INTEGRATED_DB = PROJECT_DIR.parent / "coupang" / "data" / "rocket_iherb.db"
+
 # 통합 컬럼 정의
 UNIFIED_COLUMNS = [
     # 기본 정보 (식약처 API)
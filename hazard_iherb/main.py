@@ -3,18 +3,16 @@
 """
 통합 Phase: 검색 → 스크래핑 → 검증 (한번에)
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-브라우저 2개로 모든 단계를 순차적으로 처리
-- 브라우저 1: Google 검색 + iHerb 스크래핑
-- 브라우저 2: Gemini 검증
-- 결과: 단일 unified_results.csv로 저장
+검색 브라우저 N개 + Gemini 브라우저 M개를 워커 풀로 운용
+- 검색 워커: Google 검색 + iHerb 스크래핑 (각자 브라우저/프로필)
+- 검증 워커: 검증 큐에서 꺼내 Gemini 검증
+- 결과: 단일 writer(메인 스레드)가 저널에 기록 → unified_results.csv
 """
 
-import os
-import json
 import time
+import queue
 import argparse
-from datetime import datetime
-from pathlib import Path
+import threading
 
 import pandas as pd
 
@@ -23,288 +21,265 @@ from config import (
     Status,
     PROJECT_DIR,
     UNIFIED_CSV,
-    UNIFIED_COLUMNS
+    UNIFIED_COLUMNS,
+    RESULT_JOURNAL_DB,
+    IMAGE_STORE_DB,
+    SCRAPE_CACHE_DB,
+    INTEGRATED_DB
 )
-from utils.selenium_utils import create_driver
-from utils.image_utils import download_image, extract_product_code, extract_iherb_code
-from scrapers.google_search import GoogleImageSearch
-from scrapers.iherb_scraper import IHerbScraper
-from scrapers.gemini_verifier import GeminiVerifier
+from pipeline import (
+    SearchWorker,
+    VerifyWorker,
+    VerifyJob,
+    remember,
+    WAIT_AFTER_VERIFY
+)
+from scrapers.google_search import BlockGuard
 from services.mfds_api import fetch_hazard_data
-
-
-# 설정
-DEBUG_DIR = Path(__file__).parent / "debug"
-TEMP_DIR = Path(__file__).parent / "temp_images"
-MAX_MESSAGES_PER_CHAT = 5
-WAIT_AFTER_GOOGLE = 2
-WAIT_AFTER_SCRAPE = 2
-WAIT_AFTER_VERIFY = 5
+from services.result_journal import ResultJournal
+from services.image_store import ImageStore
+from services.scrape_cache import ScrapeCache
+from services.barcode_index import BarcodeIndex, build_barcode_index
 
 
 class UnifiedMatcher:
-    """통합 매칭 (검색 + 스크래핑 + 검증)"""
+    """통합 매칭 (검색 워커 N개 → 검증 큐 → 검증 워커 M개 → 단일 writer)"""
     
-    def __init__(self, headless: bool = False):
-        print(f"\n{'='*70}")
-        print(f"브라우저 초기화")
-        print(f"{'='*70}\n")
-        
-        # 브라우저 1: Google/iHerb
-        print(f"[1/2] Google/iHerb 브라우저 생성...")
-        self.main_driver = create_driver(headless, "MainBot")
-        self.google_search = GoogleImageSearch(self.main_driver)
-        self.iherb_scraper = IHerbScraper(self.main_driver)
-        print(f"      ✓ 준비 완료\n")
-        time.sleep(2)
-        
-        # 브라우저 2: Gemini
-        print(f"[2/2] Gemini 브라우저 생성...")
-        self.gemini_driver = create_driver(headless, "GeminiBot")
-        self.gemini_driver.get("https://gemini.google.com")
-        time.sleep(3)
-        self.gemini = GeminiVerifier(self.gemini_driver, TEMP_DIR, DEBUG_DIR)
-        print(f"      ✓ 준비 완료\n")
-        
-        # Gemini 로그인 확인
-        print(f"{'='*70}")
-        print(f"Gemini 로그인 확인")
-        print(f"{'='*70}\n")
-        print(f"Gemini 브라우저에서 로그인 후 Enter를 눌러주세요...")
-        print(f"⚠️  중요: Enter 누른 후 브라우저 창을 절대 닫지 마세요!\n")
-        input(f"준비되면 Enter...")
-        print(f"✓ 계속 진행\n")
-        time.sleep(2)
-        
-        # 채팅 카운터
-        self.chat_count = 0
-        self.headless = headless
-    
-    def process_item(self, row: pd.Series, idx: int, total: int) -> dict:
-        """
-        한 항목을 처음부터 끝까지 처리
-        
-        Returns:
-            결과 딕셔너리
-        """
-        # 새 채팅 시작 (5개마다)
-        if self.chat_count >= MAX_MESSAGES_PER_CHAT and self.chat_count > 0:
-            print(f"\n[CHAT] {self.chat_count}개 처리 → 새 채팅 시작\n")
-            self.gemini.start_new_chat()
-            self.chat_count = 0
-            time.sleep(3)
-        
-        seq = str(row['SELF_IMPORT_SEQ'])
-        prdt_nm = row['PRDT_NM']
-        mufc_nm = row.get('MUFC_NM', '')
-        image_url = row.get('IMAGE_URL', '')
-        
-        # 날짜 포맷팅
-        cret_dtm = row.get('CRET_DTM', '')
-        if cret_dtm and len(str(cret_dtm)) == 8:
-            date_str = str(cret_dtm)
-            date_display = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}"
-        else:
-            date_display = str(cret_dtm)
-        
-        # 제품명 짧게
-        prdt_display = prdt_nm[:50] + "..." if len(prdt_nm) > 50 else prdt_nm
+    def __init__(
+        self,
+        headless: bool = False,
+        barcode_index: BarcodeIndex = None,
+        workers: int = 1,
+        verifiers: int = 1,
+        verifier_engine: str = 'browser'
+    ):
+        # 검증 워커가 없으면 검색 워커가 가득 찬 검증 큐에서 영원히 대기
+        if workers < 1 or verifiers < 1:
+            raise ValueError(f"검색/검증 워커는 1개 이상 필요 (workers={workers}, verifiers={verifiers})")
         
         print(f"\n{'='*70}")
-        print(f"[{idx}/{total}] {date_display} | {prdt_display}")
-        print(f"SEQ: {seq}")
-        print(f"{'='*70}")
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 1단계: 이미지 확인 및 다운로드
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        
-        if not image_url or pd.isna(image_url):
-            print(f"  [STEP 1] ⊘ NO_IMAGE\n")
-            return self._create_result(row, Status.NO_IMAGE)
-        
-        image_path = download_image(str(image_url), save_dir=IMG_DIR)
-        if not image_path:
-            print(f"  [STEP 1] ⏬ DOWNLOAD_FAILED\n")
-            return self._create_result(row, Status.DOWNLOAD_FAILED)
-        
-        print(f"  [STEP 1] ✓ 이미지 다운로드 완료")
+        print(f"브라우저 초기화 (검색 {workers}개 / 검증 {verifiers}개)")
+        print(f"{'='*70}\n")
         
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 2단계: Google 역검색으로 iHerb URL 찾기
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        # 바코드/UPC/품번 인덱스 (역검색 전 단계)
+        self.barcode_index = barcode_index
         
-        print(f"  [STEP 2] Google 역검색 중...")
+        # 이미지 저장소 (중복 이미지 결과 재사용, 워커 공유)
+        self.image_store = ImageStore(IMAGE_STORE_DB, IMG_DIR)
         
-        # 세션 클리어 (검색 전에)
-        self.google_search.clear_session()
+        # iHerb 스크래핑 캐시 (같은 제품 재방문 없음, 워커 공유)
+        self.scrape_cache = ScrapeCache(SCRAPE_CACHE_DB)
         
-        # 검색 수행
-        iherb_url = self.google_search.find_iherb_url(image_path)
+        # Google 연속 차단 → 모든 검색 워커 일시 정지 / 중단 (워커 공유)
+        self.block_guard = BlockGuard()
         
-        # 이미지 삭제
-        try:
-            os.remove(image_path)
-        except:
-            pass
+        # 검색 브라우저: Google/iHerb
+        self.search_workers = []
+        for i in range(workers):
+            profile = "MainBot" if i == 0 else f"MainBot{i + 1}"
+            print(f"[검색 {i + 1}/{workers}] Google/iHerb 브라우저 생성 ({profile})...")
+            self.search_workers.append(
+                SearchWorker.create(
+                    f"S{i + 1}", headless, profile, self.image_store, barcode_index, self.scrape_cache,
+                    self.block_guard
+                )
+            )
+            print(f"      ✓ 준비 완료\n")
+            time.sleep(2)
+        
+        # 검증: Gemini 브라우저 또는 Gemini API (API는 공용 클라이언트가 쿼터 제어)
+        self.verify_workers = []
+        for i in range(verifiers):
+            profile = "GeminiBot" if i == 0 else f"GeminiBot{i + 1}"
+            label = "Gemini API 검증기" if verifier_engine == 'api' else f"Gemini 브라우저 ({profile})"
+            print(f"[검증 {i + 1}/{verifiers}] {label} 생성...")
+            self.verify_workers.append(
+                VerifyWorker.create(f"V{i + 1}", headless, profile, engine=verifier_engine)
+            )
+            print(f"      ✓ 준비 완료\n")
+        
+        # Gemini 로그인 확인 (브라우저 엔진만)
+        if verifier_engine == 'browser':
+            print(f"{'='*70}")
+            print(f"Gemini 로그인 확인")
+            print(f"{'='*70}\n")
+            print(f"Gemini 브라우저 {verifiers}개 모두 로그인 후 Enter를 눌러주세요...")
+            print(f"⚠️  중요: Enter 누른 후 브라우저 창을 절대 닫지 마세요!\n")
+            input(f"준비되면 Enter...")
+            print(f"✓ 계속 진행\n")
+            time.sleep(2)
         
-        if not iherb_url:
-            print(f"  [STEP 2] ✗ NOT_FOUND\n")
-            return self._create_result(row, Status.NOT_FOUND)
+        self.headless = headless
+        self._stop = threading.Event()
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 워커 풀
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    
+    def run(self, df_todo: pd.DataFrame, journal: ResultJournal) -> int:
+        """
+        워커 풀로 전체 처리
         
-        print(f"  [STEP 2] ✓ URL 발견: {iherb_url}")
+        검색 워커 → 검증 큐 → 검증 워커 → 결과 큐 → 호출 스레드(단일 writer)
         
-        # Google 검색 후 대기
-        time.sleep(WAIT_AFTER_GOOGLE)
+        Returns:
+            저널에 기록한 건수
+        """
+        total = len(df_todo)
         
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 3단계: iHerb 페이지 스크래핑
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        item_q = queue.Queue()
+        for idx, (_, row) in enumerate(df_todo.iterrows(), 1):
+            item_q.put((idx, row))
         
-        print(f"  [STEP 3] iHerb 스크래핑 중...")
-        scraped = self.iherb_scraper.scrape_product(iherb_url)
+        # 검증이 밀리면 검색 워커가 대기 (검증 대기열 상한)
+        verify_q = queue.Queue(maxsize=len(self.verify_workers) * 2)
+        result_q = queue.Queue()
+        self._stop.clear()
         
-        if not scraped['image_url'] or not scraped['product_name'] or not scraped['brand']:
-            print(f"  [STEP 3] ⚠ SCRAPE_FAILED\n")
-            return self._create_result(
-                row,
-                Status.SCRAPE_FAILED,
-                iherb_url=iherb_url,
-                product_code=extract_product_code(iherb_url)
+        searchers = [
+            threading.Thread(
+                target=self._search_loop, args=(w, item_q, verify_q, result_q, total),
+                name=w.name, daemon=True
             )
+            for w in self.search_workers
+        ]
+        verifiers = [
+            threading.Thread(
+                target=self._verify_loop, args=(w, verify_q, result_q),
+                name=w.name, daemon=True
+            )
+            for w in self.verify_workers
+        ]
         
-        print(f"  [STEP 3] ✓ 스크래핑 완료")
-        print(f"           제조사: {scraped['brand']}")
-        print(f"           제품명: {scraped['product_name'][:40]}...")
-        
-        # 스크래핑 후 대기
-        time.sleep(WAIT_AFTER_SCRAPE)
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 4단계: Gemini 이미지 검증
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        for t in searchers + verifiers:
+            t.start()
         
-        print(f"  [STEP 4] Gemini 검증 중...")
+        threading.Thread(
+            target=self._finish_when_done, args=(searchers, verifiers, verify_q, result_q),
+            daemon=True
+        ).start()
         
+        written = 0
+        retry_later = 0
         try:
-            is_match, reason = self.gemini.verify_images_with_retry(
-                hazard_image_url=str(image_url),
-                iherb_image_url=scraped['image_url'],
-                hazard_name=prdt_nm,
-                hazard_brand=mufc_nm,
-                iherb_name=scraped['product_name'],
-                iherb_brand=scraped['brand'],
-                seq=seq
-            )
+            while True:
+                try:
+                    outcome = result_q.get(timeout=1)
+                except queue.Empty:
+                    continue
+                
+                if outcome is None:
+                    break
+                
+                # 일시 실패 (검색 차단/오류) → 기록하지 않음, 다음 실행에서 재처리
+                if outcome.retry_later:
+                    retry_later += 1
+                    continue
+                
+                # 결과 즉시 저장 (저널에 1행 기록)
+                journal.append(outcome.result)
+                remember(self.image_store, outcome)
+                written += 1
+        finally:
+            self._stop.set()
+        
+        if self.block_guard.aborted:
+            print(f"\n[WARN] Google 연속 차단으로 검색 중단 - 남은 항목은 다음 실행에서 처리")
+        if retry_later:
+            print(f"\n[INFO] 일시 실패 {retry_later}건은 기록하지 않음 (다음 실행에서 재처리)")
+        return written
+    
+    def _search_loop(self, worker: SearchWorker, item_q: queue.Queue, verify_q: queue.Queue,
+                     result_q: queue.Queue, total: int):
+        # 연속 차단으로 중단되면 남은 항목은 꺼내지 않음 (미처리 → 다음 실행에서)
+        while not self._stop.is_set() and not self.block_guard.aborted:
+            try:
+                idx, row = item_q.get_nowait()
+            except queue.Empty:
+                return
             
-            self.chat_count += 1
+            try:
+                prepared = worker.prepare(row, idx, total)
+            except Exception as e:
+                print(f"\n[ERROR] {worker.name} SEQ {row['SELF_IMPORT_SEQ']}: {e}")
+                continue
             
-            if is_match:
-                print(f"  [STEP 4] ✓ VERIFIED_MATCH")
-                print(f"           이유: {reason[:80]}...")
-                status = Status.VERIFIED_MATCH
+            if isinstance(prepared, VerifyJob):
+                self._put(verify_q, prepared)
             else:
-                print(f"  [STEP 4] ✗ VERIFIED_MISMATCH")
-                print(f"           이유: {reason[:80]}...")
-                status = Status.VERIFIED_MISMATCH
+                result_q.put(prepared)
+                time.sleep(1)  # NOT_FOUND, NO_IMAGE 등은 1초만
+    
+    def _verify_loop(self, worker: VerifyWorker, verify_q: queue.Queue, result_q: queue.Queue):
+        while True:
+            job = verify_q.get()
+            if job is None:
+                return
+            if self._stop.is_set():
+                continue
             
-            return self._create_result(
-                row,
-                status,
-                iherb_url=iherb_url,
-                product_code=extract_product_code(iherb_url),
-                iherb_brand=scraped['brand'],
-                iherb_name=scraped['product_name'],
-                iherb_images=json.dumps([scraped['image_url']]),
-                gemini_verified=is_match,
-                gemini_reason=reason
-            )
+            try:
+                outcome = worker.verify(job)
+            except Exception as e:
+                print(f"\n[ERROR] {worker.name} SEQ {job.row['SELF_IMPORT_SEQ']}: {e}")
+                continue
             
-        except Exception as e:
-            print(f"  [STEP 4] ⚠ 검증 실패: {e}\n")
-            return self._create_result(
-                row,
-                Status.FOUND,  # URL은 찾았지만 검증 실패
-                iherb_url=iherb_url,
-                product_code=extract_product_code(iherb_url),
-                iherb_brand=scraped['brand'],
-                iherb_name=scraped['product_name'],
-                iherb_images=json.dumps([scraped['image_url']])
-            )
+            result_q.put(outcome)
+            
+            # Rate limit 대응 (Gemini 브라우저 사용한 경우만 대기)
+            if outcome.used_gemini and worker.throttled:
+                time.sleep(WAIT_AFTER_VERIFY)
     
-    def _create_result(self, row: pd.Series, status: str, **kwargs) -> dict:
-        """결과 딕셔너리 생성"""
-        return {
-            'SELF_IMPORT_SEQ': str(row['SELF_IMPORT_SEQ']),
-            'PRDT_NM': row['PRDT_NM'],
-            'MUFC_NM': row.get('MUFC_NM', ''),
-            'MUFC_CNTRY_NM': row.get('MUFC_CNTRY_NM', ''),
-            'INGR_NM_LST': row.get('INGR_NM_LST', ''),
-            'CRET_DTM': row.get('CRET_DTM', ''),
-            'IMAGE_URL': row.get('IMAGE_URL', ''),
-            'IHERB_URL': kwargs.get('iherb_url', ''),
-            'product_code': kwargs.get('product_code', ''),
-            'IHERB_IMAGE_CODE': extract_iherb_code(kwargs.get('iherb_images', '')) or '',
-            'IHERB_제품명': kwargs.get('iherb_name', ''),
-            'IHERB_제조사': kwargs.get('iherb_brand', ''),
-            'IHERB_PRODUCT_IMAGES': kwargs.get('iherb_images', ''),
-            'STATUS': status,
-            'SCRAPED_AT': datetime.now().strftime("%Y%m%d%H%M%S"),
-            'GEMINI_VERIFIED': str(kwargs.get('gemini_verified', '')),
-            'GEMINI_REASON': str(kwargs.get('gemini_reason', '')),
-            'VERIFIED_AT': datetime.now().strftime("%Y%m%d%H%M%S") if kwargs.get('gemini_verified') is not None else ''
-        }
-
+    def _put(self, q: queue.Queue, item):
+        """중단 신호를 확인하며 대기열에 넣기"""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=1)
+                return
+            except queue.Full:
+                continue
     
+    def _finish_when_done(self, searchers, verifiers, verify_q: queue.Queue, result_q: queue.Queue):
+        """검색 종료 → 검증 워커 종료 신호 → 결과 큐 종료 신호"""
+        for t in searchers:
+            t.join()
+        for _ in verifiers:
+            verify_q.put(None)
+        for t in verifiers:
+            t.join()
+        result_q.put(None)
     
     def close(self):
         """브라우저 종료"""
-        try:
-            self.main_driver.quit()
-        except:
-            pass
+        self._stop.set()
         
-        try:
-            self.gemini_driver.quit()
-        except:
-            pass
+        print(f"[IMAGE STORE] 중복 재사용: {self.image_store.stats()}")
+        print(f"[SCRAPE CACHE] iHerb 재사용: {self.scrape_cache.stats()}")
+        if self.barcode_index:
+            print(f"[BARCODE] 식별자 일치: {self.barcode_index.stats()}")
+        
+        for worker in self.search_workers + self.verify_workers:
+            worker.close()
+        
+        self.image_store.close()
+        self.scrape_cache.close()
 
 
-def save_result_to_unified_csv(result: dict):
-    """
-    결과를 unified_results.csv에 저장 (append 방식)
-    
-    Args:
-        result: 처리 결과 딕셔너리
-    """
-    # 기존 데이터 로드
-    if UNIFIED_CSV.exists():
-        try:
-            df_existing = pd.read_csv(UNIFIED_CSV, encoding="utf-8-sig", dtype=str)
-        except:
-            df_existing = pd.DataFrame()
-    else:
-        df_existing = pd.DataFrame()
-    
-    # 새 데이터 추가
-    df_new = pd.DataFrame([result])
-    
-    # 중복 제거 (SELF_IMPORT_SEQ 기준)
-    if not df_existing.empty:
-        df_existing = df_existing[df_existing['SELF_IMPORT_SEQ'] != result['SELF_IMPORT_SEQ']]
-        df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-    else:
-        df_combined = df_new
-    
-    # 컬럼 순서 맞추기
-    for col in UNIFIED_COLUMNS:
-        if col not in df_combined.columns:
-            df_combined[col] = ''
-    
-    df_combined = df_combined[UNIFIED_COLUMNS]
-    
-    # 저장
-    df_combined.to_csv(UNIFIED_CSV, index=False, encoding="utf-8-sig")
+def open_result_journal() -> ResultJournal:
+    """결과 저널 열기 (최초 1회 기존 unified_results.csv 가져오기)"""
+    journal = ResultJournal(RESULT_JOURNAL_DB, UNIFIED_COLUMNS)
+    imported = journal.import_csv(UNIFIED_CSV)
+    if imported:
+        print(f"[INFO] 기존 unified_results.csv → 저널 가져오기: {imported}건")
+    return journal
+
+
+def positive_int(value: str) -> int:
+    """argparse 타입: 1 이상 정수"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 함: {value}")
+    return number
 
 
 def main():
@@ -312,6 +287,10 @@ def main():
     parser.add_argument("--max-items", type=int, help="처리 개수 제한")
     parser.add_argument("--headless", action="store_true", help="헤드리스 모드")
     parser.add_argument("--start-seq", type=str, help="시작 SEQ (이어서 진행)")
+    parser.add_argument("--workers", type=positive_int, default=1, help="검색 브라우저 수")
+    parser.add_argument("--verifiers", type=positive_int, default=1, help="Gemini 검증 워커 수")
+    parser.add_argument("--verifier", choices=["browser", "api"], default="browser",
+                        help="검증 엔진 (browser: Gemini 웹 / api: Gemini API)")
     
     args = parser.parse_args()
     
@@ -336,18 +315,10 @@ def main():
     # 2. 미처리 항목 필터링
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     
-    # 기존 처리 결과 로드
-    if UNIFIED_CSV.exists():
-        try:
-            unified_df = pd.read_csv(UNIFIED_CSV, encoding="utf-8-sig", dtype=str)
-            processed_seqs = set(unified_df['SELF_IMPORT_SEQ'].astype(str))
-            print(f"[INFO] 기존 처리: {len(processed_seqs)}건")
-        except:
-            processed_seqs = set()
-            print(f"[INFO] 기존 처리: 0건")
-    else:
-        processed_seqs = set()
-        print(f"[INFO] 기존 처리: 0건")
+    # 기존 처리 결과 (저널 인덱스 조회)
+    journal = open_result_journal()
+    processed_seqs = journal.processed_seqs()
+    print(f"[INFO] 기존 처리: {len(processed_seqs)}건")
     
     # 미처리만 필터링
     hazard_df['SELF_IMPORT_SEQ'] = hazard_df['SELF_IMPORT_SEQ'].astype(str)
@@ -370,86 +341,86 @@ def main():
     
     if df_todo.empty:
         print("[INFO] 처리할 항목 없음")
+        journal.close()
         return
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 3. Matcher 초기화 및 처리
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     
-    matcher = UnifiedMatcher(headless=args.headless)
+    barcode_index = build_barcode_index(INTEGRATED_DB, journal)
+    matcher = UnifiedMatcher(
+        headless=args.headless,
+        barcode_index=barcode_index,
+        workers=args.workers,
+        verifiers=args.verifiers,
+        verifier_engine=args.verifier
+    )
     
     try:
-        total = len(df_todo)
-        
-        for idx, (_, row) in enumerate(df_todo.iterrows(), 1):
-            # 한 항목 처리 (검색 → 스크래핑 → 검증)
-            result = matcher.process_item(row, idx, total)
-            
-            # 결과 즉시 저장
-            save_result_to_unified_csv(result)
-            
-            # Rate limit 대응 (Gemini 사용한 경우만 15초 대기)
-            if result['STATUS'] in [Status.VERIFIED_MATCH, Status.VERIFIED_MISMATCH]:
-                time.sleep(WAIT_AFTER_VERIFY)
-            else:
-                time.sleep(1)  # NOT_FOUND, NO_IMAGE 등은 1초만
-        
-        # 최종 통계
-        print_final_stats()
-        
-        # 매칭 성공 항목만 추출
-        export_matched_only()
+        # 검색 → 스크래핑 → 검증 (워커 풀, 결과는 저널에 즉시 기록)
+        written = matcher.run(df_todo, journal)
+        print(f"\n[INFO] 이번 실행 처리: {written}건")
         
     except KeyboardInterrupt:
         print("\n\n[INTERRUPTED] 중단됨")
-        print_final_stats()
-        export_matched_only()
     
     except Exception as e:
         print(f"\n\n[ERROR] 예외 발생: {e}")
-        print_final_stats()
-        export_matched_only()
     
     finally:
         matcher.close()
+        
+        # 저널 → unified_results.csv / matched_only.csv
+        compact_results(journal)
+        journal.close()
 
 
-def print_final_stats():
-    """최종 통계 출력"""
-    if not UNIFIED_CSV.exists():
-        return
+def compact_results(journal: ResultJournal):
+    """저널을 CSV로 materialize 후 통계 출력"""
+    try:
+        total = journal.compact(UNIFIED_CSV)
+        print(f"\n[SAVE] {UNIFIED_CSV} ({total}건)")
+    except Exception as e:
+        print(f"[ERROR] CSV 생성 실패: {e}")
     
+    # 최종 통계
+    print_final_stats(journal)
+    
+    # 매칭 성공 항목만 추출
+    export_matched_only(journal)
+
+
+def print_final_stats(journal: ResultJournal):
+    """최종 통계 출력"""
     try:
-        df = pd.read_csv(UNIFIED_CSV, encoding="utf-8-sig", dtype=str)
+        status_counts = journal.status_counts()
         
         print(f"\n{'='*70}")
         print(f"최종 통계")
         print(f"{'='*70}")
-        print(f"총 처리:             {len(df)}건")
+        print(f"총 처리:             {sum(status_counts.values())}건")
         print(f"{'━'*70}")
         
-        if 'STATUS' in df.columns:
-            status_counts = df['STATUS'].value_counts()
-            
-            match = status_counts.get(Status.VERIFIED_MATCH, 0)
-            mismatch = status_counts.get(Status.VERIFIED_MISMATCH, 0)
-            not_found = status_counts.get(Status.NOT_FOUND, 0)
-            scrape_failed = status_counts.get(Status.SCRAPE_FAILED, 0)
-            no_image = status_counts.get(Status.NO_IMAGE, 0)
-            download_failed = status_counts.get(Status.DOWNLOAD_FAILED, 0)
-            
-            print(f"매칭 성공:           {match}건 ✓")
-            print(f"매칭 실패:           {mismatch}건")
-            print(f"URL 미발견:          {not_found}건")
-            print(f"스크래핑 실패:       {scrape_failed}건")
-            print(f"이미지 없음:         {no_image}건")
-            print(f"다운로드 실패:       {download_failed}건")
-            print(f"{'━'*70}")
-            
-            total_processed = match + mismatch + not_found + scrape_failed + no_image + download_failed
-            if total_processed > 0:
-                success_rate = (match / total_processed) * 100
-                print(f"성공률:             {success_rate:.1f}%")
+        match = status_counts.get(Status.VERIFIED_MATCH, 0)
+        mismatch = status_counts.get(Status.VERIFIED_MISMATCH, 0)
+        not_found = status_counts.get(Status.NOT_FOUND, 0)
+        scrape_failed = status_counts.get(Status.SCRAPE_FAILED, 0)
+        no_image = status_counts.get(Status.NO_IMAGE, 0)
+        download_failed = status_counts.get(Status.DOWNLOAD_FAILED, 0)
+        
+        print(f"매칭 성공:           {match}건 ✓")
+        print(f"매칭 실패:           {mismatch}건")
+        print(f"URL 미발견:          {not_found}건")
+        print(f"스크래핑 실패:       {scrape_failed}건")
+        print(f"이미지 없음:         {no_image}건")
+        print(f"다운로드 실패:       {download_failed}건")
+        print(f"{'━'*70}")
+        
+        total_processed = match + mismatch + not_found + scrape_failed + no_image + download_failed
+        if total_processed > 0:
+            success_rate = (match / total_processed) * 100
+            print(f"성공률:             {success_rate:.1f}%")
         
         print(f"{'='*70}\n")
         
@@ -457,22 +428,16 @@ def print_final_stats():
         print(f"[ERROR] 통계 출력 실패: {e}")
 
 
-def export_matched_only():
+def export_matched_only(journal: ResultJournal):
     """매칭 성공한 항목만 추출"""
-    if not UNIFIED_CSV.exists():
-        return
-    
     try:
-        df = pd.read_csv(UNIFIED_CSV, encoding="utf-8-sig", dtype=str)
-        df_matched = df[df['STATUS'] == Status.VERIFIED_MATCH].copy()
-        
-        if df_matched.empty:
+        if not journal.status_counts().get(Status.VERIFIED_MATCH):
             return
         
         matched_csv = PROJECT_DIR / "csv" / "matched_only.csv"
-        df_matched.to_csv(matched_csv, index=False, encoding="utf-8-sig")
+        matched = journal.compact(matched_csv, status=Status.VERIFIED_MATCH)
         
-        print(f"[EXPORT] 매칭 성공 항목만 추출: {len(df_matched)}건")
+        print(f"[EXPORT] 매칭 성공 항목만 추출: {matched}건")
         print(f"[SAVE] {matched_csv}\n")
         
     except Exception as e:
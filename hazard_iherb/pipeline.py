@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검색/검증 워커
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- SearchWorker: 브라우저 1개 - 바코드 → 이미지 → Google 역검색 → iHerb 스크래핑
+- VerifyWorker: 이미지 검증 (Gemini 브라우저 1개 또는 Gemini API)
+- 검색 워커 결과 중 검증이 필요한 항목만 VerifyJob으로 검증 큐에 들어감
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import pandas as pd
+
+from config import Status
+from utils.selenium_utils import create_driver
+from utils.image_utils import extract_product_code, extract_iherb_code
+from scrapers.google_search import GoogleImageSearch, BlockGuard, SearchBlocked, SearchError
+from scrapers.iherb_scraper import IHerbScraper
+from scrapers.base_verifier import BaseVerifier
+from scrapers.gemini_verifier import GeminiVerifier
+from services.image_store import ImageStore
+from services.barcode_index import BarcodeIndex, is_product_url
+from services.scrape_cache import ScrapeCache
+
+
+# 설정
+DEBUG_DIR = Path(__file__).parent / "debug"
+TEMP_DIR = Path(__file__).parent / "temp_images"
+MAX_MESSAGES_PER_CHAT = 5
+WAIT_AFTER_GOOGLE = 2
+WAIT_AFTER_SCRAPE = 2
+WAIT_AFTER_VERIFY = 5
+
+# 같은 이미지(sha256)면 그대로 재사용할 최종 상태 (실제 판정/검색 결과만 저장됨)
+REUSABLE_STATUSES = (Status.VERIFIED_MATCH, Status.VERIFIED_MISMATCH, Status.NOT_FOUND)
+
+
+@dataclass
+class VerifyJob:
+    """검증 대기 항목 (스크래핑까지 완료)"""
+    row: pd.Series
+    iherb_url: str
+    scraped: Dict
+    image_sha: str = ''
+
+
+@dataclass
+class ItemOutcome:
+    """항목 처리 결과 (writer로 전달)"""
+    result: dict
+    image_sha: str = ''
+    used_gemini: bool = False
+    retry_later: bool = False   # 일시 실패 (저널/저장소에 기록하지 않음 → 다음 실행에서 재처리)
+
+
+def create_result(row: pd.Series, status: str, **kwargs) -> dict:
+    """결과 딕셔너리 생성"""
+    return {
+        'SELF_IMPORT_SEQ': str(row['SELF_IMPORT_SEQ']),
+        'PRDT_NM': row['PRDT_NM'],
+        'MUFC_NM': row.get('MUFC_NM', ''),
+        'MUFC_CNTRY_NM': row.get('MUFC_CNTRY_NM', ''),
+        'INGR_NM_LST': row.get('INGR_NM_LST', ''),
+        'CRET_DTM': row.get('CRET_DTM', ''),
+        'IMAGE_URL': row.get('IMAGE_URL', ''),
+        'BARCD_CTN': row.get('BARCD_CTN', ''),
+        'IHERB_URL': kwargs.get('iherb_url', ''),
+        'product_code': kwargs.get('product_code', ''),
+        'IHERB_IMAGE_CODE': extract_iherb_code(kwargs.get('iherb_images', '')) or '',
+        'IHERB_제품명': kwargs.get('iherb_name', ''),
+        'IHERB_제조사': kwargs.get('iherb_brand', ''),
+        'IHERB_PRODUCT_IMAGES': kwargs.get('iherb_images', ''),
+        'STATUS': status,
+        'SCRAPED_AT': datetime.now().strftime("%Y%m%d%H%M%S"),
+        'GEMINI_VERIFIED': str(kwargs.get('gemini_verified', '')),
+        'GEMINI_REASON': str(kwargs.get('gemini_reason', '')),
+        'VERIFIED_AT': datetime.now().strftime("%Y%m%d%H%M%S") if kwargs.get('gemini_verified') is not None else ''
+    }
+
+
+def remember(image_store: ImageStore, outcome: ItemOutcome):
+    """이미지 저장소에 결과 기록 (다음 중복 이미지에서 재사용)"""
+    result = outcome.result
+    if not outcome.image_sha or outcome.retry_later:
+        return
+    if not result.get('IHERB_URL') and result['STATUS'] != Status.NOT_FOUND:
+        return
+
+    verified = result.get('GEMINI_VERIFIED')
+    image_store.record(
+        outcome.image_sha,
+        result['STATUS'],
+        seq=result['SELF_IMPORT_SEQ'],
+        iherb_url=result.get('IHERB_URL'),
+        product_code=result.get('product_code'),
+        iherb_brand=result.get('IHERB_제조사'),
+        iherb_name=result.get('IHERB_제품명'),
+        iherb_images=result.get('IHERB_PRODUCT_IMAGES'),
+        gemini_verified={'True': True, 'False': False}.get(verified),
+        gemini_reason=result.get('GEMINI_REASON'),
+    )
+
+
+class SearchWorker:
+    """Google 역검색 + iHerb 스크래핑 (브라우저 1개)"""
+
+    def __init__(
+        self,
+        name: str,
+        driver,
+        image_store: ImageStore,
+        barcode_index: Optional[BarcodeIndex] = None,
+        scrape_cache: Optional[ScrapeCache] = None,
+        block_guard: Optional[BlockGuard] = None
+    ):
+        self.name = name
+        self.driver = driver
+        self.google_search = GoogleImageSearch(driver)
+        self.iherb_scraper = IHerbScraper(driver, scrape_cache)
+        self.image_store = image_store
+        self.barcode_index = barcode_index
+        self.block_guard = block_guard
+
+    @classmethod
+    def create(cls, name: str, headless: bool, profile_name: str, image_store: ImageStore,
+               barcode_index: Optional[BarcodeIndex] = None,
+               scrape_cache: Optional[ScrapeCache] = None,
+               block_guard: Optional[BlockGuard] = None) -> "SearchWorker":
+        return cls(name, create_driver(headless, profile_name), image_store, barcode_index,
+                   scrape_cache, block_guard)
+
+    def prepare(self, row: pd.Series, idx: int, total: int) -> Union[ItemOutcome, VerifyJob]:
+        """
+        0~3단계 처리
+
+        Returns:
+            ItemOutcome (검증 불필요, 최종 결과) 또는 VerifyJob (검증 필요)
+        """
+        seq = str(row['SELF_IMPORT_SEQ'])
+        prdt_nm = row['PRDT_NM']
+        image_url = row.get('IMAGE_URL', '')
+
+        # 날짜 포맷팅
+        cret_dtm = row.get('CRET_DTM', '')
+        if cret_dtm and len(str(cret_dtm)) == 8:
+            date_str = str(cret_dtm)
+            date_display = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}"
+        else:
+            date_display = str(cret_dtm)
+
+        # 제품명 짧게
+        prdt_display = prdt_nm[:50] + "..." if len(prdt_nm) > 50 else prdt_nm
+
+        print(f"\n{'='*70}")
+        print(f"[{idx}/{total}] {date_display} | {prdt_display}")
+        print(f"SEQ: {seq} ({self.name})")
+        print(f"{'='*70}")
+
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        # 0단계: 바코드/UPC/품번 일치 (일치하면 역검색 생략)
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+        barcode_match = self.barcode_index.resolve(row.get('BARCD_CTN')) if self.barcode_index else None
+        if barcode_match:
+            print(f"  [STEP 0] ✓ 식별자 일치: {barcode_match.identifier} → {barcode_match.iherb_url}")
+
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        # 1단계: 이미지 확인 및 확보 (저장소 재사용)
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+        if not image_url or pd.isna(image_url):
+            found = self._identifier_only_outcome(row, barcode_match)
+            if found:
+                print(f"  [STEP 1] ⊘ NO_IMAGE (식별자 일치 URL만 기록)\n")
+                return found
+            print(f"  [STEP 1] ⊘ NO_IMAGE\n")
+            return ItemOutcome(create_result(row, Status.NO_IMAGE))
+
+        fetched = self.image_store.fetch(str(image_url))
+        if not fetched:
+            found = self._identifier_only_outcome(row, barcode_match)
+            if found:
+                print(f"  [STEP 1] ⏬ DOWNLOAD_FAILED (식별자 일치 URL만 기록)\n")
+                return found
+            print(f"  [STEP 1] ⏬ DOWNLOAD_FAILED\n")
+            return ItemOutcome(create_result(row, Status.DOWNLOAD_FAILED))
+
+        image_sha, image_path = fetched
+        print(f"  [STEP 1] ✓ 이미지 확보 ({image_sha[:12]})")
+
+        # 같은/거의 같은 이미지의 이전 결과 (판정 재사용은 같은 이미지만, 근사 중복은 URL만 재사용 후 재검증)
+        previous = self.image_store.lookup(image_sha)
+        if previous and previous['exact'] and previous['status'] in REUSABLE_STATUSES and not barcode_match:
+            print(f"  [STEP 1] ↺ 중복 이미지 (SEQ {previous['seq']}) → {previous['status']} 재사용\n")
+            fields = {k: v for k, v in previous.items() if k not in ('status', 'seq', 'exact')}
+            return ItemOutcome(create_result(row, previous['status'], **fields))
+
+        known_url = previous.get('iherb_url') if previous else None
+
+        if barcode_match:
+            prepared = self._search_and_scrape(row, image_path, image_sha, barcode_match.iherb_url)
+            if isinstance(prepared, VerifyJob):
+                return prepared
+            print(f"  [STEP 0] ⚠ 식별자 URL 스크래핑 실패 → 이미지 검색으로 진행")
+
+        return self._search_and_scrape(row, image_path, image_sha, known_url)
+
+    def _search_and_scrape(
+        self,
+        row: pd.Series,
+        image_path: Path,
+        image_sha: str,
+        iherb_url: str = None
+    ) -> Union[ItemOutcome, VerifyJob]:
+        """2~3단계: 역검색 → 스크래핑 (iherb_url을 알면 역검색 생략)"""
+
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        # 2단계: Google 역검색으로 iHerb URL 찾기
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+        if iherb_url:
+            print(f"  [STEP 2] ↺ 이전 검색 URL 재사용: {iherb_url}")
+        else:
+            # 연속 차단으로 전체 일시 정지 중이면 대기 (중단됐으면 다음 실행에서 재시도)
+            if self.block_guard and not self.block_guard.wait():
+                print(f"  [STEP 2] ⚠ 연속 차단으로 검색 중단 → 다음 실행에서 재시도\n")
+                return ItemOutcome(create_result(row, Status.NOT_FOUND), image_sha, retry_later=True)
+
+            print(f"  [STEP 2] Google 역검색 중...")
+
+            # 세션 준비 (차단 신호가 있었을 때만 전체 클리어)
+            self.google_search.prepare_session()
+
+            # 검색 수행 (차단/검색 실패는 NOT_FOUND가 아님 → 기록하지 않고 다음 실행에서 재시도)
+            try:
+                iherb_url = self.google_search.find_iherb_url(image_path)
+            except SearchError as e:
+                if isinstance(e, SearchBlocked) and self.block_guard:
+                    self.block_guard.record_block()
+                print(f"  [STEP 2] ⚠ 검색 실패 → 다음 실행에서 재시도: {e}\n")
+                return ItemOutcome(create_result(row, Status.NOT_FOUND), image_sha, retry_later=True)
+
+            if self.block_guard:
+                self.block_guard.record_success()
+
+            if not iherb_url:
+                print(f"  [STEP 2] ✗ NOT_FOUND\n")
+                return ItemOutcome(create_result(row, Status.NOT_FOUND), image_sha)
+
+            print(f"  [STEP 2] ✓ URL 발견: {iherb_url}")
+
+            # Google 검색 후 대기
+            time.sleep(WAIT_AFTER_GOOGLE)
+
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        # 3단계: iHerb 페이지 스크래핑
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+        print(f"  [STEP 3] iHerb 스크래핑 중...")
+        scraped = self.iherb_scraper.scrape_product(iherb_url)
+
+        if not scraped['image_url'] or not scraped['product_name'] or not scraped['brand']:
+            print(f"  [STEP 3] ⚠ SCRAPE_FAILED\n")
+            return ItemOutcome(create_result(
+                row,
+                Status.SCRAPE_FAILED,
+                iherb_url=iherb_url,
+                product_code=extract_product_code(iherb_url)
+            ), image_sha)
+
+        # 품번 검색 URL은 상품 페이지로 리다이렉트된 경우만 채택 (검색 결과 페이지 → 이미지 검색으로)
+        if not is_product_url(iherb_url):
+            if not is_product_url(scraped.get('url')):
+                print(f"  [STEP 3] ⚠ 상품 페이지로 이동하지 않음 (검색 결과 페이지)\n")
+                return ItemOutcome(create_result(row, Status.SCRAPE_FAILED, iherb_url=iherb_url), image_sha)
+            iherb_url = scraped['url']
+
+        print(f"  [STEP 3] ✓ 스크래핑 완료")
+        print(f"           제조사: {scraped['brand']}")
+        print(f"           제품명: {scraped['product_name'][:40]}...")
+
+        # 스크래핑 후 대기 (캐시 반환 시 생략)
+        if not scraped.get('cached'):
+            time.sleep(WAIT_AFTER_SCRAPE)
+
+        return VerifyJob(row=row, iherb_url=iherb_url, scraped=scraped, image_sha=image_sha)
+
+    def _identifier_only_outcome(self, row: pd.Series, barcode_match) -> Optional[ItemOutcome]:
+        """이미지 없이 식별자 일치만 있는 경우 → 상품 URL을 FOUND로 (이미지 검증 불가, URL만 기록)"""
+        product_url = self._resolve_product_url(barcode_match.iherb_url) if barcode_match else None
+        if not product_url:
+            return None
+        return ItemOutcome(create_result(
+            row,
+            Status.FOUND,
+            iherb_url=product_url,
+            product_code=extract_product_code(product_url)
+        ))
+
+    def _resolve_product_url(self, iherb_url: str) -> Optional[str]:
+        """식별자 URL → 상품 URL (품번 검색 URL은 방문해 리다이렉트된 상품 페이지만 인정)"""
+        if is_product_url(iherb_url):
+            return iherb_url
+        scraped = self.iherb_scraper.scrape_product(iherb_url)
+        final_url = scraped.get('url')
+        return final_url if is_product_url(final_url) else None
+
+    def close(self):
+        print(f"[SESSION] {self.name}: {self.google_search.session_stats()}")
+        try:
+            self.driver.quit()
+        except:
+            pass
+
+
+class VerifyWorker:
+    """이미지 검증 (browser: Gemini 웹 / api: Gemini API)"""
+
+    def __init__(self, name: str, verifier: BaseVerifier, driver=None):
+        self.name = name
+        self.driver = driver
+        self.gemini = verifier
+        self.chat_count = 0
+
+    @classmethod
+    def create(cls, name: str, headless: bool, profile_name: str,
+               engine: str = 'browser') -> "VerifyWorker":
+        if engine == 'api':
+            # 지연 import: browser 엔진만 쓸 때 gemini_client 의존 없음
+            from config import GEMINI_API_KEY
+            from scrapers.api_verifier import ApiVerifier
+            return cls(name, ApiVerifier(api_key=GEMINI_API_KEY))
+
+        driver = create_driver(headless, profile_name)
+        driver.get("https://gemini.google.com")
+        time.sleep(3)
+        return cls(name, GeminiVerifier(driver, TEMP_DIR, DEBUG_DIR), driver)
+
+    @property
+    def throttled(self) -> bool:
+        """검증 후 고정 대기 필요 여부 (API는 클라이언트가 쿼터 제어)"""
+        return self.driver is not None
+
+    def verify(self, job: VerifyJob) -> ItemOutcome:
+        """4단계: Gemini 이미지 검증"""
+        # 새 채팅 시작 (5개마다, 채팅 UI 엔진만)
+        if self.gemini.needs_chat_rotation and self.chat_count >= MAX_MESSAGES_PER_CHAT:
+            print(f"\n[CHAT] {self.name}: {self.chat_count}개 처리 → 새 채팅 시작\n")
+            self.gemini.start_new_chat()
+            self.chat_count = 0
+            time.sleep(3)
+
+        row = job.row
+        scraped = job.scraped
+        iherb_url = job.iherb_url
+        seq = str(row['SELF_IMPORT_SEQ'])
+
+        print(f"  [STEP 4] Gemini 검증 중... (SEQ {seq}, {self.name})")
+
+        try:
+            is_match, reason = self.gemini.verify_images_with_retry(
+                hazard_image_url=str(row.get('IMAGE_URL', '')),
+                iherb_image_url=scraped['image_url'],
+                hazard_name=row['PRDT_NM'],
+                hazard_brand=row.get('MUFC_NM', ''),
+                iherb_name=scraped['product_name'],
+                iherb_brand=scraped['brand'],
+                seq=seq
+            )
+
+            self.chat_count += 1
+
+            if is_match:
+                print(f"  [STEP 4] ✓ VERIFIED_MATCH (SEQ {seq})")
+                print(f"           이유: {reason[:80]}...")
+                status = Status.VERIFIED_MATCH
+            else:
+                print(f"  [STEP 4] ✗ VERIFIED_MISMATCH (SEQ {seq})")
+                print(f"           이유: {reason[:80]}...")
+                status = Status.VERIFIED_MISMATCH
+
+            return ItemOutcome(create_result(
+                row,
+                status,
+                iherb_url=iherb_url,
+                product_code=extract_product_code(iherb_url),
+                iherb_brand=scraped['brand'],
+                iherb_name=scraped['product_name'],
+                iherb_images=json.dumps([scraped['image_url']]),
+                gemini_verified=is_match,
+                gemini_reason=reason
+            ), job.image_sha, used_gemini=True)
+
+        except Exception as e:
+            # 판정 없음 (VerificationError 등) → 불일치가 아닌 FOUND로 기록, 판정 재사용 안 됨
+            print(f"  [STEP 4] ⚠ 검증 실패: {e}\n")
+            return ItemOutcome(create_result(
+                row,
+                Status.FOUND,  # URL은 찾았지만 검증 실패
+                iherb_url=iherb_url,
+                product_code=extract_product_code(iherb_url),
+                iherb_brand=scraped['brand'],
+                iherb_name=scraped['product_name'],
+                iherb_images=json.dumps([scraped['image_url']])
+            ), job.image_sha)
+
+    def close(self):
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except:
+            pass
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gemini API 이미지 검증
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- 두 이미지 + 제품명/브랜드를 멀티모달 요청 1회로 전송
+- JSON 구조화 응답 {"match", "confidence", "reason"} 파싱
+- gemini_client 공용 클라이언트의 RPM/TPM 버킷으로 동시 요청 제어
+  (검증 워커 여러 개가 같은 클라이언트를 공유)
+- 재시도는 응답 파싱 실패만 (429/503 백오프는 클라이언트, 다운로드 실패는 즉시 실패)
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import requests
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from gemini_client import GeminiClient, get_shared_client
+
+from scrapers.base_verifier import BaseVerifier, VerificationError
+
+
+DEFAULT_MODEL = "gemini-2.0-flash"
+
+IMAGE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Referer': 'https://www.foodsafetykorea.go.kr/'
+}
+
+GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "temperature": 0,
+}
+
+
+class VerdictParseError(ValueError):
+    """응답이 JSON 판정도 YES/NO 텍스트도 아님 (재요청 대상)"""
+
+
+class ApiVerifier(BaseVerifier):
+    """Gemini API 기반 검증기 (GeminiVerifier와 같은 호출 인터페이스)"""
+
+    PROMPT = """Compare these two supplement product images carefully:
+
+IMAGE 1 (Korean Import Product):
+- Product: {hazard_name}
+- Brand: {hazard_brand}
+
+IMAGE 2 (iHerb Product):
+- Product: {iherb_name}
+- Brand: {iherb_brand}
+
+TASK: Determine if these are the SAME product (same supplement, same brand, same formulation).
+
+Respond with JSON only:
+{{"match": true or false, "confidence": "high" | "medium" | "low", "reason": "one sentence"}}"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[GeminiClient] = None,
+        model_name: str = DEFAULT_MODEL
+    ):
+        """
+        Args:
+            api_key: Gemini API 키 (client 미지정 시 공용 클라이언트 사용)
+            client: GeminiClient (테스트/공유용)
+            model_name: 모델명
+        """
+        if client is None:
+            if not api_key:
+                raise ValueError("api_key 또는 client 필요")
+            client = get_shared_client(api_key, model_name)
+        self.client = client
+        self.session = requests.Session()
+        self.session.headers.update(IMAGE_HEADERS)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 검증 (기존 호출부)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def verify_images_with_retry(
+        self,
+        hazard_image_url: str,
+        iherb_image_url: str,
+        hazard_name: str,
+        hazard_brand: str,
+        iherb_name: str,
+        iherb_brand: str,
+        seq: str = "unknown",
+        max_retries: int = 3
+    ) -> Tuple[bool, str]:
+        """
+        검증 (응답 파싱 실패만 재요청)
+
+        이미지 다운로드 실패는 재시도해도 같으므로 즉시 실패,
+        429/503은 클라이언트가 이미 백오프 재시도했으므로 그대로 실패 처리
+        """
+        try:
+            contents = self._build_contents(
+                self._fetch_image(hazard_image_url),
+                self._fetch_image(iherb_image_url),
+                hazard_name, hazard_brand, iherb_name, iherb_brand
+            )
+        except Exception as e:
+            raise VerificationError(f"이미지 다운로드 실패: {e}") from e
+
+        last_error = ""
+        for attempt in range(max_retries):
+            try:
+                return self._request_verdict(contents, seq)
+            except VerdictParseError as e:
+                last_error = str(e)
+                print(f"  [API] ⚠ 응답 파싱 실패 ({attempt + 1}/{max_retries}): {last_error[:80]}")
+            except Exception as e:
+                raise VerificationError(str(e)) from e
+
+        raise VerificationError(last_error or "최대 재시도 횟수 초과")
+
+    def verify_images(
+        self,
+        hazard_image_url: str,
+        iherb_image_url: str,
+        hazard_name: str,
+        hazard_brand: str,
+        iherb_name: str,
+        iherb_brand: str,
+        seq: str
+    ) -> Tuple[bool, str]:
+        """이미지 검증 (요청 1회, 파싱 실패 시 VerdictParseError)"""
+        contents = self._build_contents(
+            self._fetch_image(hazard_image_url),
+            self._fetch_image(iherb_image_url),
+            hazard_name, hazard_brand, iherb_name, iherb_brand
+        )
+        return self._request_verdict(contents, seq)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 내부
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _request_verdict(self, contents: list, seq: str) -> Tuple[bool, str]:
+        print(f"  [API] 검증 요청 (SEQ {seq})")
+        text = self.client.generate_text_sync(contents, generation_config=GENERATION_CONFIG)
+        return self.parse_verdict(text)
+
+    def _build_contents(self, hazard_img: Dict, iherb_img: Dict, hazard_name: str,
+                        hazard_brand: str, iherb_name: str, iherb_brand: str) -> list:
+        prompt = self.PROMPT.format(
+            hazard_name=hazard_name, hazard_brand=hazard_brand,
+            iherb_name=iherb_name, iherb_brand=iherb_brand
+        )
+        return [prompt, hazard_img, iherb_img]
+
+    def _fetch_image(self, url: str) -> Dict:
+        """이미지 → inline blob (여러 URL이 쉼표로 이어진 경우 첫 번째)"""
+        if ',' in url and ' http' in url.lower():
+            url = next((u.strip() for u in url.split(',') if u.strip().startswith('http')), url)
+
+        resp = self.session.get(url, timeout=15)
+        resp.raise_for_status()
+        if not resp.content:
+            raise Exception(f"이미지 다운로드 실패: {url}")
+
+        mime_type = resp.headers.get('Content-Type', '').split(';')[0].strip()
+        if not mime_type.startswith('image/'):
+            mime_type = "image/png" if ".png" in url.lower() else "image/jpeg"
+
+        return {"mime_type": mime_type, "data": resp.content}
+
+    @staticmethod
+    def parse_verdict(text: str) -> Tuple[bool, str]:
+        """
+        구조화 응답 파싱 (JSON 실패 시 YES/NO 텍스트로 판정)
+
+        Returns:
+            (일치 여부, 이유) - 이유는 GeminiVerifier와 같은 "YES: ..." / "NO: ..." 형태
+
+        Raises:
+            VerdictParseError: JSON도 YES/NO 텍스트도 아닌 응답
+        """
+        text = (text or "").strip()
+
+        verdict = None
+        match = re.search(r'\{.*\}', text, re.S)
+        if match:
+            try:
+                verdict = json.loads(match.group(0))
+            except json.JSONDecodeError:
+                verdict = None
+
+        if isinstance(verdict, dict) and 'match' in verdict:
+            is_match = verdict['match'] is True or str(verdict['match']).lower() == 'true'
+            confidence = str(verdict.get('confidence', '')).lower()
+            reason = str(verdict.get('reason', '')).strip()
+
+            # 낮은 신뢰도 일치는 불일치로 처리
+            if is_match and confidence == 'low':
+                return False, f"NO: low confidence - {reason}"
+
+            return is_match, f"{'YES' if is_match else 'NO'}: {reason}"
+
+        upper = text.upper()
+        if upper.startswith('YES') or upper.startswith('NO'):
+            return upper.startswith('YES'), text
+
+        raise VerdictParseError(f"판정 파싱 실패: {text[:80]!r}")
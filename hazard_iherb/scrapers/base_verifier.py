@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이미지 검증기 인터페이스
+- GeminiVerifier: gemini.google.com 브라우저 자동화
+- ApiVerifier: Gemini API 멀티모달 요청
+"""
+
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+
+class VerificationError(Exception):
+    """재시도 후에도 판정을 얻지 못함 (불일치 판정이 아님 → 결과 재사용 금지)"""
+
+
+class BaseVerifier(ABC):
+    """위해식품 이미지 ↔ iHerb 이미지 동일 제품 판정"""
+
+    # 일정 메시지마다 새 채팅이 필요한지 (브라우저 채팅 UI)
+    needs_chat_rotation = False
+
+    @abstractmethod
+    def verify_images_with_retry(
+        self,
+        hazard_image_url: str,
+        iherb_image_url: str,
+        hazard_name: str,
+        hazard_brand: str,
+        iherb_name: str,
+        iherb_brand: str,
+        seq: str = "unknown",
+        max_retries: int = 3
+    ) -> Tuple[bool, str]:
+        """
+        Returns:
+            (일치 여부, 이유)
+
+        Raises:
+            VerificationError: 재시도 후에도 판정 실패
+        """
+
+    def start_new_chat(self) -> bool:
+        """새 채팅 시작 (채팅 UI가 없는 엔진은 no-op)"""
+        return True
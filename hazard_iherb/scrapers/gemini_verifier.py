@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 """
 Gemini 이미지 검증
+- 업로드/응답 대기는 페이지 내 MutationObserver + execute_async_script로
+  완료 즉시 반환 (고정 sleep/폴링 없음)
 """
 
 import time
@@ -12,13 +14,102 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 
+from scrapers.base_verifier import BaseVerifier, VerificationError
 from utils.selenium_utils import save_debug_info
 from utils.image_utils import download_image
 
 
-class GeminiVerifier:
+# 업로드 미리보기 이미지 (Gemini 입력창 위 썸네일)
+PREVIEW_SELECTOR = (
+    "uploader-file-preview img, .file-preview-container img, "
+    ".attachment-preview img, img[src^='blob:'], img[data-test-id*='preview']"
+)
+
+# 미리보기 개수
+COUNT_PREVIEWS_JS = f"return document.querySelectorAll({PREVIEW_SELECTOR!r}).length;"
+
+# 미리보기가 before개보다 많아지고 로드 완료되면 resolve(true), 타임아웃 시 false
+WAIT_PREVIEW_JS = f"""
+    const [before, timeoutMs, done] = arguments;
+    const selector = {PREVIEW_SELECTOR!r};
+    let finished = false;
+    const finish = (v) => {{ if (!finished) {{ finished = true; observer.disconnect(); clearTimeout(timer); done(v); }} }};
+    const check = () => {{
+        const imgs = document.querySelectorAll(selector);
+        if (imgs.length > before) {{
+            const last = imgs[imgs.length - 1];
+            if (last.complete && last.naturalWidth > 0) finish(true);
+            else last.addEventListener('load', () => finish(true), {{ once: true }});
+        }}
+    }};
+    const observer = new MutationObserver(check);
+    observer.observe(document.body, {{ childList: true, subtree: true, attributes: true, attributeFilter: ['src'] }});
+    const timer = setTimeout(() => finish(false), timeoutMs);
+    check();
+"""
+
+# quietMs 동안 DOM 변경이 없으면 resolve(true), 타임아웃 시 false
+WAIT_DOM_QUIET_JS = """
+    const [quietMs, timeoutMs, done] = arguments;
+    let quietTimer = null;
+    let finished = false;
+    const finish = (v) => { if (!finished) { finished = true; observer.disconnect(); clearTimeout(quietTimer); clearTimeout(timer); done(v); } };
+    const arm = () => { clearTimeout(quietTimer); quietTimer = setTimeout(() => finish(true), quietMs); };
+    const observer = new MutationObserver(arm);
+    observer.observe(document.body, { childList: true, subtree: true, characterData: true, attributes: true });
+    const timer = setTimeout(() => finish(false), timeoutMs);
+    arm();
+"""
+
+# 새 대화 생성 → 마지막 .markdown이 aria-live=polite → 텍스트가 quietMs 동안 변하지 않으면 resolve
+WAIT_RESPONSE_JS = """
+    const [countBefore, quietMs, timeoutMs, done] = arguments;
+    let stage = 'new_conversation';
+    let lastText = null;
+    let quietTimer = null;
+    let finished = false;
+
+    const finish = (ok) => {
+        if (finished) return;
+        finished = true;
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(timer);
+        done({ ok: ok, stage: stage, text: lastText || '' });
+    };
+
+    const check = () => {
+        const convs = document.querySelectorAll('.conversation-container');
+        if (convs.length <= countBefore) return;
+        stage = 'response';
+
+        const markdown = convs[convs.length - 1].querySelector('.markdown');
+        if (!markdown || markdown.getAttribute('aria-live') !== 'polite') return;
+        stage = 'stability';
+
+        const text = (markdown.textContent || '').trim();
+        if (text !== lastText) {
+            lastText = text;
+            clearTimeout(quietTimer);
+            if (text.length >= 10) quietTimer = setTimeout(() => finish(true), quietMs);
+        }
+    };
+
+    const observer = new MutationObserver(check);
+    observer.observe(document.body, {
+        childList: true, subtree: true, characterData: true,
+        attributes: true, attributeFilter: ['aria-live', 'aria-busy']
+    });
+    const timer = setTimeout(() => finish(false), timeoutMs);
+    check();
+"""
+
+
+class GeminiVerifier(BaseVerifier):
     """Gemini 웹 인터페이스로 이미지 검증"""
     
+    needs_chat_rotation = True
+    
     def __init__(self, driver, temp_dir: Path, debug_dir: Path):
         self.driver = driver
         self.wait = WebDriverWait(driver, 15)
@@ -29,35 +120,39 @@ class GeminiVerifier:
         self.debug_dir.mkdir(exist_ok=True)
         
         # 설정
-        self.WAIT_AFTER_UPLOAD = 3
+        self.WAIT_AFTER_UPLOAD = 3        # 미리보기 감지 실패 시에만 사용
         self.WAIT_RETRY_BASE = 30
+        self.UPLOAD_TIMEOUT = 15
+        self.RESPONSE_TIMEOUT = 60
+        self.TEXT_QUIET_MS = 1500         # 스트리밍 종료로 볼 무변화 시간
         
         # 대화 추적
         self.conv_count_before = 0
     
-    def _wait_for_dom_stability(self, timeout: int = 5) -> bool:
-        """DOM 안정화 대기 (URL 변경 감지)"""
+    def _wait_async(self, script: str, *args, timeout: float):
+        """페이지 내 Promise/Observer 대기 실행 (실패 시 None, 드라이버 스크립트 타임아웃은 원복)"""
+        previous_timeout = None
         try:
-            initial_url = self.driver.current_url
-            stable_count = 0
-            start_time = time.time()
-            
-            while time.time() - start_time < timeout:
-                time.sleep(0.5)
-                current_url = self.driver.current_url
-                
-                if current_url == initial_url:
-                    stable_count += 1
-                    if stable_count >= 3:
-                        return True
-                else:
-                    initial_url = current_url
-                    stable_count = 0
-            
-            return False
-            
+            previous_timeout = self.driver.timeouts.script
+            self.driver.set_script_timeout(timeout + 5)
+            return self.driver.execute_async_script(script, *args)
         except Exception as e:
-            return False
+            print(f"  [WAIT] ⚠ 비동기 대기 실패: {e}")
+            return None
+        finally:
+            if previous_timeout is not None:
+                try:
+                    self.driver.set_script_timeout(previous_timeout)
+                except Exception:
+                    pass
+    
+    def _wait_for_dom_stability(self, timeout: int = 5, quiet_ms: int = 500) -> bool:
+        """DOM 안정화 대기 (quiet_ms 동안 변경 없음)"""
+        return bool(self._wait_async(WAIT_DOM_QUIET_JS, quiet_ms, int(timeout * 1000), timeout=timeout))
+    
+    def _wait_for_upload_preview(self, before: int, timeout: float) -> bool:
+        """업로드 미리보기 표시 대기"""
+        return bool(self._wait_async(WAIT_PREVIEW_JS, before, int(timeout * 1000), timeout=timeout))
     
     def start_new_chat(self):
         """새 채팅 시작"""
@@ -71,7 +166,7 @@ class GeminiVerifier:
                 try:
                     btn = self.driver.find_element(By.CSS_SELECTOR, selector)
                     btn.click()
-                    time.sleep(10)
+                    self._wait_for_dom_stability(timeout=10, quiet_ms=800)
                     print(f"  [CHAT] ✓ 새 채팅 시작")
                     return True
                 except:
@@ -114,9 +209,9 @@ class GeminiVerifier:
                     time.sleep(wait_time)
                     continue
                 
-                return False, error_msg
+                raise VerificationError(error_msg) from e
         
-        return False, "최대 재시도 횟수 초과"
+        raise VerificationError("최대 재시도 횟수 초과")
     
     def verify_images(
         self,
@@ -153,7 +248,6 @@ class GeminiVerifier:
             print(f"  [UPLOAD] 이미지 업로드 중...")
             
             self._upload_image(str(hazard_img_path), seq, "image1")
-            time.sleep(2)
             self._upload_image(str(iherb_img_path), seq, "image2")
             
             print(f"  [UPLOAD] ✓ 업로드 완료")
@@ -273,13 +367,22 @@ Your answer:"""
             if not file_input:
                 raise Exception("file input을 찾거나 생성할 수 없습니다")
             
+            # 업로드 전 미리보기 개수
+            try:
+                previews_before = self.driver.execute_script(COUNT_PREVIEWS_JS) or 0
+            except:
+                previews_before = 0
+            
             # 파일 경로 전달
             file_input.send_keys(image_path)
             
-            # DOM 안정화 대기
-            time.sleep(2)
-            self._wait_for_dom_stability(timeout=5)
-            time.sleep(self.WAIT_AFTER_UPLOAD)
+            # 미리보기가 뜨는 즉시 진행 (감지 실패 시 기존 고정 대기)
+            if self._wait_for_upload_preview(previews_before, self.UPLOAD_TIMEOUT):
+                self._wait_for_dom_stability(timeout=3, quiet_ms=300)
+            else:
+                print(f"  [UPLOAD] 미리보기 미감지 → 고정 대기")
+                self._wait_for_dom_stability(timeout=5)
+                time.sleep(self.WAIT_AFTER_UPLOAD)
             
         except Exception as e:
             print(f"  [UPLOAD ERROR] {img_num}: {e}")
@@ -333,7 +436,6 @@ Your answer:"""
                 "button[aria-label='메시지 보내기'], button[aria-label*='Send']")
             if button.is_displayed() and button.is_enabled():
                 button.click()
-                time.sleep(2)
                 return
         except:
             pass
@@ -346,140 +448,41 @@ Your answer:"""
                     button.click();
                 }
             """)
-            time.sleep(2)
         except:
             pass
     
     def _wait_for_response(self) -> Tuple[bool, str]:
-        """응답 대기 - 새 대화 생성 감지 + 응답 완료 대기 + 텍스트 안정화"""
-        start_time = time.time()
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 1단계: 새 대화 컨테이너 생성 대기 (40초)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        new_conversation_timeout = 10
-        print(f"  [WAIT] 새 대화 생성 대기...")
+        """응답 대기 - 새 대화 생성 → aria-live=polite → 텍스트 스트리밍 종료 (페이지 내 Observer)"""
+        print(f"  [WAIT] 응답 대기 (observer)...")
         
-        while time.time() - start_time < new_conversation_timeout:
-            try:
-                convs = self.driver.find_elements(By.CSS_SELECTOR, ".conversation-container")
-                current_count = len(convs)
-                
-                if current_count > self.conv_count_before:
-                    print(f"  [NEW] ✓ 새 대화 생성됨 ({current_count}번째 대화)")
-                    break
-            except:
-                pass
-            
-            time.sleep(0.5)
-        else:
-            raise Exception("새 대화 생성 타임아웃 (40초)")
+        start_time = time.time()
+        outcome = self._wait_async(
+            WAIT_RESPONSE_JS,
+            self.conv_count_before,
+            self.TEXT_QUIET_MS,
+            self.RESPONSE_TIMEOUT * 1000,
+            timeout=self.RESPONSE_TIMEOUT
+        )
         
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 2단계: 응답 완료 대기 (60초)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        response_complete_timeout = 60
-        print(f"  [WAIT] 응답 완료 대기...")
+        if not outcome:
+            raise Exception("응답 대기 스크립트 실패")
         
-        while time.time() - start_time < response_complete_timeout:
-            try:
-                # 마지막 대화 컨테이너 찾기
-                convs = self.driver.find_elements(By.CSS_SELECTOR, ".conversation-container")
-                if not convs:
-                    time.sleep(1)
-                    continue
-                
-                last_conv = convs[-1]
-                
-                # 마지막 대화의 markdown 찾기
-                markdown = last_conv.find_element(By.CSS_SELECTOR, ".markdown")
-                
-                # aria-live="polite" 확인 (응답 완료)
-                aria_live = markdown.get_attribute("aria-live")
-                
-                if aria_live == "polite":
-                    # aria-live="polite" 감지 후 텍스트 안정화 대기
-                    print(f"  [POLITE] aria-live=polite 감지, 텍스트 안정화 대기 중...")
-                    
-                    stable_text = self._wait_for_text_stability(markdown, timeout=10)
-                    
-                    if not stable_text or len(stable_text) < 10:
-                        print(f"  [WARN] 텍스트가 너무 짧음 ({len(stable_text) if stable_text else 0} chars), 재시도...")
-                        time.sleep(2)
-                        continue
-                    
-                    print(f"  [COMPLETE] ✓ 응답 완료 ({len(stable_text)} chars)")
-                    
-                    # YES/NO 판정
-                    first_word = stable_text.split()[0].upper().rstrip(':,.')
-                    is_match = first_word == 'YES' or stable_text.upper().startswith('YES')
-                    
-                    print(f"  [RESULT] 판정: {'YES' if is_match else 'NO'}")
-                    
-                    return is_match, stable_text
-                
-            except:
-                pass
-            
-            time.sleep(1)
+        stage = outcome.get('stage')
+        stable_text = (outcome.get('text') or '').strip()
         
-        raise Exception("응답 완료 타임아웃 (60초)")
-    
-    def _wait_for_text_stability(self, markdown_element, timeout: int = 10) -> str:
-        """
-        텍스트가 더 이상 변하지 않을 때까지 대기
+        if not outcome.get('ok'):
+            if stage == 'new_conversation':
+                raise Exception(f"새 대화 생성 타임아웃 ({self.RESPONSE_TIMEOUT}초)")
+            if len(stable_text) < 10:
+                raise Exception(f"응답 완료 타임아웃 ({self.RESPONSE_TIMEOUT}초)")
+            print(f"  [TIMEOUT] 텍스트 안정화 타임아웃, 현재 텍스트 사용")
         
-        Args:
-            markdown_element: markdown DOM 요소
-            timeout: 최대 대기 시간 (초)
+        print(f"  [COMPLETE] ✓ 응답 완료 ({len(stable_text)} chars, {time.time() - start_time:.1f}초)")
         
-        Returns:
-            안정화된 텍스트
-        """
-        start_time = time.time()
-        prev_text = ""
-        stable_count = 0
+        # YES/NO 판정
+        first_word = stable_text.split()[0].upper().rstrip(':,.')
+        is_match = first_word == 'YES' or stable_text.upper().startswith('YES')
         
-        while time.time() - start_time < timeout:
-            try:
-                current_text = markdown_element.get_attribute("textContent")
-                if current_text:
-                    current_text = current_text.strip()
-                else:
-                    current_text = ""
-                
-                # 텍스트가 변하지 않으면 stable_count 증가
-                if current_text == prev_text:
-                    stable_count += 1
-                    
-                    # 3번 연속 같으면 안정화됨
-                    if stable_count >= 3:
-                        # 마지막 문자 체크 (완결된 문장인지)
-                        if len(current_text) > 0:
-                            last_char = current_text[-1]
-                            
-                            # 문장이 완결되었거나, 질문으로 끝나는 경우
-                            if last_char in ['.', '?', '!']:
-                                print(f"  [STABLE] 텍스트 안정화 완료 ('{last_char}'로 끝남)")
-                                return current_text
-                            
-                            # 비정상적으로 끝난 경우 (전치사, 접속사 등)
-                            # 조금 더 대기
-                            if stable_count >= 5:
-                                print(f"  [WARN] 텍스트가 '{current_text[-20:]}'로 끝남 (비정상)")
-                                # 그래도 반환 (타임아웃 방지)
-                                return current_text
-                else:
-                    # 텍스트가 변했으면 초기화
-                    prev_text = current_text
-                    stable_count = 0
-                
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"  [ERROR] 안정화 대기 중 오류: {e}")
-                break
+        print(f"  [RESULT] 판정: {'YES' if is_match else 'NO'}")
         
-        # 타임아웃
-        print(f"  [TIMEOUT] 텍스트 안정화 타임아웃, 현재 텍스트 반환")
-        return prev_text if prev_text else ""
\ No newline at end of file
+        return is_match, stable_text
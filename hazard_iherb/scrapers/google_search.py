@@ -2,9 +2,13 @@
 # -*- coding: utf-8 -*-
 """
 Google Images 역검색
+- 세션은 N회 검색마다 CDP로 가볍게 교체
+- 전체 클리어는 차단/캡차 신호가 보일 때만 실행
+- 연속 차단 시 모든 검색 워커 일시 정지, 계속되면 중단 (BlockGuard)
 """
 
 import time
+import threading
 from pathlib import Path
 from typing import Optional, Dict
 from urllib.parse import urlparse, parse_qs, unquote
@@ -15,12 +19,162 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 
+# 세션 1개로 수행할 검색 수 (이후 가벼운 교체)
+SEARCHES_PER_SESSION = 10
+
+GOOGLE_ORIGINS = (
+    "https://www.google.com",
+    "https://images.google.com",
+    "https://lens.google.com",
+)
+
+# 연속 차단 대응 (모든 검색 워커 공유)
+BLOCKS_BEFORE_COOLDOWN = 3   # 연속 차단 N회 → 전체 검색 일시 정지
+BLOCK_COOLDOWN = 600         # 일시 정지 (초, 반복될 때마다 2배)
+MAX_COOLDOWNS = 3            # 일시 정지 후에도 계속 차단되면 검색 중단
+
+# 차단/캡차 페이지 감지 (URL 또는 본문)
+DETECT_BLOCK_JS = """
+    const url = location.href;
+    if (url.includes('/sorry/') || url.includes('captcha')) return true;
+    if (document.querySelector("iframe[src*='recaptcha'], form#captcha-form, #recaptcha")) return true;
+    const text = (document.body && document.body.innerText || '').slice(0, 3000).toLowerCase();
+    return text.includes('unusual traffic') || text.includes('비정상적인 트래픽');
+"""
+
+
+class SearchError(Exception):
+    """검색 자체 실패 (예외/타임아웃) - 결과 없음(NOT_FOUND)과 구분"""
+
+
+class SearchBlocked(SearchError):
+    """Google 차단/캡차 페이지 감지"""
+
+
+class BlockGuard:
+    """
+    연속 차단 감지 → 모든 검색 워커 일시 정지 / 중단 (검색 워커끼리 공유)
+
+    - 워커 구분 없이 연속 SearchBlocked가 N회면 BLOCK_COOLDOWN 동안 검색 정지
+    - 일시 정지가 MAX_COOLDOWNS회 반복돼도 차단이면 중단 (남은 항목은 다음 실행에서)
+    - 검색이 한 번이라도 성공하면 카운트 초기화
+    """
+
+    def __init__(self, blocks_before_cooldown: int = BLOCKS_BEFORE_COOLDOWN,
+                 cooldown: float = BLOCK_COOLDOWN, max_cooldowns: int = MAX_COOLDOWNS):
+        self.blocks_before_cooldown = blocks_before_cooldown
+        self.cooldown = cooldown
+        self.max_cooldowns = max_cooldowns
+
+        self._lock = threading.Lock()
+        self._aborted = threading.Event()
+        self.consecutive = 0
+        self.cooldowns = 0
+        self.resume_at = 0.0
+
+    @property
+    def aborted(self) -> bool:
+        return self._aborted.is_set()
+
+    def record_success(self):
+        """차단 없이 검색 완료 (결과 유무 무관)"""
+        with self._lock:
+            self.consecutive = 0
+            self.cooldowns = 0
+
+    def record_block(self):
+        """전체 클리어 후에도 차단된 검색 1회"""
+        with self._lock:
+            # 일시 정지 전에 시작된 다른 워커의 검색 → 이미 반영됨
+            if time.time() < self.resume_at:
+                return
+
+            self.consecutive += 1
+            if self.consecutive < self.blocks_before_cooldown:
+                return
+            self.consecutive = 0
+
+            if self.cooldowns >= self.max_cooldowns:
+                print(f"  [BLOCK] ✗ 일시 정지 {self.cooldowns}회 후에도 차단 → 검색 중단")
+                self._aborted.set()
+                return
+
+            delay = self.cooldown * (2 ** self.cooldowns)
+            self.cooldowns += 1
+            self.resume_at = time.time() + delay
+            print(f"  [BLOCK] ⏸ 연속 차단 {self.blocks_before_cooldown}회 → 모든 검색 {delay:.0f}초 정지 "
+                  f"({self.cooldowns}/{self.max_cooldowns})")
+
+    def wait(self) -> bool:
+        """
+        일시 정지 중이면 끝날 때까지 대기
+
+        Returns:
+            검색 가능하면 True, 중단됐으면 False
+        """
+        while not self.aborted:
+            remaining = self.resume_at - time.time()
+            if remaining <= 0:
+                return True
+            self._aborted.wait(min(remaining, 5))
+        return False
+
+
 class GoogleImageSearch:
     """Google 이미지 역검색"""
     
-    def __init__(self, driver):
+    def __init__(self, driver, searches_per_session: int = SEARCHES_PER_SESSION):
         self.driver = driver
         self.wait = WebDriverWait(driver, 25)
+        
+        # 세션 교체
+        self.searches_per_session = searches_per_session
+        self.session_uses = 0
+        self.needs_full_clear = True   # 첫 검색은 깨끗한 세션으로
+        
+        self.full_clears = 0
+        self.rotations = 0
+        self.blocks = 0
+    
+    def prepare_session(self):
+        """
+        검색 전 세션 준비
+        - 차단 신호 후(또는 최초): 전체 클리어
+        - 사용 횟수 초과: 가벼운 교체
+        - 그 외: 그대로 사용
+        """
+        if self.needs_full_clear:
+            self.clear_session()
+        elif self.session_uses >= self.searches_per_session:
+            self.rotate_session()
+    
+    def rotate_session(self):
+        """가벼운 세션 교체 - 페이지 이동/대기 없이 CDP로 Google 쿠키·저장소만 삭제"""
+        try:
+            for origin in GOOGLE_ORIGINS:
+                self.driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                    'origin': origin,
+                    'storageTypes': 'cookies,local_storage,session_storage,indexeddb'
+                })
+            self.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            
+            self.session_uses = 0
+            self.rotations += 1
+            print(f"  [CLEAN] ✓ 세션 교체 ({self.searches_per_session}회 사용)")
+            
+        except Exception as e:
+            print(f"  [CLEAN] ⚠ 세션 교체 실패 → 다음 검색 전 전체 클리어: {e}")
+            self.needs_full_clear = True
+    
+    def detect_block(self) -> bool:
+        """현재 페이지가 차단/캡차 페이지인지"""
+        try:
+            return bool(self.driver.execute_script(DETECT_BLOCK_JS))
+        except Exception:
+            return False
+    
+    def session_stats(self) -> str:
+        return f"전체 클리어 {self.full_clears} / 교체 {self.rotations} / 차단 감지 {self.blocks}"
     
     def clear_session(self):
         """완전한 세션 클리어 - 순서가 핵심"""
@@ -77,6 +231,10 @@ class GoogleImageSearch:
             self.driver.get("about:blank")
             time.sleep(1)
             
+            self.needs_full_clear = False
+            self.session_uses = 0
+            self.full_clears += 1
+            
             print(f"  [CLEAN] ✓ 세션 완전 클리어")
             
         except Exception as e:
@@ -85,13 +243,34 @@ class GoogleImageSearch:
     def find_iherb_url(self, image_path: Path) -> Optional[str]:
         """
         Google Images 역검색으로 iHerb URL 찾기
+        (차단 감지 시 전체 클리어 후 1회 재시도)
         
         Args:
             image_path: 검색할 이미지 파일 경로
             
         Returns:
-            iHerb URL or None
+            iHerb URL or None (검색 결과에 iHerb 없음)
+        
+        Raises:
+            SearchBlocked: 전체 클리어 후 재시도에도 차단 (결과 없음과 구분 → 호출부는 기록하지 않고 재시도)
+            SearchError: 검색 중 예외/타임아웃
         """
+        for attempt in range(2):
+            try:
+                return self._search(image_path)
+            except SearchBlocked:
+                self.blocks += 1
+                print(f"  [BLOCK] ⚠ 차단/캡차 감지 → 전체 세션 클리어")
+                self.clear_session()
+        
+        # 재시도 후에도 차단 → 다음 검색 전에도 전체 클리어, 호출부에 알림
+        self.needs_full_clear = True
+        raise SearchBlocked("전체 클리어 후에도 차단")
+    
+    def _search(self, image_path: Path) -> Optional[str]:
+        """역검색 1회 (차단 페이지면 SearchBlocked)"""
+        self.session_uses += 1
+        
         try:
             print(f"  [GOOGLE] 이미지 업로드 중...")
             self.driver.get("https://images.google.com/")
@@ -116,6 +295,9 @@ class GoogleImageSearch:
             
             time.sleep(3)  # 업로드 후 대기
             
+            if self.detect_block():
+                raise SearchBlocked()
+            
             # 스크롤 트릭 (크롭 UI 방지)
             self.driver.execute_script("window.scrollTo(0, 800);")
             time.sleep(0.5)
@@ -138,6 +320,9 @@ class GoogleImageSearch:
             self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "a")))
             time.sleep(7)  # 검색 결과 로드 대기
             
+            if self.detect_block():
+                raise SearchBlocked()
+            
             print(f"  [SEARCH] ✓ 검색 완료")
             
             # URL 선택
@@ -149,9 +334,15 @@ class GoogleImageSearch:
             
             return None
             
+        except SearchBlocked:
+            raise
+        
         except Exception as e:
+            # 요소 대기 실패가 차단 페이지 때문일 수 있음
+            if self.detect_block():
+                raise SearchBlocked()
             print(f"  [ERROR] 검색 실패: {e}")
-            return None
+            raise SearchError(str(e)) from e
     
     def _select_best_url(self) -> Optional[str]:
         """
@@ -2,6 +2,9 @@
 # -*- coding: utf-8 -*-
 """
 iHerb 상세페이지 스크래퍼
+- 상품코드 캐시 (같은 제품 재방문 없음)
+- JSON-LD(Product) 구조화 데이터를 execute_script 1회로 추출
+  → 누락 필드만 기존 DOM 셀렉터로 보완
 """
 
 import time
@@ -9,12 +12,44 @@ from typing import Optional, Dict
 
 from selenium.webdriver.common.by import By
 
+from services.scrape_cache import ScrapeCache
+
+
+# JSON-LD Product + og 메타 한 번에 추출
+STRUCTURED_DATA_JS = r"""
+const out = {name: null, brand: null, images: []};
+const visit = (node) => {
+    if (!node || typeof node !== 'object') return;
+    if (Array.isArray(node)) { node.forEach(visit); return; }
+    if (node['@graph']) visit(node['@graph']);
+    const type = [].concat(node['@type'] || []);
+    if (type.includes('Product')) {
+        out.name = out.name || node.name || null;
+        const brand = node.brand;
+        out.brand = out.brand || (brand && typeof brand === 'object' ? brand.name : brand) || null;
+        [].concat(node.image || []).forEach(img => {
+            const url = typeof img === 'object' ? (img.url || img.contentUrl) : img;
+            if (url) out.images.push(url);
+        });
+    }
+};
+document.querySelectorAll('script[type="application/ld+json"]').forEach(el => {
+    try { visit(JSON.parse(el.textContent)); } catch (e) {}
+});
+const og = document.querySelector('meta[property="og:image"]');
+if (og && og.content) out.images.push(og.content);
+return out;
+"""
+
+IHERB_IMAGE_HOST = "cloudinary.images-iherb.com"
+
 
 class IHerbScraper:
     """iHerb 상세페이지에서 제품 정보 추출"""
     
-    def __init__(self, driver):
+    def __init__(self, driver, cache: Optional[ScrapeCache] = None):
         self.driver = driver
+        self.cache = cache
     
     def scrape_product(self, url: str) -> Dict:
         """
@@ -23,41 +58,84 @@ class IHerbScraper:
         Returns:
             {
                 'image_url': str,
+                'image_urls': list,
                 'product_name': str,
-                'brand': str
+                'brand': str,
+                'url': str (리다이렉트 후 최종 URL),
+                'cached': bool (캐시 반환 시)
             }
         """
+        if self.cache:
+            cached = self.cache.get(url)
+            if cached:
+                print(f"  [SCRAPER] ✓ 캐시: {cached['brand']} - {cached['product_name']}")
+                return cached
+        
         try:
             print(f"  [SCRAPER] iHerb 방문 중...")
             self.driver.get(url)
-            time.sleep(2)
             
-            # 메인 이미지
-            image_url = self._extract_main_image()
+            # 구조화 데이터 (페이지 로드 직후 1회)
+            data = self._extract_structured_data()
+            image_urls = data['images']
+            product_name = data['name']
+            brand = data['brand']
             
-            # 제품명
-            product_name = self._extract_product_name()
+            # 누락 필드만 DOM에서 보완
+            if not (image_urls and product_name and brand):
+                time.sleep(2)
+                if not image_urls:
+                    image_urls = [u for u in [self._extract_main_image()] if u]
+                product_name = product_name or self._extract_product_name()
+                brand = brand or self._extract_brand()
             
-            # 브랜드
-            brand = self._extract_brand()
+            image_url = image_urls[0] if image_urls else None
             
             if image_url and product_name and brand:
                 print(f"  [SCRAPER] ✓ 스크래핑 완료: {brand} - {product_name}")
             
-            return {
+            scraped = {
                 'image_url': image_url,
+                'image_urls': image_urls,
                 'product_name': product_name,
-                'brand': brand
+                'brand': brand,
+                'url': self.driver.current_url
             }
+            if self.cache:
+                self.cache.put(scraped, url)
+            return scraped
             
         except Exception as e:
             print(f"  [SCRAPER ERROR] {e}")
             return {
                 'image_url': None,
+                'image_urls': [],
                 'product_name': None,
-                'brand': None
+                'brand': None,
+                'url': None
             }
     
+    def _extract_structured_data(self) -> Dict:
+        """JSON-LD/og 메타에서 제품명, 브랜드, 이미지 URL 목록 (실패 시 빈 값)"""
+        empty = {'name': None, 'brand': None, 'images': []}
+        try:
+            data = self.driver.execute_script(STRUCTURED_DATA_JS) or empty
+        except Exception:
+            return empty
+        
+        images = []
+        for img in data.get('images') or []:
+            if IHERB_IMAGE_HOST in str(img) and img not in images:
+                images.append(img)
+        
+        name = data.get('name')
+        brand = data.get('brand')
+        return {
+            'name': name.strip() if isinstance(name, str) and name.strip() else None,
+            'brand': brand.strip() if isinstance(brand, str) and brand.strip() else None,
+            'images': images,
+        }
+    
     def _extract_main_image(self) -> Optional[str]:
         """메인 이미지 URL 추출"""
         # 방법 1: src 속성
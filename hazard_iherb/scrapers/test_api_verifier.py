@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ApiVerifier 로컬 fake 모델 서버 테스트
+- api_endpoint로 로컬 stub 서버 지정 (REST 전송) → 실제 API 키/쿼터 불필요
+- 서버가 이미지 + generateContent 응답을 순서대로 돌려줌
+
+실행:
+    python scrapers/test_api_verifier.py
+"""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+hazard_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(hazard_root))
+sys.path.insert(0, str(hazard_root.parent))
+
+from gemini_client import GeminiClient
+
+from scrapers.api_verifier import ApiVerifier
+from scrapers.base_verifier import VerificationError
+
+
+FAKE_IMAGE = b"\xff\xd8\xff\xe0fake-jpeg"
+
+
+class FakeGemini(BaseHTTPRequestHandler):
+    """이미지 GET + generateContent POST (응답은 replies 순서대로)"""
+
+    replies = []      # (HTTP 상태, 텍스트)
+    requests = 0
+
+    def do_GET(self):
+        if self.path.startswith("/img/ok"):
+            self._send(200, FAKE_IMAGE, "image/jpeg")
+        else:
+            self._send(404, b"not found", "text/plain")
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if ":generateContent" not in self.path:
+            self._send(404, b"{}", "application/json")
+            return
+
+        FakeGemini.requests += 1
+        status, text = FakeGemini.replies.pop(0)
+        if status != 200:
+            body = {"error": {"code": status, "message": text, "status": "RESOURCE_EXHAUSTED"}}
+        else:
+            body = {
+                "candidates": [{
+                    "content": {"role": "model", "parts": [{"text": text}]},
+                    "finishReason": "STOP",
+                    "index": 0,
+                }],
+                "usageMetadata": {"promptTokenCount": 600, "candidatesTokenCount": 20, "totalTokenCount": 620},
+            }
+        self._send(status, json.dumps(body).encode(), "application/json")
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+_server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGemini)
+threading.Thread(target=_server.serve_forever, daemon=True).start()
+BASE_URL = f"http://127.0.0.1:{_server.server_port}"
+
+# 클라이언트 429 재시도 1회 (짧은 백오프)
+_client = GeminiClient(
+    "fake-key", rpm=6000, max_retries=1, base_delay=0.01, max_delay=0.02, api_endpoint=BASE_URL
+)
+verifier = ApiVerifier(client=_client)
+
+
+def _verify(hazard_image=f"{BASE_URL}/img/ok.jpg"):
+    return verifier.verify_images_with_retry(
+        hazard_image_url=hazard_image,
+        iherb_image_url=f"{BASE_URL}/img/ok.jpg",
+        hazard_name="비타민 D3 5000IU",
+        hazard_brand="Now Foods",
+        iherb_name="Vitamin D-3, 5,000 IU",
+        iherb_brand="NOW Foods",
+        seq="TEST",
+    )
+
+
+def _script(*replies):
+    FakeGemini.replies = list(replies)
+    FakeGemini.requests = 0
+
+
+def test_match_verdict():
+    """JSON 판정 → (True, "YES: ...") / 요청 1회"""
+    _script((200, '{"match": true, "confidence": "high", "reason": "same label"}'))
+    assert _verify() == (True, "YES: same label")
+    assert FakeGemini.requests == 1
+
+
+def test_low_confidence_match_is_mismatch():
+    """낮은 신뢰도 일치 → 불일치"""
+    _script((200, '{"match": true, "confidence": "low", "reason": "blurry"}'))
+    is_match, reason = _verify()
+    assert not is_match and reason.startswith("NO: low confidence")
+
+
+def test_parse_error_is_retried():
+    """파싱 불가 응답만 재요청"""
+    _script((200, "I am not sure."), (200, '{"match": false, "confidence": "high", "reason": "different"}'))
+    assert _verify() == (False, "NO: different")
+    assert FakeGemini.requests == 2
+
+
+def test_quota_error_is_not_retried_again():
+    """429는 클라이언트 재시도(1회)만 → 검증기는 재요청 없이 VerificationError"""
+    _script((429, "Resource has been exhausted"), (429, "Resource has been exhausted"))
+    try:
+        _verify()
+        assert False, "VerificationError 필요"
+    except VerificationError:
+        pass
+    assert FakeGemini.requests == 2
+
+
+def test_image_failure_sends_no_request():
+    """이미지 다운로드 실패 → 모델 요청 없이 VerificationError"""
+    _script()
+    try:
+        _verify(hazard_image=f"{BASE_URL}/img/missing.jpg")
+        assert False, "VerificationError 필요"
+    except VerificationError:
+        pass
+    assert FakeGemini.requests == 0
+
+
+if __name__ == "__main__":
+    tests = [
+        test_match_verdict,
+        test_low_confidence_match_is_mismatch,
+        test_parse_error_is_retried,
+        test_quota_error_is_not_retried_again,
+        test_image_failure_sends_no_request,
+    ]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n{_client.usage_summary()}")
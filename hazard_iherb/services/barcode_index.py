@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+바코드/UPC/품번 인덱스
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Google 역검색 전에 식별자 일치로 iHerb 제품을 바로 찾기 위한 인덱스
+- 통합 DB(products.upc / part_number): UPC → iHerb 품번
+  (품번 검색 URL은 상품 페이지로 리다이렉트될 때만 채택 → pipeline)
+- 결과 저널(VERIFIED_MATCH): 바코드 → iHerb URL, iHerb 코드 → iHerb URL
+"""
+
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote, urlparse
+
+import pandas as pd
+
+from config import Status
+from utils.image_utils import extract_iherb_code
+
+
+IHERB_SEARCH_URL = "https://www.iherb.com/search?kw={}"
+
+
+def is_product_url(url) -> bool:
+    """iHerb 상품 상세 URL(/pr/) 여부 (품번 검색 결과 페이지는 False)"""
+    if not url or not isinstance(url, str):
+        return False
+    return '/pr/' in urlparse(url).path
+
+
+@dataclass
+class BarcodeMatch:
+    """식별자 일치 결과"""
+    iherb_url: str
+    identifier: str          # 일치한 바코드/품번
+    part_number: str = ''
+    source: str = ''         # 'journal' / 'integrated_db'
+
+
+def normalize_upc(value) -> str:
+    """UPC/EAN 정규화 (숫자만, 앞자리 0 제거 → UPC-A와 EAN-13 동일 취급)"""
+    if isinstance(value, float):
+        value = int(value) if value.is_integer() else ''
+    digits = re.sub(r'\D', '', str(value or ''))
+    return digits.lstrip('0') if len(digits) >= 8 else ''
+
+
+def normalize_part_number(value) -> str:
+    """품번 정규화: 대문자, 하이픈/공백 제거 (iHerb 이미지 코드와 동일 형태)"""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return ''
+    return re.sub(r'[-\s]', '', str(value).upper().strip())
+
+
+def split_identifiers(raw) -> List[str]:
+    """BARCD_CTN 등 여러 식별자가 섞인 필드 분리"""
+    if raw is None or (isinstance(raw, float) and pd.isna(raw)):
+        return []
+    if isinstance(raw, float):
+        return [str(int(raw))] if raw.is_integer() else []
+    return [t for t in re.split(r'[,/;|\s]+', str(raw)) if t]
+
+
+class BarcodeIndex:
+    """식별자 → iHerb URL 메모리 인덱스"""
+
+    def __init__(self):
+        self.upc_to_url: Dict[str, str] = {}
+        self.upc_to_part: Dict[str, str] = {}
+        self.part_to_url: Dict[str, str] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 적재
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def load_integrated_db(self, db_path: Path) -> int:
+        """통합 DB products 테이블에서 UPC → 품번 적재"""
+        db_path = Path(db_path)
+        if not db_path.exists():
+            return 0
+
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            rows = conn.execute("""
+                SELECT upc, part_number FROM products
+                WHERE upc IS NOT NULL AND upc != ''
+                  AND part_number IS NOT NULL AND part_number != ''
+            """).fetchall()
+        except sqlite3.Error as e:
+            print(f"[WARN] 통합 DB 로드 실패: {e}")
+            return 0
+        finally:
+            conn.close()
+
+        loaded = 0
+        for upc, part_number in rows:
+            key = normalize_upc(upc)
+            part = normalize_part_number(part_number)
+            if key and part:
+                self.upc_to_part.setdefault(key, part)
+                loaded += 1
+        return loaded
+
+    def load_results(self, matched_df: pd.DataFrame) -> int:
+        """검증된 매칭 결과에서 바코드/iHerb 코드 → URL 적재"""
+        if matched_df.empty:
+            return 0
+
+        loaded = 0
+        for row in matched_df.itertuples(index=False):
+            url = getattr(row, 'IHERB_URL', '')
+            if not url or pd.isna(url):
+                continue
+
+            code = normalize_part_number(
+                getattr(row, 'IHERB_CODE', '') or extract_iherb_code(getattr(row, 'IHERB_PRODUCT_IMAGES', ''))
+            )
+            if code:
+                self.part_to_url[code] = url
+
+            for token in split_identifiers(getattr(row, 'BARCD_CTN', '')):
+                key = normalize_upc(token)
+                if key:
+                    self.upc_to_url[key] = url
+            loaded += 1
+        return loaded
+
+    def __len__(self) -> int:
+        return len(self.upc_to_url) + len(self.upc_to_part) + len(self.part_to_url)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 조회
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def resolve(self, raw_identifiers) -> Optional[BarcodeMatch]:
+        """
+        BARCD_CTN 값으로 iHerb 제품 조회 (정확히 일치할 때만)
+
+        Returns:
+            BarcodeMatch 또는 None
+        """
+        for token in split_identifiers(raw_identifiers):
+            match = self._resolve_token(token)
+            if match:
+                self.hits += 1
+                return match
+
+        self.misses += 1
+        return None
+
+    def _resolve_token(self, token: str) -> Optional[BarcodeMatch]:
+        upc = normalize_upc(token)
+        if upc:
+            if upc in self.upc_to_url:
+                return BarcodeMatch(self.upc_to_url[upc], token, source='journal')
+
+            part = self.upc_to_part.get(upc)
+            if part:
+                url = self.part_to_url.get(part) or IHERB_SEARCH_URL.format(quote(part))
+                return BarcodeMatch(url, token, part_number=part, source='integrated_db')
+
+        part = normalize_part_number(token)
+        if part and part in self.part_to_url:
+            return BarcodeMatch(self.part_to_url[part], token, part_number=part, source='journal')
+
+        return None
+
+    def stats(self) -> str:
+        return f"hit {self.hits} / miss {self.misses}"
+
+
+def build_barcode_index(integrated_db: Path, journal) -> BarcodeIndex:
+    """통합 DB + 결과 저널로 인덱스 구성"""
+    index = BarcodeIndex()
+    from_db = index.load_integrated_db(integrated_db)
+    from_results = index.load_results(journal.to_dataframe(Status.VERIFIED_MATCH))
+    print(f"[BARCODE] 인덱스: 통합 DB {from_db}건 / 검증 결과 {from_results}건")
+    return index
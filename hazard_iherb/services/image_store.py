@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+위해식품 이미지 저장소 (내용 해시 + 지각 해시)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- 이미지는 sha256 이름으로 한 번만 저장 (같은 URL은 재다운로드 안 함)
+- dHash(64bit)로 거의 같은 이미지(재인코딩/리사이즈)도 식별
+- 이미지별 마지막 검색/검증 결과를 보관
+  → 같은 이미지(sha256)는 즉시 재사용, 거의 같은 이미지는 URL만 재사용 후 재검증
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow 없으면 내용 해시만 사용
+    Image = None
+
+from utils.image_utils import download_image
+
+
+# 지각 해시 해밍 거리 허용치 (64bit 중)
+PHASH_MAX_DISTANCE = 6
+
+# 결과 재사용 시 복사할 필드
+OUTCOME_FIELDS = (
+    'iherb_url', 'product_code', 'iherb_brand', 'iherb_name',
+    'iherb_images', 'gemini_verified', 'gemini_reason',
+)
+
+
+def compute_dhash(image_path: Path, hash_size: int = 8) -> Optional[str]:
+    """difference hash (16자리 hex), Pillow 없거나 실패 시 None"""
+    if Image is None:
+        return None
+    try:
+        with Image.open(image_path) as img:
+            img = img.convert('L').resize((hash_size + 1, hash_size))
+            pixels = list(img.getdata())
+    except Exception:
+        return None
+
+    bits = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return f"{bits:016x}"
+
+
+def hamming(a: str, b: str) -> int:
+    return bin(int(a, 16) ^ int(b, 16)).count('1')
+
+
+class ImageStore:
+    """내용 주소 기반 이미지 저장소 + 결과 캐시"""
+
+    def __init__(self, db_path: Path, image_dir: Path, max_distance: int = PHASH_MAX_DISTANCE):
+        """
+        Args:
+            db_path: 저장소 DB 경로
+            image_dir: 이미지 파일 디렉토리 ({sha[:2]}/{sha}.ext)
+            max_distance: 근사 중복으로 볼 dHash 해밍 거리
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.image_dir = Path(image_dir)
+        self.image_dir.mkdir(parents=True, exist_ok=True)
+        self.max_distance = max_distance
+
+        # 검색 워커 여러 개가 공유 → 연결 1개 + 락
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS images (
+                sha256  TEXT PRIMARY KEY,
+                dhash   TEXT,
+                path    TEXT NOT NULL
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS urls (
+                url     TEXT PRIMARY KEY,
+                sha256  TEXT NOT NULL
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS outcomes (
+                sha256      TEXT PRIMARY KEY,
+                status      TEXT NOT NULL,
+                data        TEXT NOT NULL,
+                seq         TEXT,
+                updated_at  TEXT NOT NULL
+            ) WITHOUT ROWID;
+        """)
+        self.conn.commit()
+
+        # 근사 검색용 dHash 목록 (메모리)
+        self._dhashes: Dict[str, str] = dict(
+            self.conn.execute("SELECT sha256, dhash FROM images WHERE dhash IS NOT NULL").fetchall()
+        )
+
+        self.exact_hits = 0
+        self.near_hits = 0
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 이미지
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def fetch(self, url: str) -> Optional[Tuple[str, Path]]:
+        """
+        URL 이미지 확보 (저장소에 있으면 재사용, 없으면 다운로드)
+
+        Returns:
+            (sha256, 파일 경로) 또는 None (다운로드 실패)
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT i.sha256, i.path FROM urls u JOIN images i ON i.sha256 = u.sha256 WHERE u.url = ?",
+                (url,)
+            ).fetchone()
+        if row and Path(row[1]).exists():
+            return row[0], Path(row[1])
+
+        tmp_path = download_image(url, save_dir=self.image_dir)
+        if not tmp_path:
+            return None
+
+        sha = hashlib.sha256(tmp_path.read_bytes()).hexdigest()
+        path = self.image_dir / sha[:2] / f"{sha}{tmp_path.suffix}"
+
+        with self._lock:
+            if path.exists():
+                tmp_path.unlink()
+            else:
+                path.parent.mkdir(exist_ok=True)
+                tmp_path.replace(path)
+
+            if sha not in self._dhashes:
+                dhash = compute_dhash(path)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO images (sha256, dhash, path) VALUES (?, ?, ?)",
+                    (sha, dhash, str(path))
+                )
+                if dhash:
+                    self._dhashes[sha] = dhash
+
+            self.conn.execute("INSERT OR REPLACE INTO urls (url, sha256) VALUES (?, ?)", (url, sha))
+            self.conn.commit()
+        return sha, path
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 결과
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def lookup(self, sha: str) -> Optional[Dict]:
+        """
+        같은/거의 같은 이미지의 이전 결과
+
+        Returns:
+            {'status', 'seq', 'exact', ...OUTCOME_FIELDS} 또는 None
+            (exact=False: dHash 근사 일치 → 판정은 재사용하지 말 것)
+        """
+        with self._lock:
+            outcome = self._get_outcome(sha)
+            if outcome:
+                self.exact_hits += 1
+                outcome['exact'] = True
+                return outcome
+
+            dhash = self._dhashes.get(sha)
+            if not dhash:
+                return None
+
+            best = None
+            for other_sha, other_hash in self._dhashes.items():
+                if other_sha == sha:
+                    continue
+                distance = hamming(dhash, other_hash)
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    candidate = self._get_outcome(other_sha)
+                    if candidate:
+                        best = (distance, candidate)
+
+            if best:
+                self.near_hits += 1
+                best[1]['exact'] = False
+                return best[1]
+            return None
+
+    def record(self, sha: str, status: str, seq: str = '', **fields):
+        """이미지의 검색/검증 결과 저장"""
+        data = {k: fields.get(k) for k in OUTCOME_FIELDS if fields.get(k) not in (None, '')}
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO outcomes (sha256, status, data, seq, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (sha, status, json.dumps(data, ensure_ascii=False), seq,
+                 datetime.now().strftime("%Y%m%d%H%M%S"))
+            )
+            self.conn.commit()
+
+    def _get_outcome(self, sha: str) -> Optional[Dict]:
+        row = self.conn.execute(
+            "SELECT status, data, seq FROM outcomes WHERE sha256 = ?", (sha,)
+        ).fetchone()
+        if not row:
+            return None
+        outcome = json.loads(row[1])
+        outcome['status'] = row[0]
+        outcome['seq'] = row[2]
+        return outcome
+
+    def stats(self) -> str:
+        return f"exact {self.exact_hits} / near {self.near_hits}"
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -2,28 +2,215 @@
 # -*- coding: utf-8 -*-
 """
 식약처 API 서비스
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- total_count 조회 후 페이지를 병렬 수집 (커넥션 풀 Session)
+- 증분 모드: 캐시의 최신 CRET_DTM / LAST_UPDT_DTM보다 새 레코드가
+  없는 페이지에 도달하면 중단 (API는 최신 등록순으로 반환)
+- 재시도 후에도 실패한 페이지가 있으면 캐시를 갱신하지 않음
+  (부분 결과로 워터마크가 올라가면 누락 레코드를 다시 받지 못함)
+- base_url을 바꿔 로컬 stub 서버로 테스트 가능
 """
 
-import time
+import re
 import requests
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config import (
-    MFDS_API_KEY, SERVICE_ID, BASE_URL, PAGE_SIZE,
+    MFDS_API_KEY, SERVICE_ID, BASE_URL, PAGE_SIZE, MFDS_PARALLELISM,
     HAZARD_BASE_CSV, HAZARD_BASE_COLUMNS
 )
 from utils.csv_utils import save_csv
 
 
-def fetch_hazard_data(limit: Optional[int] = None, use_cache: bool = True) -> pd.DataFrame:
-    """식약처 위해식품 데이터 수집"""
+# 세션 Retry 이후 실패한 페이지 재요청 횟수
+PAGE_REFETCH_ATTEMPTS = 2
+
+
+class PageFetchError(Exception):
+    """재요청 후에도 실패한 페이지 (부분 결과로 캐시 갱신 금지)"""
+
+
+def create_session(parallelism: int = MFDS_PARALLELISM) -> requests.Session:
+    """커넥션 풀 + 재시도 설정된 Session"""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+    adapter = HTTPAdapter(pool_connections=parallelism, pool_maxsize=parallelism, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _page_url(base_url: str, start_idx: int, end_idx: int) -> str:
+    return f"{base_url}/{MFDS_API_KEY}/{SERVICE_ID}/json/{start_idx}/{end_idx}"
+
+
+def _fetch_page(session: requests.Session, base_url: str, start_idx: int, end_idx: int) -> Tuple[List[dict], int]:
+    """
+    페이지 1개 조회
+
+    Returns:
+        (rows, total_count)
+    """
+    resp = session.get(_page_url(base_url, start_idx, end_idx), timeout=20)
+    resp.raise_for_status()
+    data = resp.json()
+
+    body = data.get(SERVICE_ID)
+    if not body:
+        return [], 0
+
+    total_count = int(body.get('total_count') or 0)
+    return body.get('row', []) or [], total_count
+
+
+def _refetch_page(session: requests.Session, base_url: str, start_idx: int, end_idx: int) -> List[dict]:
+    """실패한 페이지 순차 재요청 (끝내 실패하면 PageFetchError)"""
+    last_error = None
+    for attempt in range(1, PAGE_REFETCH_ATTEMPTS + 1):
+        try:
+            rows, _ = _fetch_page(session, base_url, start_idx, end_idx)
+            print(f"[API] 재요청 성공 ({start_idx}-{end_idx}, {attempt}회차)")
+            return rows
+        except Exception as e:
+            last_error = e
+    raise PageFetchError(f"{start_idx}-{end_idx}: {last_error}")
+
+
+def fetch_total_count(session: requests.Session, base_url: str = BASE_URL) -> int:
+    """전체 건수 (1건만 요청)"""
+    _, total_count = _fetch_page(session, base_url, 1, 1)
+    return total_count
+
+
+def _dtm_key(value) -> str:
+    """일시 비교용 정규화 (숫자만, 14자리)"""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return ""
+    digits = re.sub(r'\D', '', str(value))
+    return digits[:14].ljust(14, '0') if digits else ""
+
+
+def _cache_watermark(cached_df: pd.DataFrame) -> Tuple[str, str]:
+    """캐시의 최신 (CRET_DTM, LAST_UPDT_DTM)"""
+    marks = []
+    for col in ('CRET_DTM', 'LAST_UPDT_DTM'):
+        if col in cached_df.columns and not cached_df.empty:
+            marks.append(max((_dtm_key(v) for v in cached_df[col]), default=""))
+        else:
+            marks.append("")
+    return marks[0], marks[1]
+
+
+def _has_newer(rows: List[dict], watermark: Tuple[str, str]) -> bool:
+    """캐시보다 새로 등록/수정된 레코드가 있는지"""
+    cret_mark, updt_mark = watermark
+    for row in rows:
+        if _dtm_key(row.get('CRET_DTM')) > cret_mark:
+            return True
+        if updt_mark and _dtm_key(row.get('LAST_UPDT_DTM')) > updt_mark:
+            return True
+    return False
+
+
+def _page_ranges(total_count: int, page_size: int) -> List[Tuple[int, int]]:
+    return [
+        (start, min(start + page_size - 1, total_count))
+        for start in range(1, total_count + 1, page_size)
+    ]
+
+
+def fetch_all_pages(
+    session: requests.Session,
+    base_url: str = BASE_URL,
+    page_size: int = PAGE_SIZE,
+    parallelism: int = MFDS_PARALLELISM,
+    watermark: Optional[Tuple[str, str]] = None,
+) -> List[dict]:
+    """
+    전체(또는 증분) 페이지 병렬 수집
+
+    Args:
+        watermark: (CRET_DTM, LAST_UPDT_DTM) - 지정 시 증분 모드
+
+    Raises:
+        PageFetchError: 재요청 후에도 실패한 페이지가 있을 때
+    """
+    total_count = fetch_total_count(session, base_url)
+    if total_count <= 0:
+        return []
+
+    ranges = _page_ranges(total_count, page_size)
+    print(f"[API] 전체 {total_count}건 / {len(ranges)}페이지 (병렬 {parallelism})")
+
+    all_rows: List[dict] = []
+
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        # 증분 모드는 parallelism 단위 묶음으로 진행하며 중단 지점 확인
+        step = parallelism if watermark else len(ranges)
+
+        for batch_start in range(0, len(ranges), step):
+            batch = ranges[batch_start:batch_start + step]
+            futures = [executor.submit(_fetch_page, session, base_url, s, e) for s, e in batch]
+
+            reached_cached = False
+            for (start_idx, end_idx), future in zip(batch, futures):
+                try:
+                    rows, _ = future.result()
+                except Exception as e:
+                    if reached_cached:
+                        continue
+                    print(f"[WARN] API 요청 실패 ({start_idx}-{end_idx}): {e} → 재요청")
+                    rows = _refetch_page(session, base_url, start_idx, end_idx)
+
+                if reached_cached:
+                    continue
+
+                all_rows.extend(rows)
+
+                if watermark and not _has_newer(rows, watermark):
+                    reached_cached = True
+
+            print(f"[API] 수집: {len(all_rows)}건")
+
+            if reached_cached:
+                print(f"[API] 캐시 시점 도달 → 증분 수집 종료")
+                break
+
+    return all_rows
+
+
+def fetch_hazard_data(
+    limit: Optional[int] = None,
+    use_cache: bool = True,
+    incremental: bool = True,
+    parallelism: int = MFDS_PARALLELISM,
+    base_url: str = BASE_URL,
+) -> pd.DataFrame:
+    """
+    식약처 위해식품 데이터 수집
+
+    Args:
+        limit: 최신 N건만 수집
+        use_cache: hazard_base.csv 캐시 사용/갱신
+        incremental: 캐시가 있으면 새 레코드까지만 수집
+        parallelism: 동시 요청 수
+        base_url: API 기본 URL (테스트 시 stub 서버 주소)
+    """
     print("=== 식약처 위해식품 데이터 수집 시작 ===")
-    
+
     cached_df = pd.DataFrame()
     has_cache = False
-    
+
     if use_cache and HAZARD_BASE_CSV.exists():
         try:
             cached_df = pd.read_csv(HAZARD_BASE_CSV, encoding="utf-8-sig")
@@ -31,71 +218,57 @@ def fetch_hazard_data(limit: Optional[int] = None, use_cache: bool = True) -> pd
             has_cache = True
         except Exception as e:
             print(f"[WARN] 캐시 로드 실패: {e}")
-    
+
     all_rows = []
-    
-    if limit:
-        url = f"{BASE_URL}/{MFDS_API_KEY}/{SERVICE_ID}/json/1/{limit}"
-        try:
-            resp = requests.get(url, timeout=20)
-            resp.raise_for_status()
-            data = resp.json()
-            if SERVICE_ID in data:
-                all_rows = data[SERVICE_ID].get('row', [])
+    fetch_failed = False
+
+    with create_session(parallelism) as session:
+        if limit:
+            try:
+                all_rows, _ = _fetch_page(session, base_url, 1, limit)
                 print(f"[API] 수집: {len(all_rows)}건")
-        except Exception as e:
-            print(f"[ERROR] API 요청 실패: {e}")
-    else:
-        # 전체 수집
-        start_idx = 1
-        while True:
-            end_idx = start_idx + PAGE_SIZE - 1
-            url = f"{BASE_URL}/{MFDS_API_KEY}/{SERVICE_ID}/json/{start_idx}/{end_idx}"
-            
+            except Exception as e:
+                print(f"[ERROR] API 요청 실패: {e}")
+                fetch_failed = True
+        else:
+            watermark = _cache_watermark(cached_df) if (incremental and has_cache) else None
+            if watermark:
+                print(f"[API] 증분 모드 (CRET_DTM > {watermark[0]}, LAST_UPDT_DTM > {watermark[1]})")
             try:
-                resp = requests.get(url, timeout=20)
-                resp.raise_for_status()
-                data = resp.json()
-                
-                if SERVICE_ID not in data:
-                    break
-                
-                rows = data[SERVICE_ID].get('row', [])
-                if not rows:
-                    break
-                
-                all_rows.extend(rows)
-                if len(all_rows) % 1000 == 0:
-                    print(f"[API] 수집: {len(all_rows)}건")
-                
-                start_idx = end_idx + 1
-                time.sleep(0.3)
-                
+                all_rows = fetch_all_pages(session, base_url, PAGE_SIZE, parallelism, watermark)
             except Exception as e:
                 print(f"[ERROR] API 요청 실패: {e}")
-                break
-    
+                fetch_failed = True
+
+    # 일부 페이지 실패 → 수집분 폐기, 캐시 유지 (다음 실행에서 같은 구간부터 다시 수집)
+    if fetch_failed:
+        all_rows = []
+        print("[WARN] 수집 실패 → 이번 결과는 캐시에 반영하지 않음")
+
     new_df = pd.DataFrame(all_rows)
-    
+
     if has_cache and not new_df.empty:
         cached_df['SELF_IMPORT_SEQ'] = cached_df['SELF_IMPORT_SEQ'].astype(str)
         new_df['SELF_IMPORT_SEQ'] = new_df['SELF_IMPORT_SEQ'].astype(str)
-        
+
         combined_df = pd.concat([new_df, cached_df], ignore_index=True)
         combined_df = combined_df.drop_duplicates(subset=['SELF_IMPORT_SEQ'], keep='first')
         df = combined_df
+    elif has_cache:
+        cached_df['SELF_IMPORT_SEQ'] = cached_df['SELF_IMPORT_SEQ'].astype(str)
+        df = cached_df
     else:
         if not new_df.empty:
             new_df['SELF_IMPORT_SEQ'] = new_df['SELF_IMPORT_SEQ'].astype(str)
         df = new_df
-    
+
     if not df.empty and 'CRET_DTM' in df.columns:
         df['CRET_DTM'] = pd.to_numeric(df['CRET_DTM'], errors='coerce').fillna(0).astype(int)
         df = df.sort_values('CRET_DTM', ascending=False).reset_index(drop=True)
-    
-    if not df.empty and use_cache:
+
+    if not df.empty and use_cache and not fetch_failed:
         save_csv(df, HAZARD_BASE_CSV, HAZARD_BASE_COLUMNS)
         print(f"[CACHE] hazard_base.csv 저장: {len(df)}건")
-    
+
     print(f"=== 수집 완료: {len(df)}건 ===\n")
-    return df
\ No newline at end of file
+    return df
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+처리 결과 저널 (SQLite WAL, append-only)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- 항목마다 기존 CSV 전체를 다시 쓰지 않고 한 행만 기록
+- SELF_IMPORT_SEQ 기준 last-write-wins
+- unified_results.csv는 compact()로 필요할 때 생성
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+import pandas as pd
+
+from utils.csv_utils import load_csv
+
+
+class ResultJournal:
+    """SELF_IMPORT_SEQ 단위 결과 저널"""
+
+    def __init__(self, db_path: Path, columns: List[str]):
+        """
+        Args:
+            db_path: 저널 DB 경로
+            columns: compact 시 CSV 컬럼 순서
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.columns = columns
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS journal (
+                seq         TEXT PRIMARY KEY,
+                status      TEXT,
+                data        TEXT NOT NULL,
+                written_at  TEXT NOT NULL
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_journal_status ON journal(status);
+        """)
+        self.conn.commit()
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 기록
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def append(self, result: Dict):
+        """결과 1건 기록 (같은 SEQ는 덮어씀)"""
+        self.append_many([result])
+
+    def append_many(self, results: List[Dict]):
+        """결과 여러 건을 한 트랜잭션으로 기록"""
+        now = datetime.now().strftime("%Y%m%d%H%M%S")
+        rows = [
+            (
+                str(r['SELF_IMPORT_SEQ']),
+                r.get('STATUS', ''),
+                json.dumps(r, ensure_ascii=False, default=str),
+                now,
+            )
+            for r in results
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO journal (seq, status, data, written_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+
+    def import_csv(self, csv_path: Path) -> int:
+        """기존 unified_results.csv 가져오기 (저널이 비어 있을 때 1회)"""
+        if self.count() > 0 or not Path(csv_path).exists():
+            return 0
+
+        df = load_csv(Path(csv_path), dtype=str)
+        if df.empty or 'SELF_IMPORT_SEQ' not in df.columns:
+            return 0
+
+        df = df.where(pd.notna(df), '')
+        self.append_many(df.to_dict('records'))
+        return len(df)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 조회
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def processed_seqs(self) -> Set[str]:
+        """처리된 SEQ (기본키 인덱스만 스캔)"""
+        return {row[0] for row in self.conn.execute("SELECT seq FROM journal")}
+
+    def is_processed(self, seq: str) -> bool:
+        row = self.conn.execute("SELECT 1 FROM journal WHERE seq = ?", (str(seq),)).fetchone()
+        return row is not None
+
+    def get(self, seq: str) -> Optional[Dict]:
+        row = self.conn.execute("SELECT data FROM journal WHERE seq = ?", (str(seq),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM journal").fetchone()[0]
+
+    def status_counts(self) -> Dict[str, int]:
+        """STATUS별 건수 (인덱스 집계)"""
+        return dict(self.conn.execute("SELECT status, COUNT(*) FROM journal GROUP BY status").fetchall())
+
+    def to_dataframe(self, status: Optional[str] = None) -> pd.DataFrame:
+        if status is None:
+            rows = self.conn.execute("SELECT data FROM journal ORDER BY written_at, seq").fetchall()
+        else:
+            rows = self.conn.execute(
+                "SELECT data FROM journal WHERE status = ? ORDER BY written_at, seq", (status,)
+            ).fetchall()
+
+        df = pd.DataFrame([json.loads(r[0]) for r in rows])
+        for col in self.columns:
+            if col not in df.columns:
+                df[col] = ''
+        return df[self.columns] if not df.empty else pd.DataFrame(columns=self.columns)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Compaction
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def compact(self, csv_path: Path, status: Optional[str] = None) -> int:
+        """저널 → CSV 생성 (SEQ당 최신 1행)"""
+        df = self.to_dataframe(status)
+        csv_path = Path(csv_path)
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = csv_path.with_suffix(csv_path.suffix + ".tmp")
+        df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+        tmp_path.replace(csv_path)
+        return len(df)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+iHerb 상세페이지 스크래핑 캐시
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- 상품코드(extract_product_code) 기준 → URL 표기가 달라도 같은 제품이면 재사용
+- 브랜드 / 제품명 / 이미지 URL 목록 보관
+- 여러 위해식품이 같은 iHerb 제품으로 귀결될 때 재방문 없이 즉시 반환
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.image_utils import extract_product_code
+
+
+def product_key(url: str) -> Optional[str]:
+    """캐시 키 (상품 상세 URL만, 검색 URL 등은 None)"""
+    if not url or '/pr/' not in str(url):
+        return None
+    return extract_product_code(url)
+
+
+class ScrapeCache:
+    """상품코드 → 스크래핑 결과"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 검색 워커 여러 개가 공유 → 연결 1개 + 락
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS products (
+                code          TEXT PRIMARY KEY,
+                url           TEXT NOT NULL,
+                brand         TEXT NOT NULL,
+                product_name  TEXT NOT NULL,
+                image_urls    TEXT NOT NULL,
+                scraped_at    TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        캐시 조회
+
+        Returns:
+            scrape_product와 같은 형태 + 'image_urls' 또는 None
+        """
+        code = product_key(url)
+        if not code:
+            return None
+
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT url, brand, product_name, image_urls FROM products WHERE code = ?", (code,)
+            ).fetchone()
+            if not row:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        image_urls = json.loads(row[3])
+        return {
+            'image_url': image_urls[0],
+            'image_urls': image_urls,
+            'product_name': row[2],
+            'brand': row[1],
+            'url': row[0],
+            'cached': True,
+        }
+
+    def put(self, scraped: Dict, *urls: str):
+        """
+        완전한 스크래핑 결과만 저장 (요청 URL/최종 URL 각각의 상품코드로)
+        """
+        image_urls: List[str] = scraped.get('image_urls') or [scraped.get('image_url')]
+        image_urls = [u for u in image_urls if u]
+        if not image_urls or not scraped.get('product_name') or not scraped.get('brand'):
+            return
+
+        codes = {product_key(u) for u in (scraped.get('url'), *urls)} - {None}
+        if not codes:
+            return
+
+        now = datetime.now().strftime("%Y%m%d%H%M%S")
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (code, scraped.get('url') or urls[0], scraped['brand'], scraped['product_name'],
+                     json.dumps(image_urls, ensure_ascii=False), now)
+                    for code in codes
+                ]
+            )
+            self.conn.commit()
+
+    def stats(self) -> str:
+        return f"hit {self.hits} / miss {self.misses}"
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
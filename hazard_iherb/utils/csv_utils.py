@@ -46,24 +46,3 @@ def save_csv(df: pd.DataFrame, path: Path, columns: Optional[List[str]] = None):
     
     df.to_csv(path, index=False, encoding="utf-8-sig", quoting=csv.QUOTE_NONNUMERIC)
 
-
-def append_to_csv(new_df: pd.DataFrame, path: Path, columns: List[str], dedupe_col: str = None):
-    """
-    CSV에 데이터 추가 (append)
-    
-    Args:
-        new_df: 추가할 데이터
-        path: CSV 경로
-        columns: 컬럼 순서
-        dedupe_col: 중복 제거 기준 컬럼
-    """
-    if path.exists():
-        existing_df = load_csv(path, columns)
-        combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-        
-        if dedupe_col:
-            combined_df = combined_df.drop_duplicates(subset=[dedupe_col], keep='last')
-    else:
-        combined_df = new_df
-    
-    save_csv(combined_df, path, columns)
\ No newline at end of file
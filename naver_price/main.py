@@ -6,6 +6,8 @@
 import os
 from dotenv import load_dotenv
 from naver_price_crawler import NaverPriceCrawler
+from sheet_backend import CsvSheetBackend
+from price_cache import PriceCache
 
 # .env 파일 로드
 load_dotenv()
@@ -19,6 +21,20 @@ def main():
     NAVER_ID = os.getenv('NAVER_ID')
     NAVER_PW = os.getenv('NAVER_PW')
     
+    # 로컬 CSV 시트 (지정 시 구글 시트 대신 사용 - 오프라인 테스트용)
+    SHEET_CSV = os.getenv('SHEET_CSV')
+    
+    # 시트 반영 단위 (행 수 / 최대 간격 초)
+    WRITE_CHUNK_SIZE = int(os.getenv('WRITE_CHUNK_SIZE', '50'))
+    WRITE_FLUSH_INTERVAL = int(os.getenv('WRITE_FLUSH_INTERVAL', '60'))
+    
+    # 동시 조회 탭 수 (로그인 세션 공유, 1이면 순차)
+    NAVER_TABS = int(os.getenv('NAVER_TABS', '1'))
+    
+    # 조회 결과 캐시 (신선도 시간 안에 조회한 URL은 재방문 생략, 0이면 항상 조회)
+    PRICE_CACHE_DB = os.getenv('PRICE_CACHE_DB', 'price_cache.db')
+    FRESHNESS_HOURS = float(os.getenv('FRESHNESS_HOURS', '6'))
+    
     # 환경변수 확인
     if not NAVER_ID or not NAVER_PW:
         print("❌ 환경변수 설정이 필요합니다.")
@@ -34,12 +50,19 @@ def main():
         print("="*60)
         print("네이버 쇼핑 가격 크롤러 시작")
         print("="*60)
-        print(f"스프레드시트 ID: {SPREADSHEET_ID}")
+        print(f"스프레드시트: {SHEET_CSV or SPREADSHEET_ID}")
         print(f"네이버 ID: {NAVER_ID}")
         print("="*60 + "\n")
         
         # 크롤러 초기화
-        crawler = NaverPriceCrawler(SPREADSHEET_ID, CREDENTIALS_FILE)
+        crawler = NaverPriceCrawler(
+            SPREADSHEET_ID,
+            CREDENTIALS_FILE,
+            backend=CsvSheetBackend(SHEET_CSV) if SHEET_CSV else None,
+            write_chunk_size=WRITE_CHUNK_SIZE,
+            write_flush_interval=WRITE_FLUSH_INTERVAL,
+            price_cache=PriceCache(PRICE_CACHE_DB, FRESHNESS_HOURS)
+        )
         
         # 드라이버 설정
         crawler.setup_driver()
@@ -60,7 +83,7 @@ def main():
             return
         
         # URL 처리 (자동으로 모든 URL 처리)
-        crawler.process_urls()
+        crawler.process_urls(tabs=NAVER_TABS)
         
         print("\n" + "="*60)
         print("✅ 모든 작업이 완료되었습니다!")
@@ -77,6 +100,8 @@ def main():
     finally:
         if crawler:
             crawler.close()
+            if crawler.price_cache:
+                crawler.price_cache.close()
 
 
 if __name__ == "__main__":
@@ -9,33 +9,173 @@
 
 import time
 import re
+import itertools
 from datetime import datetime
+from urllib.parse import urlparse
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import gspread
 from google.oauth2.service_account import Credentials
-from bs4 import BeautifulSoup
+
+from sheet_backend import GoogleSheetBackend, BufferedSheetWriter, col_letter
+
+
+# 아이허브 판매처 키워드
+IHERB_KEYWORDS = ['아이허브', 'iherb', '아이허브 공식']
+
+# 상품 페이지 1회 로드 후 최저가/배송비/판매처/판매처 목록을 한 번에 추출
+# - 판매처 목록: 페이지 내장 상태(__NEXT_DATA__) → 판매처 필터 레이어 → 페이지 텍스트 순
+#   (내장 상태는 URL의 상품 ID와 같은 노드 아래만 사용, 연관상품/광고/추천 목록 제외
+#    → 현재 상품 노드를 못 찾으면 판매처 필터 레이어가 기준)
+COMBINED_SCRAPE_JS = r"""
+const timeoutMs = arguments[0];
+const done = arguments[arguments.length - 1];
+
+const text = (sel) => {
+    const el = document.querySelector(sel);
+    return el ? el.textContent.trim() : null;
+};
+const waitFor = (check, ms) => new Promise((resolve) => {
+    const first = check();
+    if (first) return resolve(first);
+    const obs = new MutationObserver(() => {
+        const v = check();
+        if (v) { obs.disconnect(); clearTimeout(timer); resolve(v); }
+    });
+    obs.observe(document.body, {childList: true, subtree: true});
+    const timer = setTimeout(() => { obs.disconnect(); resolve(check()); }, ms);
+});
+const productId = (
+    location.pathname.match(/\/(?:catalog|products)\/(\d+)/) ||
+    location.search.match(/[?&](?:nvMid|catalogId)=(\d+)/) || []
+)[1];
+const UNRELATED_KEY = /recommend|related|similar|together|popular|best|ranking|(^|[^a-z])ads?([^a-z]|$)|advert|banner/i;
+const stateMalls = () => {
+    const el = document.getElementById('__NEXT_DATA__');
+    if (!el || !productId) return [];
+    // 1) URL 상품 ID와 같은 상품 노드 찾기
+    const isProduct = (node) => ['catalogId', 'nvMid', 'productId', 'id'].some(k => String(node[k]) === productId);
+    const find = (node, depth) => {
+        if (!node || typeof node !== 'object' || depth > 40) return null;
+        if (Array.isArray(node)) {
+            for (const n of node) { const f = find(n, depth + 1); if (f) return f; }
+            return null;
+        }
+        if (isProduct(node)) return node;
+        for (const [k, v] of Object.entries(node)) {
+            if (UNRELATED_KEY.test(k)) continue;
+            const f = find(v, depth + 1);
+            if (f) return f;
+        }
+        return null;
+    };
+    // 2) 그 노드 아래의 판매처명만 수집 (추천/광고 하위 목록 제외)
+    const names = new Set();
+    const walk = (node, depth) => {
+        if (!node || typeof node !== 'object' || depth > 40) return;
+        if (Array.isArray(node)) { node.forEach(n => walk(n, depth + 1)); return; }
+        for (const [k, v] of Object.entries(node)) {
+            if (UNRELATED_KEY.test(k)) continue;
+            if (/^mall(Name|Nm)$/.test(k) && typeof v === 'string' && v.trim()) names.add(v.trim());
+            else walk(v, depth + 1);
+        }
+    };
+    try {
+        const product = find(JSON.parse(el.textContent), 0);
+        if (product) walk(product, 0);
+    } catch (e) {}
+    return [...names];
+};
+const layerMalls = () => {
+    const labels = [...document.querySelectorAll('.filter_text__yBa_v')].map(e => e.textContent.trim());
+    return labels.length ? labels : null;
+};
+
+(async () => {
+    // 판매처 선택보기 영역이 렌더링되도록 스크롤
+    window.scrollTo(0, document.body.scrollHeight / 2);
+    await waitFor(() => document.querySelector('.lowestPrice_num__adgCI'), timeoutMs);
+
+    const out = {
+        price: text('.lowestPrice_num__adgCI'),
+        shipping: text('.lowestPrice_delivery_fee__COSVN'),
+        mall: text('.lowestPrice_cell__1_Cz0:nth-child(2)'),
+        malls: stateMalls(),
+        source: 'state',
+    };
+    if (out.malls.length) return out;
+
+    const btn = await waitFor(() => document.querySelector('.filter_check_mall__IK03K'), timeoutMs);
+    if (!btn) {
+        out.source = 'page';
+        out.malls = /아이허브|iherb/i.test(document.body.innerText) ? ['iherb'] : [];
+        return out;
+    }
+
+    btn.click();
+    out.malls = (await waitFor(layerMalls, timeoutMs)) || [];
+    out.source = 'layer';
+    const cancel = document.querySelector('.filter_btn_cancel__wIx02');
+    if (cancel) cancel.click();
+    return out;
+})().then(done, (e) => done({error: String(e)}));
+"""
+
+
+def same_cell_value(current, new):
+    """시트 기존 값과 새 값이 같은지 (숫자는 천단위 구분 기호 무시)"""
+    current = (current or '').strip()
+    new = '' if new is None else str(new)
+    if new.isdigit():
+        return current.replace(',', '') == new
+    return current == new
+
+
+def is_iherb_mall(mall_name):
+    """판매처명이 아이허브인지"""
+    name = (mall_name or '').lower()
+    return any(keyword in name for keyword in IHERB_KEYWORDS)
 
 
 class NaverPriceCrawler:
-    def __init__(self, spreadsheet_id, credentials_file='credentials.json'):
+    def __init__(self, spreadsheet_id, credentials_file='credentials.json', backend=None,
+                 write_chunk_size=50, write_flush_interval=60, price_cache=None,
+                 changed_only=True):
         """
         초기화
         
         Args:
             spreadsheet_id: 구글 스프레드시트 ID
             credentials_file: Google API 인증 파일 경로
+            backend: SheetBackend (지정 시 구글 시트 대신 사용, 예: CsvSheetBackend)
+            write_chunk_size: 결과 몇 행마다 시트에 반영할지
+            write_flush_interval: 최대 반영 간격 (초)
+            price_cache: PriceCache (신선도 기간 안에 조회한 URL은 재방문 생략)
+            changed_only: 시트 기존 값과 같은 행은 쓰지 않음
         """
         self.spreadsheet_id = spreadsheet_id
         self.driver = None
         self.wait = None
         
+        # 요청 간 딜레이 (초)
+        self.request_delay = 2
+        
+        # 동시 탭 모드: 같은 도메인 요청 시작 최소 간격 (초)
+        self.domain_interval = 1
+        self._last_request = {}
+        
+        # 시트 쓰기 버퍼 설정
+        self.write_chunk_size = write_chunk_size
+        self.write_flush_interval = write_flush_interval
+        
+        # 조회 결과 캐시 / 변경분만 쓰기
+        self.price_cache = price_cache
+        self.changed_only = changed_only
+        
         # 구글 스프레드시트 연결
-        self.sheet = self._connect_google_sheets(credentials_file)
+        self.sheet = backend or self._connect_google_sheets(credentials_file)
     
     def _connect_google_sheets(self, credentials_file):
         """구글 스프레드시트 연결"""
@@ -56,7 +196,7 @@ class NaverPriceCrawler:
             # "0" 시트 가져오기
             sheet = spreadsheet.worksheet("0")
             print(f"✓ 구글 스프레드시트 연결 성공: {spreadsheet.title}")
-            return sheet
+            return GoogleSheetBackend(sheet, spreadsheet.title)
             
         except Exception as e:
             print(f"✗ 스프레드시트 연결 실패: {e}")
@@ -190,180 +330,182 @@ class NaverPriceCrawler:
             # 캡차가 없으면 그냥 진행
             pass
     
-    def get_lowest_price(self, url):
+    def scrape_product(self, url, timeout=10):
         """
-        최저가 조회
+        상품 페이지 1회 로드로 최저가 + 아이허브 판매 여부 조회
+        (최저가 + 아이허브 판매처 확인을 페이지 스크립트 1회로)
         
         Args:
             url: 네이버 쇼핑 상품 URL
+            timeout: 요소 대기 시간 (초)
             
         Returns:
-            dict: {'price': 최저가, 'shipping': 배송비, 'mall': 판매처}
+            dict: {'price', 'shipping', 'mall', 'has_iherb', 'malls'}
         """
+        print(f"\n상품 URL 접속: {url}")
         try:
-            print(f"\n상품 URL 접속: {url}")
             self.driver.get(url)
-            time.sleep(2)
-            
+        except Exception as e:
+            print(f"✗ 상품 조회 실패: {e}")
+            return self._failed_result()
+        
+        return self._extract_product(timeout)
+    
+    def _extract_product(self, timeout=10):
+        """현재 탭의 로드된 상품 페이지에서 추출 (캡차 확인 포함)"""
+        try:
             # 봇 캡차 확인
             self._wait_for_captcha()
             
-            # 페이지 스크롤 (판매처 선택보기 요소가 보이도록)
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(1)
-            
-            # HTML 파싱
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            
-            # 최저가 추출
-            lowest_price = None
-            price_elem = soup.select_one('.lowestPrice_num__adgCI')
-            if price_elem:
-                price_text = price_elem.get_text(strip=True).replace(',', '')
-                lowest_price = int(price_text)
-            
-            # 배송비 추출
-            shipping_text = "확인필요"
-            shipping_elem = soup.select_one('.lowestPrice_delivery_fee__COSVN')
-            if shipping_elem:
-                shipping_text = shipping_elem.get_text(strip=True)
-            
-            # 판매처 추출
-            mall_name = "확인필요"
-            mall_elem = soup.select_one('.lowestPrice_cell__1_Cz0:nth-child(2)')
-            if mall_elem:
-                mall_name = mall_elem.get_text(strip=True)
-            
-            print(f"  최저가: {lowest_price}원")
-            print(f"  배송비: {shipping_text}")
-            print(f"  판매처: {mall_name}")
-            
-            return {
-                'price': lowest_price,
-                'shipping': shipping_text,
-                'mall': mall_name
+            self.driver.set_script_timeout(timeout * 3 + 5)
+            data = self.driver.execute_async_script(COMBINED_SCRAPE_JS, int(timeout * 1000)) or {}
+            if data.get('error'):
+                raise Exception(data['error'])
+            
+            price_text = re.sub(r'[^\d]', '', data.get('price') or '')
+            malls = data.get('malls') or []
+            iherb_malls = [m for m in malls if is_iherb_mall(m)]
+            
+            result = {
+                'price': int(price_text) if price_text else None,
+                'shipping': data.get('shipping') or "확인필요",
+                'mall': data.get('mall') or "확인필요",
+                'has_iherb': bool(iherb_malls),
+                'malls': malls
             }
             
+            print(f"  최저가: {result['price']}원")
+            print(f"  배송비: {result['shipping']}")
+            print(f"  판매처: {result['mall']}")
+            if iherb_malls:
+                print(f"  ✓ 아이허브 판매처 발견: {iherb_malls[0]} ({data.get('source')})")
+            else:
+                print(f"  ✗ 아이허브 판매처 없음 ({data.get('source')})")
+            
+            return result
+            
         except Exception as e:
-            print(f"✗ 가격 조회 실패: {e}")
-            return {
-                'price': None,
-                'shipping': "오류",
-                'mall': "오류"
-            }
+            print(f"✗ 상품 조회 실패: {e}")
+            return self._failed_result()
     
-    def check_iherb_available(self, url):
+    @staticmethod
+    def _failed_result():
+        return {
+            'price': None,
+            'shipping': "오류",
+            'mall': "오류",
+            'has_iherb': False,
+            'malls': []
+        }
+    
+    def scrape_urls(self, items, tabs=1, timeout=10):
         """
-        아이허브 판매 여부 확인
+        URL 목록 조회 (완료 순서대로 반환)
+        
+        tabs > 1이면 같은 브라우저(로그인 쿠키 공유)에 탭 여러 개를 열어
+        로드 중인 탭들을 돌아가며 확인하고 먼저 로드가 끝난 탭부터 결과를 읽음.
+        - 느린/시간 초과 탭이 이미 로드된 다른 탭을 붙잡지 않음
+        - 같은 도메인 요청 시작 간격은 domain_interval초 이상 유지
+        - 캡차는 결과를 읽을 때 확인하며, 해결될 때까지 전체 진행이 멈춤
         
         Args:
-            url: 네이버 쇼핑 상품 URL
+            items: [(key, url), ...]
+            tabs: 동시 탭 수
+            timeout: 요소 대기 시간 (초, 페이지 로드는 3배까지 대기)
             
-        Returns:
-            bool: 아이허브 판매 여부
+        Yields:
+            (key, result)
         """
+        if tabs <= 1:
+            for key, url in items:
+                yield key, self.scrape_product(url, timeout)
+                time.sleep(self.request_delay)
+            return
+        
+        pending = list(items)
+        pending.reverse()
+        
+        main_handle = self.driver.current_window_handle
+        handles = [main_handle]
+        for _ in range(min(tabs, len(pending)) - 1):
+            self.driver.switch_to.new_window('tab')
+            handles.append(self.driver.current_window_handle)
+        print(f"✓ 탭 {len(handles)}개로 동시 조회")
+        
+        # 탭별 진행 중 항목 (key, url, 로드 마감 시각) - 시작 순서 유지
+        in_flight = {}
+        
+        def assign(handle):
+            if pending:
+                key, url = pending.pop()
+                self._start_navigation(handle, url)
+                in_flight[handle] = (key, url, time.monotonic() + timeout * 3)
+        
         try:
-            print("아이허브 판매처 확인 중...")
-            
-            # 이미 해당 페이지에 있다고 가정
-            if self.driver.current_url != url:
-                self.driver.get(url)
-                time.sleep(2)
-                
-                # 봇 캡차 확인
-                self._wait_for_captcha()
-            
-            # 페이지 하단으로 스크롤 (헤더 피하기)
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(1)
-            
-            # 판매처 선택보기 버튼 찾기 및 클릭
-            try:
-                # 올바른 선택자 사용
-                select_mall_btn = self.wait.until(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, '.filter_check_mall__IK03K')
-                    )
-                )
-                
-                # 요소가 보이도록 추가 스크롤
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", 
-                    select_mall_btn
-                )
-                time.sleep(1)
-                
-                # JavaScript로 클릭 (헤더 간섭 방지)
-                self.driver.execute_script("arguments[0].click();", select_mall_btn)
-                print("  판매처 선택 레이어 열림")
-                time.sleep(2)
-                
-                # 레이어 오픈 후 캡차 확인
-                self._wait_for_captcha()
-                
-                # 판매처 목록에서 아이허브 검색
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            for handle in handles:
+                assign(handle)
+            
+            while in_flight:
+                # 먼저 로드가 끝난(또는 마감이 지난) 탭 찾기
+                ready = None
+                for handle, (_, _, deadline) in in_flight.items():
+                    if self._navigation_done(handle):
+                        ready, loaded = handle, True
+                        break
+                    if time.monotonic() >= deadline:
+                        ready, loaded = handle, False
+                        break
                 
-                # 아이허브 키워드
-                iherb_keywords = ['아이허브', 'iherb', 'iHerb', '아이허브 공식']
+                if ready is None:
+                    time.sleep(0.2)
+                    continue
                 
-                # 판매처 목록 검색
-                mall_labels = soup.select('.filter_text__yBa_v')
+                key, url, _ = in_flight.pop(ready)
+                self.driver.switch_to.window(ready)
+                print(f"\n상품 URL 확인: {url}")
                 
-                for mall in mall_labels:
-                    mall_text = mall.get_text(strip=True)
-                    for keyword in iherb_keywords:
-                        if keyword.lower() in mall_text.lower():
-                            print(f"  ✓ 아이허브 판매처 발견: {mall_text}")
-                            
-                            # 레이어 닫기 (취소 버튼 클릭)
-                            try:
-                                cancel_btn = self.driver.find_element(
-                                    By.CSS_SELECTOR, 
-                                    '.filter_btn_cancel__wIx02'
-                                )
-                                self.driver.execute_script("arguments[0].click();", cancel_btn)
-                                time.sleep(0.5)
-                            except:
-                                # ESC 키로 닫기 시도
-                                from selenium.webdriver.common.action_chains import ActionChains
-                                ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
-                                time.sleep(0.5)
-                            
-                            return True
+                if loaded:
+                    result = self._extract_product(timeout)
+                else:
+                    print("✗ 페이지 로드 시간 초과")
+                    result = self._failed_result()
                 
-                print("  ✗ 아이허브 판매처 없음")
+                # 결과를 읽은 탭에 바로 다음 URL 할당
+                assign(ready)
                 
-                # 레이어 닫기
+                yield key, result
+        finally:
+            for handle in handles[1:]:
                 try:
-                    cancel_btn = self.driver.find_element(
-                        By.CSS_SELECTOR, 
-                        '.filter_btn_cancel__wIx02'
-                    )
-                    self.driver.execute_script("arguments[0].click();", cancel_btn)
-                    time.sleep(0.5)
-                except:
-                    from selenium.webdriver.common.action_chains import ActionChains
-                    ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
-                    time.sleep(0.5)
-                
-                return False
-                
-            except TimeoutException:
-                print("  ! 판매처 선택보기 버튼을 찾을 수 없음")
-                
-                # 페이지 전체에서 아이허브 키워드 검색 (대안)
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                page_text = soup.get_text().lower()
-                
-                if '아이허브' in page_text or 'iherb' in page_text:
-                    print("  ✓ 페이지 내 아이허브 키워드 발견")
-                    return True
-                
-                return False
-                
-        except Exception as e:
-            print(f"✗ 아이허브 확인 실패: {e}")
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except Exception:
+                    pass
+            self.driver.switch_to.window(main_handle)
+    
+    def _start_navigation(self, handle, url):
+        """탭에서 페이지 로드 시작 (완료를 기다리지 않음)"""
+        domain = urlparse(url).netloc
+        wait = self._last_request.get(domain, 0) + self.domain_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_request[domain] = time.monotonic()
+        
+        self.driver.switch_to.window(handle)
+        # 이전 문서에 표시 → 새 문서 로드 여부 판별용
+        self.driver.execute_script(
+            "window.__naverPriceNav = true; window.location.href = arguments[0];", url
+        )
+    
+    def _navigation_done(self, handle):
+        """_start_navigation 이후 탭의 새 문서 로드 완료 여부"""
+        try:
+            self.driver.switch_to.window(handle)
+            return bool(self.driver.execute_script(
+                "return !window.__naverPriceNav && document.readyState === 'complete';"
+            ))
+        except Exception:
+            # 문서 교체 중
             return False
     
     def close(self):
@@ -372,9 +514,12 @@ class NaverPriceCrawler:
             self.driver.quit()
             print("\n브라우저 종료")
         
-    def process_urls(self):
+    def process_urls(self, tabs=1):
         """
         URL 일괄 처리 (날짜별 누적 + 날짜 행 병합)
+        
+        Args:
+            tabs: 동시 조회 탭 수 (1이면 순차 처리)
         """
         try:
             # 모든 데이터 가져오기
@@ -402,7 +547,7 @@ class NaverPriceCrawler:
                 print("URL 컬럼을 찾을 수 없습니다.")
                 return
             
-            print(f"URL 컬럼 위치: {chr(65+url_col_idx)} (인덱스 {url_col_idx})")
+            print(f"URL 컬럼 위치: {col_letter(url_col_idx)} (인덱스 {url_col_idx})")
             
             # 오늘 날짜
             today = datetime.now().strftime('%Y-%m-%d')
@@ -436,27 +581,27 @@ class NaverPriceCrawler:
                 new_headers.append('최저가')
                 
                 # 1행과 2행 업데이트
-                update_range = f'A1:{chr(65+len(new_date_row)-1)}2'
+                update_range = f'A1:{col_letter(len(new_date_row)-1)}2'
                 self.sheet.update([new_date_row, new_headers], update_range)
                 
                 # 셀 병합 (E1:F1 병합)
-                merge_range = f'{chr(65+today_start_col)}1:{chr(65+today_start_col+1)}1'
+                merge_range = f'{col_letter(today_start_col)}1:{col_letter(today_start_col+1)}1'
                 self.sheet.merge_cells(merge_range, merge_type='MERGE_ALL')
                 
-                print(f"✓ 새로운 날짜 컬럼 추가: {chr(65+today_start_col)}~{chr(65+today_start_col+1)}열")
+                print(f"✓ 새로운 날짜 컬럼 추가: {col_letter(today_start_col)}~{col_letter(today_start_col+1)}열")
                 print(f"✓ 날짜 병합: {merge_range}")
                 
                 date_row = new_date_row
                 headers = new_headers
             else:
-                print(f"✓ 기존 컬럼 사용: {chr(65+today_start_col)}열부터")
+                print(f"✓ 기존 컬럼 사용: {col_letter(today_start_col)}열부터")
             
             # 컬럼 위치
             iherb_col = today_start_col
             price_col = today_start_col + 1
             
-            print(f"  📍 아이허브: {chr(65+iherb_col)}열")
-            print(f"  📍 최저가: {chr(65+price_col)}열")
+            print(f"  📍 아이허브: {col_letter(iherb_col)}열")
+            print(f"  📍 최저가: {col_letter(price_col)}열")
             
             # 실제 URL이 있는 행 찾기 (3행부터 - 1행 날짜, 2행 헤더)
             url_rows = []
@@ -476,44 +621,71 @@ class NaverPriceCrawler:
             print(f"   시작 행: {url_rows[0] + 1}")
             print(f"   종료 행: {url_rows[-1] + 1}")
             
-            # URL 처리
-            for idx, row_idx in enumerate(url_rows):
-                row_data = all_data[row_idx]
-                url = row_data[url_col_idx]
-                
-                print(f"\n{'='*60}")
-                print(f"[{idx + 1}/{len(url_rows)}] 행 {row_idx + 1} 처리 시작")
-                print(f"{'='*60}")
-                
-                # 최저가 조회
-                price_info = self.get_lowest_price(url)
-                
-                # 아이허브 판매 확인
-                has_iherb = self.check_iherb_available(url)
-                
-                # 스프레드시트 업데이트
-                result_row = row_idx + 1
-                
-                # 배치 업데이트 (2개 셀만)
-                update_range = f'{chr(65+iherb_col)}{result_row}:{chr(65+price_col)}{result_row}'
-                update_values = [[
-                    'O' if has_iherb else 'X',
-                    price_info['price']
-                ]]
-                
-                self.sheet.update(update_values, update_range)
-                
-                print(f"\n✅ 행 {result_row} 업데이트 완료")
-                print(f"   아이허브: {'O' if has_iherb else 'X'}")
-                print(f"   최저가: {price_info['price']}원")
-                
-                # 요청 간 딜레이
-                time.sleep(2)
+            # URL 처리 (결과는 버퍼에 모아 batch_update, 중단 시에도 남은 결과 반영)
+            writer = BufferedSheetWriter(
+                self.sheet,
+                chunk_size=self.write_chunk_size,
+                flush_interval=self.write_flush_interval
+            )
+            # 같은 URL이 여러 행에 있으면 1회만 조회
+            rows_by_url = {}
+            for row_idx in url_rows:
+                rows_by_url.setdefault(all_data[row_idx][url_col_idx].strip(), []).append(row_idx)
+            
+            # 신선도 기간 안에 조회한 URL은 캐시 결과 사용
+            cached_results = []
+            to_crawl = []
+            for url in rows_by_url:
+                cached = self.price_cache.get_fresh(url) if self.price_cache else None
+                if cached:
+                    cached_results.append((url, cached))
+                else:
+                    to_crawl.append((url, url))
+            
+            if self.price_cache:
+                print(f"   ♻️  캐시 재사용: {len(cached_results)}개 / 조회 필요: {len(to_crawl)}개")
+            
+            done_rows = 0
+            unchanged = 0
+            with writer:
+                # 최저가 + 아이허브 판매 확인 (URL당 페이지 1회 로드, 완료 순서대로)
+                results = itertools.chain(cached_results, self.scrape_urls(to_crawl, tabs))
+                for url, price_info in results:
+                    if self.price_cache and not price_info.get('cached'):
+                        self.price_cache.put(url, price_info)
+                    
+                    has_iherb = price_info['has_iherb']
+                    values = ['O' if has_iherb else 'X', price_info['price']]
+                    
+                    for row_idx in rows_by_url[url]:
+                        done_rows += 1
+                        result_row = row_idx + 1
+                        
+                        # 변경분만 쓰기 (오늘 컬럼에 이미 같은 값이 있으면 생략)
+                        current = all_data[row_idx][iherb_col:price_col + 1] if self.changed_only else []
+                        current = current + [''] * (2 - len(current))
+                        if self.changed_only and all(map(same_cell_value, current, values)):
+                            unchanged += 1
+                            continue
+                        
+                        # 스프레드시트 업데이트 예약 (2개 셀)
+                        update_range = f'{col_letter(iherb_col)}{result_row}:{col_letter(price_col)}{result_row}'
+                        writer.write(update_range, [values])
+                        
+                        print(f"\n✅ [{done_rows}/{len(url_rows)}] 행 {result_row} 결과 수집"
+                              f"{' (캐시)' if price_info.get('cached') else ''}")
+                        print(f"   아이허브: {values[0]}")
+                        print(f"   최저가: {values[1]}원")
+            
+            if unchanged:
+                print(f"\n   변경 없음 (쓰기 생략): {unchanged}행")
+            if self.price_cache:
+                print(f"   캐시: {self.price_cache.stats()}")
             
             print(f"\n{'='*60}")
             print(f"✅ 전체 처리 완료!")
             print(f"   처리된 URL: {len(url_rows)}개")
-            print(f"   저장 위치: {chr(65+iherb_col)}~{chr(65+price_col)}열")
+            print(f"   저장 위치: {col_letter(iherb_col)}~{col_letter(price_col)}열")
             print(f"{'='*60}")
             
         except Exception as e:
@@ -0,0 +1,85 @@
+"""
+네이버 최저가 조회 결과 캐시 (SQLite)
+- URL별 마지막 조회 시각/최저가/배송비/판매처/아이허브 여부 보관
+- 신선도 기간 안에 조회한 URL은 재방문 없이 캐시 결과 사용
+  → 중단 후 재실행 시 이미 조회한 URL은 즉시 통과
+"""
+
+import json
+import sqlite3
+import time
+
+
+class PriceCache:
+    """URL → 최근 조회 결과"""
+
+    def __init__(self, db_path, freshness_hours=6):
+        """
+        Args:
+            db_path: 캐시 DB 경로
+            freshness_hours: 이 시간 안에 조회한 결과는 재사용
+        """
+        self.freshness = freshness_hours * 3600
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS prices (
+                url         TEXT PRIMARY KEY,
+                crawled_at  REAL NOT NULL,
+                price       INTEGER,
+                shipping    TEXT,
+                mall        TEXT,
+                has_iherb   INTEGER NOT NULL,
+                malls       TEXT
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_fresh(self, url):
+        """
+        신선도 기간 안의 결과
+
+        Returns:
+            scrape_product 결과 형태 dict 또는 None
+        """
+        row = self.conn.execute(
+            "SELECT price, shipping, mall, has_iherb, malls FROM prices WHERE url = ? AND crawled_at >= ?",
+            (url, time.time() - self.freshness)
+        ).fetchone()
+        if not row:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return {
+            'price': row[0],
+            'shipping': row[1],
+            'mall': row[2],
+            'has_iherb': bool(row[3]),
+            'malls': json.loads(row[4] or '[]'),
+            'cached': True
+        }
+
+    def put(self, url, result):
+        """조회 결과 저장 (가격을 못 읽은 결과는 저장하지 않음 → 다음 실행에서 재시도)
+
+        오류뿐 아니라 "확인필요"(페이지는 열렸지만 가격 미확인)도 제외한다.
+        느린 로딩/일시 차단 한 번으로 신선도 기간 내내 빈 가격이 재사용되지 않도록.
+        """
+        if result.get('price') is None:
+            return
+        self.conn.execute(
+            "INSERT OR REPLACE INTO prices VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (url, time.time(), result.get('price'), result.get('shipping'), result.get('mall'),
+             int(bool(result.get('has_iherb'))), json.dumps(result.get('malls') or [], ensure_ascii=False))
+        )
+        self.conn.commit()
+
+    def stats(self):
+        return f"재사용 {self.hits} / 조회 {self.misses}"
+
+    def close(self):
+        self.conn.close()
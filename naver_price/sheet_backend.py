@@ -0,0 +1,188 @@
+"""
+스프레드시트 백엔드
+- GoogleSheetBackend: gspread 워크시트 (실제 운영)
+- CsvSheetBackend: 로컬 CSV 파일 (오프라인 테스트/벤치마크)
+- BufferedSheetWriter: 결과를 모아서 batch_update로 묶어 쓰기 (Sheets API 쿼터 절약)
+"""
+
+import csv
+import os
+import re
+import time
+from abc import ABC, abstractmethod
+
+
+def col_letter(col_idx):
+    """0-based 컬럼 인덱스 → A1 컬럼 문자 (0 → A, 26 → AA)"""
+    letters = ''
+    col_idx += 1
+    while col_idx:
+        col_idx, rem = divmod(col_idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def parse_a1(cell):
+    """'B3' → (row_idx, col_idx) 0-based"""
+    match = re.fullmatch(r'([A-Za-z]+)(\d+)', cell.strip())
+    if not match:
+        raise ValueError(f"잘못된 셀 주소: {cell}")
+    col = 0
+    for ch in match.group(1).upper():
+        col = col * 26 + (ord(ch) - 64)
+    return int(match.group(2)) - 1, col - 1
+
+
+class SheetBackend(ABC):
+    """크롤러가 사용하는 시트 연산"""
+
+    title = ''
+
+    @abstractmethod
+    def get_all_values(self):
+        """전체 셀 값 (행 리스트)"""
+
+    @abstractmethod
+    def update(self, values, range_name):
+        """범위 1개 쓰기"""
+
+    @abstractmethod
+    def batch_update(self, data):
+        """
+        여러 범위 한 번에 쓰기
+
+        Args:
+            data: [{'range': 'E3:F3', 'values': [[...]]}, ...]
+        """
+
+    def merge_cells(self, range_name, merge_type='MERGE_ALL'):
+        """셀 병합 (지원하지 않는 백엔드는 무시)"""
+        pass
+
+
+class GoogleSheetBackend(SheetBackend):
+    """gspread 워크시트 래퍼"""
+
+    def __init__(self, worksheet, title=''):
+        self.worksheet = worksheet
+        self.title = title
+
+    def get_all_values(self):
+        return self.worksheet.get_all_values()
+
+    def update(self, values, range_name):
+        return self.worksheet.update(values, range_name)
+
+    def batch_update(self, data):
+        return self.worksheet.batch_update(data)
+
+    def merge_cells(self, range_name, merge_type='MERGE_ALL'):
+        return self.worksheet.merge_cells(range_name, merge_type=merge_type)
+
+
+class CsvSheetBackend(SheetBackend):
+    """로컬 CSV 파일을 시트처럼 사용"""
+
+    def __init__(self, path):
+        self.path = path
+        self.title = os.path.basename(path)
+        self.rows = []
+        if os.path.exists(path):
+            with open(path, newline='', encoding='utf-8-sig') as f:
+                self.rows = [list(row) for row in csv.reader(f)]
+        self.api_calls = 0
+
+    def get_all_values(self):
+        return [list(row) for row in self.rows]
+
+    def update(self, values, range_name):
+        self._write_range(values, range_name)
+        self._save()
+
+    def batch_update(self, data):
+        for item in data:
+            self._write_range(item['values'], item['range'])
+        self._save()
+
+    def _write_range(self, values, range_name):
+        start_row, start_col = parse_a1(range_name.split(':')[0])
+        for r, row_values in enumerate(values):
+            row_idx = start_row + r
+            while len(self.rows) <= row_idx:
+                self.rows.append([])
+            row = self.rows[row_idx]
+            for c, value in enumerate(row_values):
+                col_idx = start_col + c
+                while len(row) <= col_idx:
+                    row.append('')
+                row[col_idx] = '' if value is None else str(value)
+
+    def _save(self):
+        self.api_calls += 1
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', newline='', encoding='utf-8-sig') as f:
+            csv.writer(f).writerows(self.rows)
+        os.replace(tmp_path, self.path)
+
+
+class BufferedSheetWriter:
+    """
+    쓰기 버퍼 (write-behind)
+    - chunk_size개 모이거나 flush_interval초가 지나면 batch_update 1회
+    - with 블록 종료(예외 포함) 시 남은 항목 flush
+    """
+
+    def __init__(self, backend, chunk_size=50, flush_interval=60):
+        """
+        Args:
+            backend: SheetBackend
+            chunk_size: 한 번에 쓸 범위 개수
+            flush_interval: 최대 보류 시간 (초)
+        """
+        self.backend = backend
+        self.chunk_size = chunk_size
+        self.flush_interval = flush_interval
+        self.pending = []
+        self.last_flush = time.monotonic()
+        self.flushed = 0
+        self.calls = 0
+
+    def write(self, range_name, values):
+        """범위 쓰기 예약 (조건 충족 시 즉시 flush)"""
+        self.pending.append({'range': range_name, 'values': values})
+        if (len(self.pending) >= self.chunk_size
+                or time.monotonic() - self.last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """보류 중인 쓰기 전송"""
+        self.last_flush = time.monotonic()
+        if not self.pending:
+            return
+
+        batch, self.pending = self.pending, []
+        try:
+            self.backend.batch_update(batch)
+        except Exception:
+            # 실패한 배치는 다음 flush에서 재시도
+            self.pending = batch + self.pending
+            raise
+
+        self.flushed += len(batch)
+        self.calls += 1
+        print(f"  💾 시트 반영: {len(batch)}건 (누적 {self.flushed}건 / 호출 {self.calls}회)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+            return False
+
+        # 중단/오류 시에도 이미 수집한 결과는 저장 (원래 예외 유지)
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"✗ 남은 {len(self.pending)}건 시트 반영 실패: {e}")
+        return False